@@ -1,29 +1,38 @@
 """
 Food Ordering System - Main Application
 Modular Flask application with MySQL database
+
+Importing this module has no side effects: call create_app(), or run it
+directly (python app.py) for the development server. Production entry
+points are wsgi.py (gunicorn) and asgi.py.
 """
 
-# Ensure UTF-8 encoding for console output (fixes charmap codec errors on Windows)
+import os
 import sys
-import io
-if sys.stdout.encoding != 'utf-8':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-if sys.stderr.encoding != 'utf-8':
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-
-from flask import Flask, jsonify, request, session
-from flask_cors import CORS
 from datetime import timedelta
-import os
+from flask import Flask, jsonify, session
+from flask_cors import CORS
 
 # Import common utilities
 from common import Database, Config, config
+from common.metrics import init_metrics
+from common.query_trace import init_query_trace
+from common.query_guard import init_query_guard
+from common.activity_log import init_activity_log
+from common.sessions import init_sessions
+from common.rate_limit import init_rate_limit
+from common.warmup import init_warmup
+from common.health import init_health
+from common.compression import init_compression
+from common.batch import init_batch
 
 # Import all modules
 from modules.user import user_bp
+from modules.user.dashboard import init_dashboard_cache
 from modules.admin import admin_bp
 from modules.admin.menu_routes import menu_admin_bp
 from modules.order import order_bp
+from modules.order.menu_cache import init_menu_cache
 from modules.invoice import invoice_bp
 from modules.feedback import feedback_bp
 
@@ -56,8 +65,29 @@ def create_app(config_name='development'):
     app.config['SESSION_COOKIE_SECURE'] = False  # False for development (no HTTPS)
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=7)
 
-    # Initialize database connection pool
-    Database.initialize_pool(app.config)
+    # Sessions live in user_sessions; the cookie holds only a random token
+    init_sessions(app)
+
+    # Database connection pool - created on first use or by the warm-up thread
+    Database.initialize_pool(app.config, lazy=app.config['DB_LAZY_INIT'])
+
+    # Request, latency and database metrics (GET /metrics)
+    init_metrics(app)
+
+    # Opt-in SQL tracing and slow-query log (GET /api/admin/queries)
+    init_query_trace(app)
+
+    # N+1 detector (debug and testing configs)
+    init_query_guard(app)
+
+    # Buffered activity_logs writer (background flusher thread)
+    init_activity_log(app)
+
+    # gzip/brotli for large responses (after metrics, so sizes are on-the-wire bytes)
+    init_compression(app)
+
+    # Login throttling (token buckets, checked before any query or hash)
+    init_rate_limit(app)
 
     # Register blueprints
     app.register_blueprint(user_bp)
@@ -67,22 +97,18 @@ def create_app(config_name='development'):
     app.register_blueprint(invoice_bp)
     app.register_blueprint(feedback_bp)
 
-    # Health check endpoint
-    @app.route('/api/health', methods=['GET'])
-    def health_check():
-        """Health check endpoint"""
-        try:
-            db_status = Database.test_connection()
-            return jsonify({
-                'status': 'healthy' if db_status else 'unhealthy',
-                'database': 'connected' if db_status else 'disconnected',
-                'message': 'Food Ordering System API is running'
-            }), 200 if db_status else 503
-        except Exception as e:
-            return jsonify({
-                'status': 'unhealthy',
-                'error': str(e)
-            }), 503
+    # Menu/category snapshot cache, then connect and prime it in the background
+    init_menu_cache(app)
+    init_warmup(app)
+
+    # Per-user dashboard summaries, dropped on that user's order/feedback writes
+    init_dashboard_cache(app)
+
+    # Liveness/readiness endpoints (cached database probe)
+    init_health(app)
+
+    # POST /api/batch - several GETs in one round trip
+    init_batch(app)
 
     # Session check endpoint
     @app.route('/api/session', methods=['GET'])
@@ -110,12 +136,16 @@ def create_app(config_name='development'):
     return app
 
 
-# Create application instance
-app = create_app(os.getenv('FLASK_ENV', 'development'))
-
+if __name__ == '__main__':
+    # Ensure UTF-8 encoding for console output (fixes charmap codec errors on Windows)
+    import io
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
 
-if __name__ == '__main__':
     print("\n" + "="*60)
     print("Food Ordering System - Starting Server")
     print("="*60)
@@ -128,5 +158,6 @@ if __name__ == '__main__':
     print("   3. Frontend is configured to use this API")
     print("\n" + "="*60 + "\n")
 
-    app.run(host='127.0.0.1', port=5000, debug=True)
+    # The reloader starts the whole app twice; the Electron shell passes --no-reload
+    app.run(host='127.0.0.1', port=5000, debug=True, use_reloader='--no-reload' not in sys.argv)
 
@@ -0,0 +1,91 @@
+"""
+Food Ordering System - Async (ASGI) read path
+Serves the hot, read-only endpoints on asyncio with an aiomysql pool so one
+process can hold thousands of concurrent slow clients. Everything else stays
+on the sync Flask app (wsgi.py); route the paths below here at the proxy.
+
+    GET /api/order/menu
+    GET /api/order/categories
+    GET /api/order/my-orders
+    GET /api/feedback/menu-item/<id>
+    GET /api/health
+
+Usage (from the backend directory):
+    hypercorn asgi:app --bind 127.0.0.1:5001 --workers 2
+"""
+
+import os
+import re
+from quart import Quart, jsonify
+from quart_cors import cors
+
+from common import config
+from common.async_database import AsyncDatabase
+from modules.order.async_routes import order_async_bp
+from modules.feedback.async_routes import feedback_async_bp
+
+
+def create_async_app(config_name='development'):
+    """Async application factory"""
+    app = Quart(__name__)
+
+    # Same configuration (secret key, session cookie) as the Flask app, so
+    # JWT tokens and session cookies issued there are accepted here
+    app.config.from_object(config[config_name])
+    app.secret_key = app.config['SECRET_KEY']
+
+    # Enable CORS - Support for Electron (file://) and web servers
+    app = cors(app,
+               allow_credentials=True,
+               allow_origin=[
+                   re.compile(r"file://.*"),
+                   re.compile(r"http://localhost:.*"),
+                   re.compile(r"http://127\.0\.0\.1:.*"),
+               ],
+               allow_headers=['Content-Type', 'Authorization'],
+               allow_methods=['GET', 'OPTIONS'])
+
+    # One async pool per worker process, opened on the worker's event loop
+    @app.before_serving
+    async def open_pool():
+        await AsyncDatabase.initialize_pool(app.config)
+
+    @app.after_serving
+    async def close_pool():
+        await AsyncDatabase.close_pool()
+
+    # Register blueprints
+    app.register_blueprint(order_async_bp)
+    app.register_blueprint(feedback_async_bp)
+
+    # Health check endpoint
+    @app.route('/api/health', methods=['GET'])
+    async def health_check():
+        """Health check endpoint"""
+        try:
+            db_status = await AsyncDatabase.test_connection()
+            return jsonify({
+                'status': 'healthy' if db_status else 'unhealthy',
+                'database': 'connected' if db_status else 'disconnected',
+                'message': 'Food Ordering System API is running'
+            }), 200 if db_status else 503
+        except Exception as e:
+            return jsonify({
+                'status': 'unhealthy',
+                'error': str(e)
+            }), 503
+
+    # Error handlers
+    @app.errorhandler(404)
+    async def not_found(error):
+        return jsonify({'error': 'Endpoint not found'}), 404
+
+    @app.errorhandler(500)
+    async def internal_error(error):
+        return jsonify({'error': 'Internal server error'}), 500
+
+    return app
+
+
+# Create application instance
+app = create_async_app(os.getenv('FLASK_ENV', 'development'))
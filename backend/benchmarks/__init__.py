@@ -0,0 +1,3 @@
+"""
+Benchmarks for the Food Ordering System API
+"""
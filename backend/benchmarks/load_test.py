@@ -0,0 +1,507 @@
+"""
+End-to-end HTTP load test for the Food Ordering System API
+
+Drives realistic journeys with concurrent virtual users over keep-alive
+HTTP connections:
+  - customers: browse categories and menu, view items and their reviews,
+    place an order, poll my-orders, review delivered orders
+  - admins: poll the order board per status and move orders forward
+    (which is what makes orders reviewable)
+
+By default the app is built with create_app() and served in-process on
+an ephemeral localhost port; --url targets an already running server
+instead. The report shows throughput, p50/p95/p99 latency and database
+statements per request for each endpoint. Statement counts come from the
+X-DB-Queries header, which the in-process server adds. --output writes
+the results as JSON, and --compare diffs them against an earlier run.
+
+Usage (from backend/):
+    python -m benchmarks.load_test --users 20 --duration 60
+    python -m benchmarks.load_test --output results/after.json --compare results/before.json
+    python -m benchmarks.load_test --url http://127.0.0.1:5000 --users 50
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from urllib.parse import urlsplit
+
+# Production config needs a secret; it must be set before config is imported
+os.environ.setdefault('SECRET_KEY', 'load-test-secret')
+# Every virtual user logs in from 127.0.0.1; keep the in-process server from throttling them
+os.environ.setdefault('LOGIN_RATE_LIMIT_ENABLED', 'false')
+
+ACTIVE_STATUSES = ['pending', 'confirmed', 'preparing', 'ready']
+NEXT_STATUS = {'pending': 'confirmed', 'confirmed': 'preparing',
+               'preparing': 'ready', 'ready': 'delivered'}
+
+USER_PASSWORD = 'loadtest123'
+
+
+# ============================================
+# RECORDING
+# ============================================
+
+class Recorder:
+    """Thread-safe per-endpoint sample store"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.recording = False
+
+    def record(self, name, elapsed, status, queries):
+        if not self.recording:
+            return
+        with self._lock:
+            self.samples.setdefault(name, []).append((elapsed, status, queries))
+
+
+class Client:
+    """One virtual user: a keep-alive connection plus an optional bearer token"""
+
+    def __init__(self, base_url, recorder, timeout=30):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self.recorder = recorder
+        self.token = None
+        self.connection = None
+
+    def request(self, method, path, name, body=None):
+        """Send one request, record it under name and return (status, parsed JSON)"""
+        headers = {'Accept': 'application/json'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        started = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            raw = response.read()
+            status = response.status
+            queries = response.getheader('X-DB-Queries')
+        except (OSError, http.client.HTTPException):
+            # Dropped keep-alive connection or timeout: count as an error, reconnect next time
+            self.close()
+            self.recorder.record(name, time.perf_counter() - started, 0, None)
+            return 0, None
+
+        self.recorder.record(name, time.perf_counter() - started, status,
+                             int(queries) if queries is not None else None)
+        try:
+            return status, json.loads(raw) if raw else None
+        except ValueError:
+            return status, None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+# ============================================
+# JOURNEYS
+# ============================================
+
+class Journeys:
+    """Shared run state and the customer/admin journeys"""
+
+    def __init__(self, args, menu_items, categories):
+        self.args = args
+        self.menu_items = menu_items
+        self.categories = categories
+        # Zipf-like popularity over the menu, same ranking for every run with the same seed
+        ranks = list(range(len(menu_items)))
+        random.Random(args.seed).shuffle(ranks)
+        self.item_weights = [1.0 / (rank + 1) for rank in ranks]
+
+    def think(self, rng):
+        if self.args.think:
+            time.sleep(rng.uniform(0, self.args.think))
+
+    def pick_items(self, rng, count):
+        return rng.choices(self.menu_items, weights=self.item_weights, k=count)
+
+    def customer(self, client, rng, placed):
+        """Browse, order, poll and review (placed maps this user's unreviewed order ids to an item)"""
+        client.request('GET', '/api/order/categories', 'GET /api/order/categories')
+        self.think(rng)
+
+        if self.categories and rng.random() < 0.5:
+            category_id = rng.choice(self.categories)
+            client.request('GET', f'/api/order/menu?category_id={category_id}',
+                           'GET /api/order/menu?category_id')
+        else:
+            client.request('GET', '/api/order/menu', 'GET /api/order/menu')
+        self.think(rng)
+
+        for item in self.pick_items(rng, rng.randint(1, 2)):
+            client.request('GET', f"/api/order/menu/{item['id']}", 'GET /api/order/menu/<id>')
+            client.request('GET', f"/api/feedback/menu-item/{item['id']}",
+                           'GET /api/feedback/menu-item/<id>')
+            self.think(rng)
+
+        basket = {}
+        for item in self.pick_items(rng, rng.randint(1, 3)):
+            basket[item['id']] = basket.get(item['id'], 0) + 1
+        status, body = client.request('POST', '/api/order/place', 'POST /api/order/place', {
+            'items': [{'menu_item_id': item_id, 'quantity': quantity}
+                      for item_id, quantity in basket.items()],
+            'payment_method': rng.choice(['cash', 'card', 'online']),
+            'delivery_address': 'Load Test Lane 1'
+        })
+        if status == 201:
+            placed[body['order_id']] = next(iter(basket))
+        self.think(rng)
+
+        status, body = 0, None
+        for _ in range(self.args.polls):
+            status, body = client.request('GET', '/api/order/my-orders', 'GET /api/order/my-orders')
+            self.think(rng)
+
+        # Review one delivered order that has not been reviewed yet
+        for order in (body or {}).get('orders', []) if status == 200 else []:
+            if order['status'] == 'delivered' and order['id'] in placed:
+                client.request('POST', '/api/feedback/submit', 'POST /api/feedback/submit', {
+                    'order_id': order['id'],
+                    'menu_item_id': placed.pop(order['id']),
+                    'rating': rng.choices([1, 2, 3, 4, 5], weights=[4, 6, 13, 32, 45])[0],
+                    'comment': 'Load test review'
+                })
+                break
+
+    def admin(self, client, rng):
+        """Poll the order board and advance a few orders per status"""
+        for status in ACTIVE_STATUSES:
+            code, body = client.request('GET', f'/api/order/all?status={status}',
+                                        'GET /api/order/all?status')
+            if code != 200 or not body:
+                continue
+            # Oldest first, like a kitchen working the queue
+            for order in list(reversed(body.get('orders', [])))[:self.args.advance]:
+                client.request('PUT', f"/api/order/update-status/{order['id']}",
+                               'PUT /api/order/update-status/<id>',
+                               {'status': NEXT_STATUS[status]})
+        self.think(rng)
+
+
+# ============================================
+# SETUP
+# ============================================
+
+def start_local_server(config_name):
+    """Build the app with create_app() and serve it on an ephemeral port"""
+    from flask import g
+    from werkzeug.serving import make_server, WSGIRequestHandler
+    from app import create_app
+
+    app = create_app(config_name)
+
+    @app.after_request
+    def add_query_count(response):
+        response.headers['X-DB-Queries'] = str(g.get('db_query_count', 0))
+        return response
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+def create_customers(base_url, recorder, count, run_id):
+    """Register and log in fresh customers for this run"""
+    clients = []
+    for index in range(count):
+        client = Client(base_url, recorder)
+        username = f'lt_{run_id}_{index}'
+        client.request('POST', '/api/user/register', 'setup', {
+            'username': username,
+            'email': f'{username}@loadtest.example',
+            'password': USER_PASSWORD
+        })
+        status, body = client.request('POST', '/api/user/login', 'setup', {
+            'username': username, 'password': USER_PASSWORD
+        })
+        if status != 200:
+            raise RuntimeError(f'Customer login failed ({status}): {body}')
+        client.token = body['token']
+        clients.append(client)
+    return clients
+
+
+def create_admins(base_url, recorder, count, username, password):
+    clients = []
+    for _ in range(count):
+        client = Client(base_url, recorder)
+        status, body = client.request('POST', '/api/admin/login', 'setup', {
+            'username': username, 'password': password
+        })
+        if status != 200:
+            raise RuntimeError(f'Admin login failed ({status}): {body}')
+        client.token = body['token']
+        clients.append(client)
+    return clients
+
+
+def load_menu(base_url, recorder):
+    client = Client(base_url, recorder)
+    status, body = client.request('GET', '/api/order/menu', 'setup')
+    client.close()
+    if status != 200 or not body or not body.get('menu_items'):
+        raise RuntimeError(f'Could not load the menu ({status}) - is the database seeded?')
+    items = [item for item in body['menu_items'] if item.get('is_available', True)]
+    categories = sorted({item['category_id'] for item in items if item.get('category_id')})
+    return items, categories
+
+
+# ============================================
+# REPORTING
+# ============================================
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)]
+
+
+def summarize(recorder, seconds):
+    endpoints = {}
+    total = errors = 0
+    for name, samples in sorted(recorder.samples.items()):
+        if name == 'setup':
+            continue
+        latencies = sorted(elapsed * 1000 for elapsed, _, _ in samples)
+        failed = sum(1 for _, status, _ in samples if status == 0 or status >= 500)
+        queries = [count for _, _, count in samples if count is not None]
+        endpoints[name] = {
+            'requests': len(samples),
+            'errors': failed,
+            'rps': round(len(samples) / seconds, 2),
+            'mean_ms': round(sum(latencies) / len(latencies), 3),
+            'p50_ms': round(percentile(latencies, 50), 3),
+            'p95_ms': round(percentile(latencies, 95), 3),
+            'p99_ms': round(percentile(latencies, 99), 3),
+            'max_ms': round(latencies[-1], 3),
+            'db_queries': round(sum(queries) / len(queries), 2) if queries else None,
+        }
+        total += len(samples)
+        errors += failed
+
+    return {
+        'requests': total,
+        'errors': errors,
+        'rps': round(total / seconds, 2),
+        'duration_s': round(seconds, 2),
+        'endpoints': endpoints,
+    }
+
+
+def print_report(summary):
+    print(f"\n{'Endpoint':<40} {'reqs':>7} {'err':>5} {'rps':>8} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8}")
+    print('-' * 100)
+    for name, row in summary['endpoints'].items():
+        queries = '-' if row['db_queries'] is None else f"{row['db_queries']:.1f}"
+        print(f"{name:<40} {row['requests']:>7} {row['errors']:>5} {row['rps']:>8.1f} "
+              f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {queries:>8}")
+    print('-' * 100)
+    print(f"Total: {summary['requests']} requests, {summary['errors']} errors, "
+          f"{summary['rps']:.1f} req/s over {summary['duration_s']}s")
+
+
+def compare(summary, baseline, threshold):
+    """Print per-endpoint changes against a baseline run; return the regressions"""
+    regressions = []
+
+    def change(before, after):
+        return (after - before) / before * 100 if before else 0.0
+
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} "
+          f"({baseline.get('timestamp', '?')}):")
+    print(f"{'Endpoint':<40} {'p95 before':>11} {'p95 after':>10} {'change':>8} "
+          f"{'rps change':>11} {'queries':>10}")
+    print('-' * 96)
+    for name, row in summary['endpoints'].items():
+        before = baseline['summary']['endpoints'].get(name)
+        if not before:
+            print(f"{name:<40} {'(new)':>11}")
+            continue
+        p95_change = change(before['p95_ms'], row['p95_ms'])
+        rps_change = change(before['rps'], row['rps'])
+        queries = f"{before['db_queries']}->{row['db_queries']}"
+        print(f"{name:<40} {before['p95_ms']:>11.2f} {row['p95_ms']:>10.2f} {p95_change:>+7.1f}% "
+              f"{rps_change:>+10.1f}% {queries:>10}")
+
+        if p95_change > threshold:
+            regressions.append(f"{name}: p95 {before['p95_ms']} -> {row['p95_ms']} ms")
+        if before['db_queries'] is not None and row['db_queries'] is not None \
+                and row['db_queries'] > before['db_queries'] + 0.5:
+            regressions.append(f"{name}: {before['db_queries']} -> {row['db_queries']} queries/request")
+
+    total_change = change(baseline['summary']['rps'], summary['rps'])
+    print(f"\nThroughput: {baseline['summary']['rps']} -> {summary['rps']} req/s ({total_change:+.1f}%)")
+    if total_change < -threshold:
+        regressions.append(f"throughput {baseline['summary']['rps']} -> {summary['rps']} req/s")
+    return regressions
+
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def run(args):
+    recorder = Recorder()
+    server = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+    else:
+        server, base_url = start_local_server(args.config)
+    print(f"→ Target: {base_url}")
+
+    try:
+        menu_items, categories = load_menu(base_url, recorder)
+        run_id = uuid.uuid4().hex[:8]
+        customers = create_customers(base_url, recorder, args.users, run_id)
+        admins = create_admins(base_url, recorder, args.admins, args.admin_user, args.admin_password)
+    except RuntimeError as e:
+        print(f"✗ Setup failed: {e}")
+        if server:
+            server.shutdown()
+        return None
+
+    journeys = Journeys(args, menu_items, categories)
+    started = time.time()
+    measure_from = started + args.warmup
+    stop_at = measure_from + args.duration
+
+    def customer_loop(index, client):
+        rng = random.Random(args.seed * 7919 + index)
+        placed = {}
+        while time.time() < stop_at:
+            journeys.customer(client, rng, placed)
+
+    def admin_loop(index, client):
+        rng = random.Random(args.seed * 104729 + index)
+        while time.time() < stop_at:
+            journeys.admin(client, rng)
+
+    threads = [threading.Thread(target=customer_loop, args=(i, c), daemon=True)
+               for i, c in enumerate(customers)]
+    threads += [threading.Thread(target=admin_loop, args=(i, c), daemon=True)
+                for i, c in enumerate(admins)]
+
+    print(f"→ {args.users} customers, {args.admins} admins: "
+          f"{args.warmup}s warm-up, {args.duration}s measured")
+    for thread in threads:
+        thread.start()
+
+    time.sleep(max(0.0, measure_from - time.time()))
+    recorder.recording = True
+    measured_at = time.time()
+    for thread in threads:
+        thread.join()
+    recorder.recording = False
+    seconds = time.time() - measured_at
+
+    for client in customers + admins:
+        client.close()
+    if server:
+        server.shutdown()
+
+    return summarize(recorder, seconds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test the Food Ordering System API')
+    parser.add_argument('--url', help='target a running server instead of an in-process app')
+    parser.add_argument('--config', default='production',
+                        help='create_app() config for the in-process server (default production)')
+    parser.add_argument('--users', type=int, default=10, help='concurrent customers (default 10)')
+    parser.add_argument('--admins', type=int, default=1, help='concurrent admins (default 1)')
+    parser.add_argument('--duration', type=float, default=30, help='measured seconds (default 30)')
+    parser.add_argument('--warmup', type=float, default=5, help='unmeasured warm-up seconds (default 5)')
+    parser.add_argument('--think', type=float, default=0,
+                        help='max random think time between steps in seconds (default 0)')
+    parser.add_argument('--polls', type=int, default=2, help='my-orders polls per customer journey')
+    parser.add_argument('--advance', type=int, default=5,
+                        help='orders an admin moves forward per status per poll')
+    parser.add_argument('--admin-user', default='admin')
+    parser.add_argument('--admin-password', default='admin123')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default 42)')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='baseline JSON results to diff against')
+    parser.add_argument('--threshold', type=float, default=10,
+                        help='percent change counted as a regression (default 10)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with status 2 when --compare finds regressions')
+    args = parser.parse_args(argv)
+
+    summary = run(args)
+    if summary is None:
+        return 1
+    print_report(summary)
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'target': args.url or f'in-process ({args.config})',
+        'settings': {key: getattr(args, key) for key in
+                     ('users', 'admins', 'duration', 'warmup', 'think', 'polls', 'advance', 'seed')},
+        'summary': summary,
+    }
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"✓ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(summary, baseline, args.threshold)
+        if regressions:
+            print("\n✗ Regressions:")
+            for regression in regressions:
+                print(f"   {regression}")
+            if args.fail_on_regression:
+                return 2
+        else:
+            print("\n✓ No regressions")
+
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
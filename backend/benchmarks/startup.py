@@ -0,0 +1,230 @@
+"""
+Startup time benchmark for the Food Ordering System backend
+
+The Electron shell (main.js) spawns `python backend/app.py` and waits for
+the first HTTP answer before opening its window, so cold start is user
+visible. Each run uses a fresh interpreter and measures:
+  - import: `from app import create_app`
+  - create: create_app() (config, database backend, blueprints)
+  - ready:  process launch until GET /api/session answers
+
+The import profile (python -X importtime) is grouped by top-level package
+and lists the slowest modules, to show where the import time goes.
+
+Usage (from backend/):
+    python -m benchmarks.startup
+    DB_BACKEND=sqlite python -m benchmarks.startup --runs 10 --output results/startup.json
+    python -m benchmarks.startup --budget-ms 1500 --fail-over-budget
+"""
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from .load_test import git_commit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold start budget (median process launch -> first response), milliseconds
+STARTUP_BUDGET_MS = 1500
+
+# Modules that belong to this project (reported even when they are fast)
+FIRST_PARTY = ('app', 'common', 'modules', 'wsgi', 'asgi')
+
+# Runs in the child interpreter: time the import and create_app(), then serve
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(sys.argv[1])
+created = time.perf_counter()
+from werkzeug.serving import make_server
+server = make_server('127.0.0.1', 0, app, threaded=True)
+print('STARTUP ' + json.dumps({
+    'port': server.server_port,
+    'import_ms': (imported - started) * 1000,
+    'create_ms': (created - imported) * 1000,
+}), flush=True)
+server.serve_forever()
+"""
+
+
+# ============================================
+# MEASUREMENTS
+# ============================================
+
+def measure_cold_start(config_name, timeout=30.0):
+    """Launch a server process and time it until the first response"""
+    launched = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', CHILD, config_name], cwd=BACKEND_DIR,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        timings = None
+        for line in process.stdout:
+            if line.startswith('STARTUP '):
+                timings = json.loads(line[len('STARTUP '):])
+                break
+        if timings is None:
+            raise RuntimeError(f"server exited with status {process.wait()} before starting")
+
+        while True:
+            connection = http.client.HTTPConnection('127.0.0.1', timings['port'], timeout=5)
+            try:
+                connection.request('GET', '/api/session')
+                connection.getresponse().read()
+                break
+            except OSError:
+                if time.perf_counter() - launched > timeout:
+                    raise RuntimeError('server did not answer in time')
+                time.sleep(0.005)
+            finally:
+                connection.close()
+
+        timings['ready_ms'] = (time.perf_counter() - launched) * 1000
+        return timings
+    finally:
+        process.kill()
+        process.wait()
+
+
+def import_profile(top=15):
+    """
+    Run `python -X importtime -c "import app"` and summarize it
+
+    Returns:
+        Dict with total_ms, per-package self time and the slowest modules
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            cwd=BACKEND_DIR, capture_output=True, text=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    total = next((cumulative for name, _, cumulative in modules if name == 'app'), 0.0)
+
+    packages = {}
+    for name, self_ms, _ in modules:
+        root = name.split('.')[0]
+        packages[root] = packages.get(root, 0.0) + self_ms
+
+    slowest = sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+    first_party = [module for module in modules if module[0].split('.')[0] in FIRST_PARTY]
+
+    return {
+        'total_ms': round(total, 1),
+        'modules_imported': len(modules),
+        'packages': [{'package': name, 'self_ms': round(ms, 1)}
+                     for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:top]],
+        'slowest_modules': [{'module': name, 'self_ms': round(s, 1), 'cumulative_ms': round(c, 1)}
+                            for name, s, c in slowest],
+        'first_party': [{'module': name, 'self_ms': round(s, 1), 'cumulative_ms': round(c, 1)}
+                        for name, s, c in first_party],
+    }
+
+
+def distribution(values):
+    return {
+        'median': round(statistics.median(values), 1),
+        'min': round(min(values), 1),
+        'max': round(max(values), 1),
+    }
+
+
+# ============================================
+# REPORTING
+# ============================================
+
+def print_report(results):
+    print("\n" + "=" * 60)
+    print("Backend Startup")
+    print("=" * 60)
+    print(f"{'':<18}{'median':>10}{'min':>10}{'max':>10}")
+    for key, label in (('import_ms', 'import app'), ('create_ms', 'create_app()'),
+                       ('ready_ms', 'first response')):
+        stats = results[key]
+        print(f"{label:<18}{stats['median']:>8.0f}ms{stats['min']:>8.0f}ms{stats['max']:>8.0f}ms")
+
+    profile = results['import_profile']
+    print(f"\nImport profile: {profile['total_ms']:.0f} ms, {profile['modules_imported']} modules")
+    print("\n  Self time by package:")
+    for entry in profile['packages']:
+        print(f"    {entry['package']:<32}{entry['self_ms']:>8.1f} ms")
+    print("\n  Slowest modules (self / cumulative):")
+    for entry in profile['slowest_modules']:
+        print(f"    {entry['module']:<44}{entry['self_ms']:>7.1f}{entry['cumulative_ms']:>9.1f} ms")
+    print("\n  First-party modules (self / cumulative):")
+    for entry in profile['first_party']:
+        print(f"    {entry['module']:<44}{entry['self_ms']:>7.1f}{entry['cumulative_ms']:>9.1f} ms")
+    print("=" * 60)
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure backend cold start time')
+    parser.add_argument('--config', default='development',
+                        help='create_app() config to start (default development)')
+    parser.add_argument('--runs', type=int, default=5, help='cold starts to measure (default 5)')
+    parser.add_argument('--top', type=int, default=15, help='rows per import profile table')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help=f'median first-response budget (default {STARTUP_BUDGET_MS})')
+    parser.add_argument('--fail-over-budget', action='store_true',
+                        help='exit with status 2 when the median is over budget')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args(argv)
+
+    runs = []
+    try:
+        for index in range(args.runs):
+            runs.append(measure_cold_start(args.config))
+            print(f"→ run {index + 1}/{args.runs}: {runs[-1]['ready_ms']:.0f} ms")
+    except RuntimeError as e:
+        print(f"✗ Startup failed: {e}")
+        return 1
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'config': args.config,
+        'db_backend': os.environ.get('DB_BACKEND', 'mysql'),
+        'runs': args.runs,
+        'budget_ms': args.budget_ms,
+    }
+    for key in ('import_ms', 'create_ms', 'ready_ms'):
+        results[key] = distribution([run[key] for run in runs])
+    results['import_profile'] = import_profile(args.top)
+
+    print_report(results)
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"✓ Results written to {args.output}")
+
+    median = results['ready_ms']['median']
+    if median > args.budget_ms:
+        print(f"✗ Cold start {median:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        if args.fail_over_budget:
+            return 2
+    else:
+        print(f"✓ Cold start {median:.0f} ms is within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
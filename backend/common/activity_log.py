@@ -0,0 +1,225 @@
+"""
+Buffered activity logging (activity_logs table)
+
+Routes call log_activity(); the event goes into a bounded in-process
+buffer and returns immediately. A background thread writes the buffer
+with multi-row INSERTs every ACTIVITY_LOG_FLUSH_INTERVAL_MS, or sooner once
+ACTIVITY_LOG_BATCH_SIZE events are waiting, so no request pays for an
+extra commit.
+
+When the database is slow or down the buffer fills up; the oldest events
+are then dropped and counted (activity_log_events_dropped_total) rather
+than growing memory or blocking requests. Events still buffered when the
+process exits are flushed by an atexit hook.
+
+Usage:
+    from common.activity_log import log_activity
+    log_activity('order_placed', f"Order {order_number}")
+"""
+
+import atexit
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from flask import request, session, has_request_context
+
+from .database import Database
+from .db_backends import DatabaseError
+from .metrics import metrics
+
+USER_TYPES = ('user', 'admin', 'guest')
+
+INSERT_PREFIX = ("INSERT INTO activity_logs "
+                 "(user_id, user_type, action, description, ip_address, created_at) VALUES ")
+ROW_PLACEHOLDERS = "(%s, %s, %s, %s, %s, %s)"
+
+
+class ActivityLogger:
+    """Bounded event buffer drained by a daemon flusher thread"""
+
+    def __init__(self):
+        self.enabled = True
+        self.capacity = 10000
+        self.batch_size = 200
+        self.flush_interval = 0.5
+        self._buffer = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._stopping = False
+        self.written = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+
+    def configure(self, config):
+        self.enabled = config.get('ACTIVITY_LOG_ENABLED', True)
+        self.capacity = config.get('ACTIVITY_LOG_BUFFER_SIZE', 10000)
+        self.batch_size = config.get('ACTIVITY_LOG_BATCH_SIZE', 200)
+        self.flush_interval = config.get('ACTIVITY_LOG_FLUSH_INTERVAL_MS', 500) / 1000.0
+
+    # ------------------------------------------
+    # Producer side (request threads)
+    # ------------------------------------------
+
+    def log(self, action, description=None, user_id=None, user_type='guest', ip_address=None):
+        """Queue one event; never blocks on the database"""
+        if not self.enabled:
+            return
+
+        event = (user_id, user_type if user_type in USER_TYPES else 'guest',
+                 action[:100], description, ip_address, datetime.now())
+
+        with self._condition:
+            if len(self._buffer) >= self.capacity:
+                self._buffer.popleft()
+                self.dropped += 1
+                metrics.inc('activity_log_events_dropped_total')
+            self._buffer.append(event)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+        self._ensure_thread()
+
+    def _ensure_thread(self):
+        # Threads do not survive fork; each gunicorn worker starts its own flusher
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        with self._condition:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            if self._pid is not None:
+                # Forked child: the inherited events belong to the parent
+                self._buffer.clear()
+            self._pid = os.getpid()
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='activity-log-flusher',
+                                            daemon=True)
+            self._thread.start()
+
+    # ------------------------------------------
+    # Consumer side (flusher thread)
+    # ------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if len(self._buffer) < self.batch_size and not self._stopping:
+                    self._condition.wait(self.flush_interval)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    def _take_batch(self):
+        with self._condition:
+            count = min(len(self._buffer), self.batch_size)
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def _requeue(self, batch):
+        """Put a failed batch back in front of newer events, dropping what no longer fits"""
+        with self._condition:
+            room = max(self.capacity - len(self._buffer), 0)
+            kept = batch[len(batch) - room:] if room < len(batch) else batch
+            self._buffer.extendleft(reversed(kept))
+            lost = len(batch) - len(kept)
+            if lost:
+                self.dropped += lost
+                metrics.inc('activity_log_events_dropped_total', amount=lost)
+
+    def flush(self):
+        """
+        Write everything buffered so far, batch_size rows per INSERT
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return written
+
+            statement = INSERT_PREFIX + ', '.join([ROW_PLACEHOLDERS] * len(batch))
+            params = tuple(value for event in batch for value in event)
+            try:
+                with Database.get_cursor() as cursor:
+                    cursor.execute(statement, params)
+            except DatabaseError:
+                # Keep the events for the next tick; back off until then
+                self.failed_flushes += 1
+                metrics.inc('activity_log_flush_failures_total')
+                self._requeue(batch)
+                return written
+
+            written += len(batch)
+            self.written += len(batch)
+            metrics.inc('activity_log_events_written_total', amount=len(batch))
+
+    def stop(self, timeout=5.0):
+        """Flush remaining events and stop the flusher thread"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        thread.join(timeout)
+        self._thread = None
+
+    def pending(self):
+        return len(self._buffer)
+
+    def worker_state(self):
+        """'running', 'idle' (not started in this process yet) or 'dead'"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return 'idle'
+        return 'running' if thread.is_alive() else 'dead'
+
+    def stats(self):
+        return {
+            'enabled': self.enabled,
+            'pending': self.pending(),
+            'capacity': self.capacity,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed_flushes': self.failed_flushes,
+        }
+
+
+# Process-wide logger
+activity_logger = ActivityLogger()
+
+metrics.counter('activity_log_events_written_total',
+                'Activity log events written to activity_logs')
+metrics.counter('activity_log_events_dropped_total',
+                'Activity log events dropped because the buffer was full')
+metrics.counter('activity_log_flush_failures_total',
+                'Activity log flushes that failed and were retried')
+metrics.gauge_callback('activity_log_pending_events',
+                       'Activity log events waiting to be written', activity_logger.pending)
+
+atexit.register(activity_logger.stop)
+
+
+def log_activity(action, description=None, user_id=None, user_type=None):
+    """
+    Queue an activity log event
+
+    Inside a request the user id, user type and client IP default to the
+    authenticated caller and request.remote_addr.
+    """
+    ip_address = None
+    if has_request_context():
+        ip_address = request.remote_addr
+        if user_id is None:
+            # request.user_id is set by the JWT decorators, session by cookie logins
+            user_id = getattr(request, 'user_id', None) or session.get('user_id')
+            user_type = user_type or getattr(request, 'user_type', None) or session.get('user_type')
+    activity_logger.log(action, description, user_id, user_type or 'guest', ip_address)
+
+
+def init_activity_log(app):
+    """Apply ACTIVITY_LOG_* settings from the app config"""
+    activity_logger.configure(app.config)
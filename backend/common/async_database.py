@@ -0,0 +1,97 @@
+"""
+Async database connection and utilities for MySQL (asyncio / aiomysql)
+Used by the ASGI read path (see asgi.py); the sync app keeps using Database.
+"""
+
+import aiomysql
+from contextlib import asynccontextmanager
+from .config import Config
+
+
+class AsyncDatabase:
+    """Async database connection manager"""
+
+    _pool = None
+
+    @classmethod
+    async def initialize_pool(cls, config=None):
+        """Initialize async connection pool"""
+        if cls._pool is None:
+            config = config or {}
+            try:
+                cls._pool = await aiomysql.create_pool(
+                    host=config.get('MYSQL_HOST', Config.MYSQL_HOST),
+                    user=config.get('MYSQL_USER', Config.MYSQL_USER),
+                    password=config.get('MYSQL_PASSWORD', Config.MYSQL_PASSWORD),
+                    db=config.get('MYSQL_DB', Config.MYSQL_DB),
+                    port=config.get('MYSQL_PORT', Config.MYSQL_PORT),
+                    minsize=config.get('ASYNC_DB_POOL_MIN', Config.ASYNC_DB_POOL_MIN),
+                    maxsize=config.get('ASYNC_DB_POOL_MAX', Config.ASYNC_DB_POOL_MAX),
+                    pool_recycle=config.get('ASYNC_DB_POOL_RECYCLE', Config.ASYNC_DB_POOL_RECYCLE),
+                    autocommit=True,
+                    charset='utf8mb4'
+                )
+                print("[OK] Async database connection pool initialized")
+            except Exception as e:
+                print(f"[ERROR] Error creating async connection pool: {e}")
+                raise
+
+    @classmethod
+    async def close_pool(cls):
+        """Close all pooled connections"""
+        if cls._pool is not None:
+            pool = cls._pool
+            cls._pool = None
+            pool.close()
+            await pool.wait_closed()
+
+    @classmethod
+    @asynccontextmanager
+    async def get_cursor(cls):
+        """
+        Async context manager for a dictionary cursor
+        Usage:
+            async with AsyncDatabase.get_cursor() as cursor:
+                await cursor.execute("SELECT * FROM users")
+                results = await cursor.fetchall()
+        """
+        if cls._pool is None:
+            await cls.initialize_pool()
+
+        async with cls._pool.acquire() as connection:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                yield cursor
+
+    @classmethod
+    async def execute_query(cls, query, params=None, fetch_one=False, fetch_all=False):
+        """
+        Execute a read query and return results
+
+        Args:
+            query: SQL query string (same %s placeholders as Database)
+            params: Query parameters (tuple or dict)
+            fetch_one: Return single row
+            fetch_all: Return all rows
+
+        Returns:
+            Query results or lastrowid
+        """
+        async with cls.get_cursor() as cursor:
+            await cursor.execute(query, params or ())
+
+            if fetch_one:
+                return await cursor.fetchone()
+            elif fetch_all:
+                return await cursor.fetchall()
+            else:
+                return cursor.lastrowid
+
+    @classmethod
+    async def test_connection(cls):
+        """Test database connection"""
+        try:
+            row = await cls.execute_query("SELECT 1 AS ok", fetch_one=True)
+            return bool(row)
+        except Exception as e:
+            print(f"✗ Async database connection test failed: {e}")
+            return False
@@ -0,0 +1,79 @@
+"""
+Authentication helpers for the async (Quart) routes
+Mirrors the JWT-then-session lookup used by the sync routes.
+"""
+
+import jwt
+from quart import current_app, request, session
+
+from .async_database import AsyncDatabase
+
+
+def get_token_from_request():
+    """Extract JWT token from Authorization header"""
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        return auth_header.split(' ')[1]
+    return None
+
+
+def decode_token(token):
+    """Decode and validate JWT token"""
+    try:
+        return jwt.decode(
+            token,
+            current_app.config['SECRET_KEY'],
+            algorithms=['HS256']
+        )
+    except jwt.InvalidTokenError:
+        return None
+
+
+async def get_session_identity():
+    """
+    Resolve the caller from the session cookie
+
+    With SESSION_BACKEND='database' the cookie is a user_sessions token
+    (see common/sessions.py); otherwise it is Flask's signed cookie.
+    """
+    if current_app.config.get('SESSION_BACKEND', 'database') != 'database':
+        return session.get('user_id'), session.get('user_type')
+
+    token = request.cookies.get(current_app.config['SESSION_COOKIE_NAME'])
+    if not token:
+        return None, None
+
+    row = await AsyncDatabase.execute_query(
+        """SELECT user_id, user_type FROM user_sessions
+           WHERE session_token = %s AND expires_at > NOW()""",
+        (token,),
+        fetch_one=True
+    )
+    if not row:
+        return None, None
+    return row['user_id'], row['user_type']
+
+
+async def get_request_identity():
+    """
+    Resolve the caller from JWT token or session cookie
+
+    Returns:
+        Tuple of (user_id, user_type) - both None when not logged in
+    """
+    user_id = None
+    user_type = None
+
+    # Try JWT token first
+    token = get_token_from_request()
+    if token:
+        payload = decode_token(token)
+        if payload:
+            user_id = payload.get('user_id')
+            user_type = payload.get('user_type')
+
+    # Fallback to session (same cookie as the Flask app)
+    if not user_id:
+        user_id, user_type = await get_session_identity()
+
+    return user_id, user_type
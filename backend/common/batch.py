@@ -0,0 +1,141 @@
+"""
+Composite batch endpoint (POST /api/batch)
+
+Dashboards fire many independent GETs at startup. /api/batch takes a list
+of them and runs each through the normal view function in-process, so
+one HTTP round trip replaces several:
+
+    POST /api/batch
+    {
+      "parallel": true,
+      "requests": [
+        {"id": "profile", "path": "/api/user/profile"},
+        {"id": "orders",  "path": "/api/order/my-orders?expand="}
+      ]
+    }
+
+    200 {"responses": [{"id": "profile", "status": 200, "body": {...}}, ...]}
+
+The caller's identity is resolved once: every sub-request reuses the
+session already loaded for the batch request and the decoded JWT (see
+decode_token), and carries the same Authorization/Cookie headers.
+Sub-requests get their own request and app contexts, so per-request state
+(g, metrics, query guard) stays separate.
+
+Only GET sub-requests under /api/ are accepted. Independent reads can run
+in parallel on a bounded per-process thread pool (BATCH_MAX_WORKERS).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from flask import current_app, jsonify, request, session
+from werkzeug.test import EnvironBuilder
+
+from .metrics import metrics
+from .middleware import get_token_from_request, decode_token, TOKEN_PAYLOAD_KEY
+
+# Headers copied from the batch request to every sub-request
+FORWARDED_HEADERS = ('Authorization', 'Cookie', 'Accept-Language', 'User-Agent', 'Origin')
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+metrics.counter('batch_subrequests_total', 'Sub-requests run through /api/batch')
+
+
+def _get_executor(max_workers):
+    # Thread pools do not survive fork; each worker process builds its own
+    global _executor, _executor_pid
+    if _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=max_workers,
+                                               thread_name_prefix='batch')
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def _validate(entry, index):
+    """Return (id, path) for a sub-request entry or raise ValueError"""
+    if not isinstance(entry, dict):
+        raise ValueError(f"requests[{index}] must be an object")
+    path = entry.get('path')
+    request_id = entry.get('id', index)
+    method = str(entry.get('method', 'GET')).upper()
+    if method != 'GET':
+        raise ValueError(f"requests[{index}]: only GET sub-requests are supported")
+    if not isinstance(path, str) or not path.startswith('/api/'):
+        raise ValueError(f"requests[{index}]: path must start with /api/")
+    if urlsplit(path).path.rstrip('/') == '/api/batch':
+        raise ValueError(f"requests[{index}]: batches cannot be nested")
+    return request_id, path
+
+
+def _run_one(app, request_id, path, headers, environ_base, session_obj):
+    """Dispatch one GET through the app's normal request handling"""
+    split = urlsplit(path)
+    builder = EnvironBuilder(path=split.path, query_string=split.query, method='GET',
+                             headers=headers, environ_base=environ_base)
+    environ = builder.get_environ()
+    builder.close()
+
+    try:
+        with app.app_context():
+            ctx = app.request_context(environ)
+            # Reuse the batch request's session instead of loading it again
+            ctx.session = session_obj
+            with ctx:
+                response = app.full_dispatch_request()
+    except Exception as e:
+        return {'id': request_id, 'status': 500, 'body': {'error': str(e)}}
+
+    metrics.inc('batch_subrequests_total', (('status', str(response.status_code)),))
+    body = response.get_json(silent=True)
+    if body is None:
+        body = response.get_data(as_text=True)
+    return {'id': request_id, 'status': response.status_code, 'body': body}
+
+
+def init_batch(app):
+    """Register POST /api/batch (BATCH_MAX_REQUESTS, BATCH_MAX_WORKERS)"""
+    max_requests = app.config.get('BATCH_MAX_REQUESTS', 20)
+    max_workers = app.config.get('BATCH_MAX_WORKERS', 4)
+
+    @app.route('/api/batch', methods=['POST'])
+    def batch():
+        """Run several GET requests in one round trip"""
+        data = request.get_json(silent=True) or {}
+        entries = data.get('requests')
+        if not isinstance(entries, list) or not entries:
+            return jsonify({'error': 'requests must be a non-empty list'}), 400
+        if len(entries) > max_requests:
+            return jsonify({'error': f'At most {max_requests} requests per batch'}), 400
+
+        try:
+            calls = [_validate(entry, index) for index, entry in enumerate(entries)]
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        app_obj = current_app._get_current_object()
+        headers = [(name, request.headers[name]) for name in FORWARDED_HEADERS
+                   if name in request.headers]
+        environ_base = {'REMOTE_ADDR': request.remote_addr}
+
+        # Resolve the caller once: decode the JWT here and hand the payload down
+        token = get_token_from_request()
+        if token:
+            environ_base[TOKEN_PAYLOAD_KEY] = (token, decode_token(token))
+        session_obj = session._get_current_object()
+
+        def run(call):
+            return _run_one(app_obj, call[0], call[1], headers, environ_base, session_obj)
+
+        if data.get('parallel') and len(calls) > 1:
+            responses = list(_get_executor(max_workers).map(run, calls))
+        else:
+            responses = [run(call) for call in calls]
+
+        return jsonify({'responses': responses}), 200
@@ -0,0 +1,153 @@
+"""
+Response compression (gzip, and brotli when installed)
+
+An after_request hook compresses JSON, HTML and text responses of at least
+COMPRESS_MIN_SIZE bytes. The encoding is negotiated from Accept-Encoding;
+br is preferred when the `brotli` package is installed (`pip install
+brotli`), otherwise gzip. Levels are tuned for latency rather than ratio:
+gzip COMPRESS_LEVEL (default 5) and brotli COMPRESS_BR_QUALITY (default 4)
+keep most of the size win at a fraction of the CPU of the maximum levels.
+
+Cached payloads (PrecompressedPayload) keep their compressed variants, so
+hot reads such as the menu snapshot are served with no JSON encoding or
+compression work at all.
+
+Usage:
+    payload = PrecompressedPayload({'menu_items': rows})
+    return payload.response()
+"""
+
+import gzip
+import threading
+from flask import current_app, request
+
+from .metrics import metrics
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/css',
+                          'application/javascript')
+
+
+class Compressor:
+    """Encoding negotiation and compression settings"""
+
+    def __init__(self):
+        self.enabled = True
+        self.min_size = 1024
+        self.level = 5
+        self.br_quality = 4
+        self.brotli = None
+
+    def configure(self, config):
+        self.enabled = config.get('COMPRESS_ENABLED', True)
+        self.min_size = config.get('COMPRESS_MIN_SIZE', 1024)
+        self.level = config.get('COMPRESS_LEVEL', 5)
+        self.br_quality = config.get('COMPRESS_BR_QUALITY', 4)
+        try:
+            import brotli  # optional dependency, only needed for br
+            self.brotli = brotli
+        except ImportError:
+            self.brotli = None
+
+    def encodings(self):
+        return ('br', 'gzip') if self.brotli is not None else ('gzip',)
+
+    def negotiate(self):
+        """Best encoding the client accepts, or None"""
+        if not self.enabled:
+            return None
+        return request.accept_encodings.best_match(self.encodings())
+
+    def compress(self, data, encoding):
+        if encoding == 'br':
+            return self.brotli.compress(data, quality=self.br_quality)
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+
+# Process-wide settings
+compressor = Compressor()
+
+metrics.counter('http_responses_compressed_total', 'Responses sent compressed, by encoding')
+metrics.counter('http_compression_saved_bytes_total', 'Bytes saved by response compression')
+
+
+def _set_encoded_body(response, data, encoding):
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+
+
+class PrecompressedPayload:
+    """
+    A JSON body encoded once, with each compressed variant built on first use
+
+    Keep these in a cache in place of raw rows; response() then only picks
+    the variant matching the request's Accept-Encoding.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._body = None
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    def body(self):
+        if self._body is None:
+            # Same serialization as jsonify (indented in debug mode)
+            self._body = current_app.json.response(self.data).get_data()
+        return self._body
+
+    def variant(self, encoding):
+        compressed = self._variants.get(encoding)
+        if compressed is None:
+            with self._lock:
+                compressed = self._variants.get(encoding)
+                if compressed is None:
+                    compressed = compressor.compress(self.body(), encoding)
+                    self._variants[encoding] = compressed
+        return compressed
+
+    def response(self, status=200):
+        body = self.body()
+        response = current_app.response_class(body, status=status, mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        encoding = compressor.negotiate()
+        if encoding and len(body) >= compressor.min_size:
+            compressed = self.variant(encoding)
+            _set_encoded_body(response, compressed, encoding)
+            metrics.inc('http_responses_compressed_total', (('encoding', encoding),))
+            metrics.inc('http_compression_saved_bytes_total', amount=len(body) - len(compressed))
+        return response
+
+
+def init_compression(app):
+    """Apply COMPRESS_* settings and compress eligible responses after each request"""
+    compressor.configure(app.config)
+    if not compressor.enabled:
+        return
+
+    @app.after_request
+    def compress_response(response):
+        if (response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'no-transform' in response.headers.get('Cache-Control', '')):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < compressor.min_size:
+            return response
+
+        encoding = compressor.negotiate()
+        if encoding is None:
+            return response
+
+        compressed = compressor.compress(data, encoding)
+        if len(compressed) >= len(data):
+            return response
+        _set_encoded_body(response, compressed, encoding)
+        metrics.inc('http_responses_compressed_total', (('encoding', encoding),))
+        metrics.inc('http_compression_saved_bytes_total', amount=len(data) - len(compressed))
+        return response
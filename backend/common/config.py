@@ -18,6 +18,50 @@ class Config:
     MYSQL_PASSWORD = os.environ.get('MYSQL_PASSWORD') or ''  # Default XAMPP has no password
     MYSQL_DB = os.environ.get('MYSQL_DB') or 'food_ordering_system'
     MYSQL_PORT = int(os.environ.get('MYSQL_PORT') or 3306)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE') or 5)  # Connections per process
+    
+    # Pool startup (see common/warmup.py) - create_app() returns without connecting
+    DB_LAZY_INIT = os.environ.get('DB_LAZY_INIT', 'true').lower() in ['true', 'on', '1']
+    DB_CONNECT_BACKOFF = float(os.environ.get('DB_CONNECT_BACKOFF') or 0.5)  # seconds, doubled per failure
+    DB_CONNECT_BACKOFF_MAX = float(os.environ.get('DB_CONNECT_BACKOFF_MAX') or 30)  # seconds
+    DB_WARMUP_CONNECTIONS = int(os.environ.get('DB_WARMUP_CONNECTIONS') or 2)  # 0 = no warm-up thread
+    
+    # Readiness probe (see common/health.py) - SELECT 1 at most once per interval
+    HEALTH_DB_CHECK_INTERVAL = float(os.environ.get('HEALTH_DB_CHECK_INTERVAL') or 5)  # seconds
+    
+    # Response compression (see common/compression.py) - br needs `pip install brotli`
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() in ['true', 'on', '1']
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE') or 1024)  # bytes; smaller bodies go as-is
+    COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL') or 5)  # gzip 1-9
+    COMPRESS_BR_QUALITY = int(os.environ.get('COMPRESS_BR_QUALITY') or 4)  # brotli 0-11
+    
+    # Composite requests (see common/batch.py)
+    BATCH_MAX_REQUESTS = int(os.environ.get('BATCH_MAX_REQUESTS') or 20)  # Sub-requests per batch
+    BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS') or 4)  # Parallel sub-requests per process
+    
+    # Menu and category snapshot cache (see modules/order/menu_cache.py)
+    MENU_CACHE_TTL = int(os.environ.get('MENU_CACHE_TTL') or 60)  # seconds; bounds rating staleness
+    
+    # Customer dashboard summaries (see modules/user/dashboard.py)
+    USER_DASHBOARD_CACHE_SIZE = int(os.environ.get('USER_DASHBOARD_CACHE_SIZE') or 10000)  # Users cached per process
+    USER_DASHBOARD_CACHE_TTL = int(os.environ.get('USER_DASHBOARD_CACHE_TTL') or 60)  # seconds; bounds cross-worker lag
+    
+    # Database backend: 'mysql', or 'sqlite' for hermetic tests and benchmarks
+    DB_BACKEND = os.environ.get('DB_BACKEND') or 'mysql'
+    SQLITE_PATH = os.environ.get('SQLITE_PATH') or ':memory:'  # or a file path (WAL mode)
+    
+    # Async read path (asgi.py) - one event loop per process shares this pool
+    ASYNC_DB_POOL_MIN = int(os.environ.get('ASYNC_DB_POOL_MIN') or 2)
+    ASYNC_DB_POOL_MAX = int(os.environ.get('ASYNC_DB_POOL_MAX') or 20)
+    ASYNC_DB_POOL_RECYCLE = int(os.environ.get('ASYNC_DB_POOL_RECYCLE') or 3600)  # seconds
+    
+    # Production server (gunicorn, see gunicorn.conf.py)
+    WEB_BIND = os.environ.get('WEB_BIND') or '127.0.0.1:5000'
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS') or 0)  # 0 = 2 x CPU cores + 1
+    WEB_THREADS = int(os.environ.get('WEB_THREADS') or 4)  # Threads per worker
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT') or 30)
+    WEB_GRACEFUL_TIMEOUT = int(os.environ.get('WEB_GRACEFUL_TIMEOUT') or 30)
+    WEB_MAX_REQUESTS = int(os.environ.get('WEB_MAX_REQUESTS') or 1000)  # Recycle workers (0 = never)
     
     # Session Configuration
     SESSION_COOKIE_NAME = 'food_order_session'
@@ -26,6 +70,22 @@ class Config:
     SESSION_COOKIE_SECURE = False  # False for development (no HTTPS)
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
     
+    # Server-side sessions (see common/sessions.py) - 'database' or 'cookie' (signed cookie)
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND') or 'database'
+    SESSION_CACHE_SIZE = int(os.environ.get('SESSION_CACHE_SIZE') or 10000)  # Sessions cached per process
+    SESSION_CACHE_TTL = int(os.environ.get('SESSION_CACHE_TTL') or 30)  # seconds; bounds revocation lag
+    SESSION_SWEEP_INTERVAL = int(os.environ.get('SESSION_SWEEP_INTERVAL') or 300)  # seconds (0 = off)
+    SESSION_SWEEP_BATCH = 1000
+    
+    # Login throttling (see common/rate_limit.py) - token buckets per client IP and per login name
+    LOGIN_RATE_LIMIT_ENABLED = os.environ.get('LOGIN_RATE_LIMIT_ENABLED', 'true').lower() in ['true', 'on', '1']
+    LOGIN_RATE_LIMIT_IP_BURST = int(os.environ.get('LOGIN_RATE_LIMIT_IP_BURST') or 20)
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE = float(os.environ.get('LOGIN_RATE_LIMIT_IP_PER_MINUTE') or 10)
+    LOGIN_RATE_LIMIT_ID_BURST = int(os.environ.get('LOGIN_RATE_LIMIT_ID_BURST') or 5)
+    LOGIN_RATE_LIMIT_ID_PER_MINUTE = float(os.environ.get('LOGIN_RATE_LIMIT_ID_PER_MINUTE') or 1)
+    RATE_LIMIT_STORAGE_URL = os.environ.get('RATE_LIMIT_STORAGE_URL')  # redis://... to share buckets
+    RATE_LIMIT_MAX_KEYS = 100000  # Buckets kept per process (in-memory store)
+    
     # JWT Configuration (for API tokens)
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
@@ -36,8 +96,30 @@ class Config:
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
     
+    # Metrics (Prometheus text format, see common/metrics.py)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() in ['true', 'on', '1']
+    METRICS_PATH = '/metrics'
+    
+    # Query tracing and slow-query log (see common/query_trace.py)
+    SQL_TRACE_ENABLED = os.environ.get('SQL_TRACE_ENABLED', 'false').lower() in ['true', 'on', '1']
+    SLOW_QUERY_THRESHOLD_MS = int(os.environ.get('SLOW_QUERY_THRESHOLD_MS') or 100)
+    SQL_TRACE_TOP_N = 20
+    SQL_SLOW_LOG_SIZE = 100
+    
+    # N+1 query detector (see common/query_guard.py) - None = on in debug/testing
+    N_PLUS_ONE_GUARD = None
+    N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD') or 5)
+    N_PLUS_ONE_RAISE = False
+    
+    # Activity log writer (see common/activity_log.py) - buffered, flushed in batches
+    ACTIVITY_LOG_ENABLED = os.environ.get('ACTIVITY_LOG_ENABLED', 'true').lower() in ['true', 'on', '1']
+    ACTIVITY_LOG_BUFFER_SIZE = int(os.environ.get('ACTIVITY_LOG_BUFFER_SIZE') or 10000)  # Events kept in memory
+    ACTIVITY_LOG_BATCH_SIZE = int(os.environ.get('ACTIVITY_LOG_BATCH_SIZE') or 200)  # Rows per INSERT
+    ACTIVITY_LOG_FLUSH_INTERVAL_MS = int(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL_MS') or 500)
+    
     # Pagination
     ITEMS_PER_PAGE = 20
+    MAX_ITEMS_PER_PAGE = 100  # Upper bound for ?per_page=
     
     # Email Configuration (optional - for future use)
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
@@ -53,6 +135,8 @@ class Config:
     
     # Order Settings
     ORDER_STATUSES = ['pending', 'confirmed', 'preparing', 'ready', 'delivered', 'cancelled']
+    ORDER_BULK_MAX = int(os.environ.get('ORDER_BULK_MAX') or 100)  # Orders per bulk status update
+    MAX_ITEM_QUANTITY = int(os.environ.get('MAX_ITEM_QUANTITY') or 99)  # Per cart line
     PAYMENT_METHODS = ['cash', 'card', 'online']
     
     # Rating Settings
@@ -62,9 +146,7 @@ class Config:
     @staticmethod
     def init_app(app):
         """Initialize application with config"""
-        # Create upload folder if it doesn't exist
-        if not os.path.exists(Config.UPLOAD_FOLDER):
-            os.makedirs(Config.UPLOAD_FOLDER)
+        # Nothing to prepare at startup; the upload folder is created on first upload
 
 
 class DevelopmentConfig(Config):
@@ -88,6 +170,7 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     MYSQL_DB = 'food_ordering_system_test'
+    N_PLUS_ONE_RAISE = True
 
 
 # Configuration dictionary
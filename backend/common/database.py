@@ -1,70 +1,238 @@
 """
-Database connection and utilities for MySQL
+Database connection and utilities (MySQL, or embedded SQLite for tests and benchmarks)
 """
 
-import mysql.connector
-from mysql.connector import Error, pooling
 from contextlib import contextmanager
+import os
+import threading
+import time
 from .config import Config
+from .db_backends import DatabaseError, create_backend
+
+
+class _InstrumentedCursor:
+    """Cursor proxy that reports each statement to the registered query hooks"""
+
+    def __init__(self, cursor, hooks):
+        self._cursor = cursor
+        self._hooks = hooks
+
+    def execute(self, operation, params=(), *args, **kwargs):
+        start = time.perf_counter()
+        result = self._cursor.execute(operation, params, *args, **kwargs)
+        self._notify(operation, params, time.perf_counter() - start)
+        return result
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        start = time.perf_counter()
+        result = self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        self._notify(operation, seq_params, time.perf_counter() - start)
+        return result
+
+    def _notify(self, operation, params, elapsed):
+        rowcount = self._cursor.rowcount
+        for hook in self._hooks:
+            hook(operation, params, elapsed, rowcount)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
 
 class Database:
     """Database connection manager"""
     
-    _connection_pool = None
+    _backend = None
+    _pool_config = None
+    _pool_pid = None
+    
+    # Connect backoff after a failed pool creation (see _create_backend)
+    _connect_failures = 0
+    _connect_error = None
+    _retry_at = 0.0
+    _create_lock = threading.Lock()
+    
+    # Instrumentation callbacks (see add_query_hook / add_checkout_hook)
+    _query_hooks = []
+    _checkout_hooks = []
+    
+    # Settings read from the app config by initialize_pool()
+    _SETTINGS = ('DB_BACKEND', 'SQLITE_PATH', 'MYSQL_HOST', 'MYSQL_USER', 'MYSQL_PASSWORD',
+                 'MYSQL_DB', 'MYSQL_PORT', 'DB_POOL_SIZE',
+                 'DB_CONNECT_BACKOFF', 'DB_CONNECT_BACKOFF_MAX')
     
     @classmethod
-    def initialize_pool(cls, config=None):
-        """Initialize connection pool"""
-        if cls._connection_pool is None:
+    def initialize_pool(cls, config=None, lazy=False):
+        """
+        Initialize connection pool (MySQL, or SQLite when DB_BACKEND='sqlite')
+        
+        Args:
+            config: App config (dict) or config object; remembered for later
+            lazy: Only remember the config; the pool is created by the first
+                  get_connection() (or the warm-up thread, see common/warmup.py)
+        """
+        if config is not None:
+            cls._pool_config = config
+
+        if cls._backend is None and not lazy:
+            cls._create_backend()
+    
+    @classmethod
+    def _settings(cls):
+        # Handle both dict and object config
+        config = cls._pool_config
+        settings = {}
+        for name in cls._SETTINGS:
+            if config and isinstance(config, dict):
+                settings[name] = config.get(name, getattr(Config, name))
+            else:
+                settings[name] = getattr(config or Config, name, getattr(Config, name))
+        return settings
+    
+    @classmethod
+    def _create_backend(cls):
+        """
+        Create the backend, backing off exponentially after failures
+        
+        While a backoff window is open the last error is raised again at
+        once, so requests fail fast instead of each waiting on a connect
+        timeout against a database that is down.
+        """
+        with cls._create_lock:
+            if cls._backend is not None and cls._pool_pid == os.getpid():
+                # Another thread created it while this one waited
+                return
+            if cls._connect_error is not None and time.monotonic() < cls._retry_at:
+                raise cls._connect_error.with_traceback(None)
+
+            settings = cls._settings()
             try:
-                # Handle both dict and object config
-                if config and isinstance(config, dict):
-                    host = config.get('MYSQL_HOST', Config.MYSQL_HOST)
-                    user = config.get('MYSQL_USER', Config.MYSQL_USER)
-                    password = config.get('MYSQL_PASSWORD', Config.MYSQL_PASSWORD)
-                    database = config.get('MYSQL_DB', Config.MYSQL_DB)
-                    port = config.get('MYSQL_PORT', Config.MYSQL_PORT)
-                elif config:
-                    host = config.MYSQL_HOST
-                    user = config.MYSQL_USER
-                    password = config.MYSQL_PASSWORD
-                    database = config.MYSQL_DB
-                    port = config.MYSQL_PORT
-                else:
-                    host = Config.MYSQL_HOST
-                    user = Config.MYSQL_USER
-                    password = Config.MYSQL_PASSWORD
-                    database = Config.MYSQL_DB
-                    port = Config.MYSQL_PORT
-
-                pool_config = {
-                    'pool_name': 'food_order_pool',
-                    'pool_size': 5,
-                    'pool_reset_session': True,
-                    'host': host,
-                    'user': user,
-                    'password': password,
-                    'database': database,
-                    'port': port,
-                    'autocommit': False
-                }
-
-                cls._connection_pool = pooling.MySQLConnectionPool(**pool_config)
-                print("[OK] Database connection pool initialized")
-
-            except Error as e:
-                print(f"[ERROR] Error creating connection pool: {e}")
+                cls._backend = create_backend(settings)
+                cls._pool_pid = os.getpid()
+            except DatabaseError as e:
+                cls._connect_failures += 1
+                cls._connect_error = e
+                delay = min(settings['DB_CONNECT_BACKOFF'] * 2 ** (cls._connect_failures - 1),
+                            settings['DB_CONNECT_BACKOFF_MAX'])
+                cls._retry_at = time.monotonic() + delay
+                print(f"[ERROR] Error creating connection pool (retry in {delay:.1f}s): {e}")
                 raise
+
+            cls._connect_failures = 0
+            cls._connect_error = None
+    
+    @classmethod
+    def retry_delay(cls):
+        """Seconds until the next connect attempt is allowed (0 = now)"""
+        if cls._connect_error is None:
+            return 0.0
+        return max(cls._retry_at - time.monotonic(), 0.0)
+    
+    @classmethod
+    def is_connected(cls):
+        """True when this process has a live backend"""
+        return cls._backend is not None and cls._pool_pid == os.getpid()
+    
+    @classmethod
+    def pool_status(cls):
+        """
+        Pool usage for health checks, without touching the database
+        
+        Returns:
+            Dict with size, in_use and saturation, or None before the pool exists
+        """
+        backend = cls._backend
+        if backend is None or cls._pool_pid != os.getpid():
+            return None
+        status = backend.pool_status()
+        status['saturation'] = round(status['in_use'] / status['size'], 2) if status['size'] else 0.0
+        return status
+    
+    @classmethod
+    def get_backend(cls):
+        """Active backend (MySQLBackend or SQLiteBackend), initialized on first use"""
+        if cls._backend is not None and cls._pool_pid != os.getpid():
+            cls.reset_pool()
+        if cls._backend is None:
+            cls._create_backend()
+        return cls._backend
+    
+    @classmethod
+    def reset_pool(cls):
+        """
+        Forget the inherited connection pool after a fork.
+
+        The sockets belong to the parent process, so they are dropped without
+        being closed; closing them here would end the parent's MySQL sessions.
+        The next get_connection() builds a fresh pool for this process.
+        """
+        cls._backend = None
+        cls._pool_pid = None
+        cls._connect_failures = 0
+        cls._connect_error = None
+    
+    @classmethod
+    def dispose_pool(cls):
+        """Close idle pooled connections and drop the pool (owning process only)"""
+        backend = cls._backend
+        cls.reset_pool()
+        if backend is not None:
+            try:
+                backend.dispose()
+            except DatabaseError as e:
+                print(f"[WARN] Error closing pooled connections: {e}")
+    
+    @classmethod
+    def add_query_hook(cls, hook):
+        """
+        Register a callback run after every statement
+        
+        Args:
+            hook: Callable(statement, params, elapsed_seconds, rowcount)
+        """
+        if hook not in cls._query_hooks:
+            cls._query_hooks.append(hook)
+    
+    @classmethod
+    def remove_query_hook(cls, hook):
+        """Unregister a query callback"""
+        if hook in cls._query_hooks:
+            cls._query_hooks.remove(hook)
+    
+    @classmethod
+    def add_checkout_hook(cls, hook):
+        """
+        Register a callback run after every pool checkout
+        
+        Args:
+            hook: Callable(wait_seconds)
+        """
+        if hook not in cls._checkout_hooks:
+            cls._checkout_hooks.append(hook)
     
     @classmethod
     def get_connection(cls):
         """Get connection from pool"""
-        if cls._connection_pool is None:
-            cls.initialize_pool()
+        if cls._backend is not None and cls._pool_pid != os.getpid():
+            # Pool was inherited from a parent process (fork); never share it
+            cls.reset_pool()
+
+        if cls._backend is None:
+            cls._create_backend()
         
         try:
-            return cls._connection_pool.get_connection()
-        except Error as e:
+            if not cls._checkout_hooks:
+                return cls._backend.get_connection()
+
+            start = time.perf_counter()
+            connection = cls._backend.get_connection()
+            wait = time.perf_counter() - start
+            for hook in cls._checkout_hooks:
+                hook(wait)
+            return connection
+        except DatabaseError as e:
             print(f"✗ Error getting connection from pool: {e}")
             raise
     
@@ -80,14 +248,20 @@ class Database:
         """
         connection = cls.get_connection()
         cursor = connection.cursor(dictionary=dictionary, buffered=buffered)
+        if cls._query_hooks:
+            cursor = _InstrumentedCursor(cursor, cls._query_hooks)
         
         try:
             yield cursor
             connection.commit()
-        except Error as e:
+        except DatabaseError as e:
             connection.rollback()
             print(f"✗ Database error: {e}")
             raise
+        except Exception:
+            # The caller aborted the unit of work (e.g. an item sold out)
+            connection.rollback()
+            raise
         finally:
             cursor.close()
             connection.close()
@@ -142,7 +316,7 @@ class Database:
                 if result:
                     print("✓ Database connection test successful")
                     return True
-        except Error as e:
+        except DatabaseError as e:
             print(f"✗ Database connection test failed: {e}")
             return False
 
@@ -0,0 +1,328 @@
+"""
+Database backends used by common.database.Database
+
+    MySQLBackend   - mysql.connector connection pool (production, XAMPP)
+    SQLiteBackend  - embedded stand-in for tests and benchmarks
+
+Both hand out connection objects with the mysql.connector surface the app
+uses: cursor(dictionary=, buffered=), commit(), rollback(), and close()
+to return the connection to the pool.
+
+The SQLite backend translates the MySQL dialect the routes use (%s
+placeholders, NOW(), FOR UPDATE, LAST_INSERT_ID(expr)) and creates its schema from
+database/schema_sqlite.sql, a port of schema.sql with the same tables,
+views, triggers and seed data. SQLITE_PATH=':memory:' keeps everything in
+one process-local connection; a file path uses WAL mode with a small pool
+of connections.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from mysql.connector import Error as MySQLError, pooling
+from mysql.connector.constants import ClientFlag
+
+# Exceptions that mean "the statement failed" on any backend
+DatabaseError = (MySQLError, sqlite3.Error)
+
+SQLITE_SCHEMA = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'database', 'schema_sqlite.sql'
+)
+
+
+# ============================================
+# MYSQL
+# ============================================
+
+class MySQLBackend:
+    """
+    mysql.connector pool; its pooled connections already have the expected API
+
+    CLIENT_FOUND_ROWS makes UPDATE row counts count matched rows, as SQLite
+    does, so conditional UPDATEs can be checked by rowcount on both backends.
+    """
+
+    name = 'mysql'
+    explain_prefix = 'EXPLAIN '
+
+    def __init__(self, settings):
+        self.pool = pooling.MySQLConnectionPool(
+            pool_name='food_order_pool',
+            pool_size=settings['DB_POOL_SIZE'],
+            pool_reset_session=True,
+            host=settings['MYSQL_HOST'],
+            user=settings['MYSQL_USER'],
+            password=settings['MYSQL_PASSWORD'],
+            database=settings['MYSQL_DB'],
+            port=settings['MYSQL_PORT'],
+            autocommit=False,
+            client_flags=[ClientFlag.FOUND_ROWS]
+        )
+        print("[OK] Database connection pool initialized")
+
+    def get_connection(self):
+        return self.pool.get_connection()
+
+    def pool_status(self):
+        """Pool size and connections currently checked out"""
+        size = self.pool.pool_size
+        return {'size': size, 'in_use': size - self.pool._cnx_queue.qsize()}
+
+    def dispose(self):
+        self.pool._remove_connections()
+
+
+# ============================================
+# SQLITE
+# ============================================
+
+_PLACEHOLDER = re.compile(r"%s")
+_NAMED_PLACEHOLDER = re.compile(r"%\((\w+)\)s")
+_NOW = re.compile(r"\b(?:NOW|CURRENT_TIMESTAMP)\s*\(\s*\)", re.IGNORECASE)
+_CURDATE = re.compile(r"\bCURDATE\s*\(\s*\)", re.IGNORECASE)
+_FOR_UPDATE = re.compile(r"\s+FOR\s+UPDATE\b", re.IGNORECASE)
+_READ_ONLY = ('SELECT', 'WITH', 'EXPLAIN', 'PRAGMA')
+
+
+@lru_cache(maxsize=1024)
+def translate(statement):
+    """
+    Rewrite a MySQL-dialect statement for SQLite
+
+    Returns:
+        Tuple of (sqlite_statement, needs_write_lock)
+    """
+    locking = bool(_FOR_UPDATE.search(statement))
+    statement = _FOR_UPDATE.sub('', statement)
+    statement = _NAMED_PLACEHOLDER.sub(r':\1', statement)
+    statement = _PLACEHOLDER.sub('?', statement)
+    statement = _NOW.sub("datetime('now', 'localtime')", statement)
+    statement = _CURDATE.sub("date('now', 'localtime')", statement)
+    statement = statement.replace('%%', '%')
+    writes = locking or not statement.lstrip().upper().startswith(_READ_ONLY)
+    return statement, writes
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def _to_decimal(value):
+    # Every DECIMAL column in the schema has two decimal places
+    return Decimal(value.decode()).quantize(Decimal('0.01'))
+
+
+def _to_datetime(value):
+    return datetime.fromisoformat(value.decode())
+
+
+# Return DECIMAL and TIMESTAMP columns as Decimal/datetime like mysql.connector does
+sqlite3.register_converter('DECIMAL', _to_decimal)
+sqlite3.register_converter('TIMESTAMP', _to_datetime)
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+
+
+class SQLiteCursor:
+    """sqlite3 cursor with mysql.connector's paramstyle and dictionary rows"""
+
+    def __init__(self, connection, dictionary=True):
+        self._connection = connection
+        self._cursor = connection.raw.cursor()
+        self._insert_id = None
+        if dictionary:
+            self._cursor.row_factory = _dict_row
+
+    def execute(self, operation, params=()):
+        statement, writes = translate(operation)
+        self._connection.begin(writes)
+        self._connection.insert_id = None
+        self._cursor.execute(statement, params or ())
+        self._insert_id = self._connection.insert_id
+
+    def executemany(self, operation, seq_params):
+        statement, writes = translate(operation)
+        self._connection.begin(writes)
+        self._cursor.executemany(statement, seq_params)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size=1):
+        return self._cursor.fetchmany(size)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        # Like mysql.connector: the value given to LAST_INSERT_ID(expr), if the statement did
+        return self._cursor.lastrowid if self._insert_id is None else self._insert_id
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+class SQLiteConnection:
+    """
+    Pooled sqlite3 connection
+
+    The raw connection runs in autocommit mode. Reads outside a transaction
+    see the latest committed data (like READ COMMITTED); the first write or
+    SELECT ... FOR UPDATE opens a BEGIN IMMEDIATE transaction, which takes
+    SQLite's single write lock for the rest of the unit of work.
+    """
+
+    def __init__(self, backend, raw):
+        self.backend = backend
+        self.raw = raw
+        self.depth = 0
+        self.insert_id = None
+        raw.create_function('LAST_INSERT_ID', 1, self._last_insert_id)
+
+    def _last_insert_id(self, value):
+        """MySQL's LAST_INSERT_ID(expr): returns expr and reports it as the cursor's lastrowid"""
+        self.insert_id = value
+        return value
+
+    def begin(self, writes):
+        if writes and not self.raw.in_transaction:
+            self.raw.execute('BEGIN IMMEDIATE')
+
+    def cursor(self, dictionary=True, buffered=True):
+        return SQLiteCursor(self, dictionary)
+
+    def commit(self):
+        if self.raw.in_transaction:
+            self.raw.commit()
+
+    def rollback(self):
+        if self.raw.in_transaction:
+            self.raw.rollback()
+
+    def close(self):
+        """Return the connection to the backend (uncommitted work is rolled back)"""
+        self.backend.release(self)
+
+
+class SQLiteBackend:
+    """Embedded SQLite database: in-memory (one shared connection) or file-backed (WAL)"""
+
+    name = 'sqlite'
+    explain_prefix = 'EXPLAIN QUERY PLAN '
+
+    def __init__(self, settings):
+        self.path = settings['SQLITE_PATH']
+        self.memory = self.path == ':memory:'
+        self.pool_size = settings['DB_POOL_SIZE']
+        self._lock = threading.Lock()
+        self._idle = []
+        self._all = []
+
+        if self.memory:
+            # One connection serves every thread; a re-entrant lock serializes units of work
+            self._shared = SQLiteConnection(self, self._connect())
+            self._shared_lock = threading.RLock()
+            self._ensure_schema(self._shared.raw)
+        else:
+            connection = self.get_connection()
+            self._ensure_schema(connection.raw)
+            connection.close()
+        print(f"[OK] SQLite database ready ({self.path})")
+
+    def _connect(self):
+        raw = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
+                              isolation_level=None, check_same_thread=False, timeout=10)
+        raw.execute('PRAGMA foreign_keys = ON')
+        if not self.memory:
+            raw.execute('PRAGMA journal_mode = WAL')
+            raw.execute('PRAGMA synchronous = NORMAL')
+        with self._lock:
+            self._all.append(raw)
+        return raw
+
+    def _ensure_schema(self, raw):
+        exists = raw.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'"
+        ).fetchone()
+        if not exists:
+            with open(SQLITE_SCHEMA, 'r', encoding='utf-8') as file:
+                raw.executescript(file.read())
+
+    def get_connection(self):
+        if self.memory:
+            self._shared_lock.acquire()
+            self._shared.depth += 1
+            return self._shared
+
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            connection = SQLiteConnection(self, self._connect())
+        connection.depth = 1
+        return connection
+
+    def release(self, connection):
+        connection.depth -= 1
+        if connection.depth == 0:
+            connection.rollback()
+
+        if self.memory:
+            self._shared_lock.release()
+            return
+
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(connection)
+                return
+            self._all.remove(connection.raw)
+        connection.raw.close()
+
+    def pool_status(self):
+        """Pool size and connections currently checked out"""
+        if self.memory:
+            return {'size': 1, 'in_use': 1 if self._shared.depth else 0}
+        with self._lock:
+            return {'size': self.pool_size, 'in_use': len(self._all) - len(self._idle)}
+
+    def dispose(self):
+        with self._lock:
+            connections, self._all, self._idle = self._all, [], []
+        for raw in connections:
+            raw.close()
+
+
+# ============================================
+# FACTORY
+# ============================================
+
+BACKENDS = {
+    'mysql': MySQLBackend,
+    'sqlite': SQLiteBackend,
+}
+
+
+def create_backend(settings):
+    """Instantiate the backend named by settings['DB_BACKEND']"""
+    name = (settings.get('DB_BACKEND') or 'mysql').lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown DB_BACKEND '{name}' (expected one of: {', '.join(BACKENDS)})")
+    return BACKENDS[name](settings)
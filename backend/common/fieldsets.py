@@ -0,0 +1,134 @@
+"""
+Sparse fieldsets and expansions for list endpoints
+
+List endpoints accept the same two query parameters:
+
+    ?fields=id,order_number,status      columns to return (default: all)
+    ?fields=id,items.item_name          dotted names pick columns of an
+                                        expansion (and request it)
+    ?expand=items                       run the hydration query for items
+    ?expand=                            headers only, skip hydration
+
+The selection decides the SQL, not just the JSON: only the chosen columns
+are selected, joins are added only when a chosen column needs them, and an
+expansion that was not requested never runs its query. Columns the endpoint
+needs internally (ids, the sort key) are always selected.
+
+Usage:
+    ORDER_FIELDS = FieldSet(
+        columns={'id': ('o.id', None), 'customer_name': ('u.username', 'users')},
+        joins={'users': 'JOIN users u ON o.user_id = u.id'},
+        required=('id',),
+    )
+    selection = ORDER_FIELDS.parse(request.args)    # raises FieldSetError
+    sql = f"SELECT {selection.columns_sql()} FROM orders o {selection.joins_sql()}"
+"""
+
+
+class FieldSetError(ValueError):
+    """Unknown field or expansion in the query string (respond with 400)"""
+
+
+class Selection:
+    """Fields and expansions chosen for one request"""
+
+    def __init__(self, fieldset, fields, expand):
+        self.fieldset = fieldset
+        self.fields = fields
+        self.expand = expand
+
+    def columns_sql(self):
+        """`expression as name` list for the SELECT clause"""
+        columns = self.fieldset.columns
+        return ', '.join(f"{columns[name][0]} as {name}" for name in self.fields)
+
+    def joins_sql(self):
+        """JOIN clauses needed by the selected columns, in declaration order"""
+        needed = {self.fieldset.columns[name][1] for name in self.fields}
+        return ''.join(f"\n            {sql}" for join, sql in self.fieldset.joins.items()
+                       if join in needed)
+
+    def expands(self, name):
+        return name in self.expand
+
+    def __getitem__(self, name):
+        """Selection of an expansion's own columns"""
+        return self.expand[name]
+
+
+class FieldSet:
+    """
+    Columns an endpoint can return
+
+    Args:
+        columns: Dict of field name -> (SQL expression, join name or None)
+        joins: Dict of join name -> JOIN clause
+        required: Fields always selected (ids, sort keys)
+        expandable: Dict of expansion name -> FieldSet of its columns
+        default_expand: Expansions used when ?expand= is absent
+    """
+
+    def __init__(self, columns, joins=None, required=(), expandable=None, default_expand=()):
+        self.columns = columns
+        self.joins = joins or {}
+        self.required = required
+        self.expandable = expandable or {}
+        self.default_expand = default_expand
+
+    def all(self, expand=None):
+        """Every column, with the default (or given) expansions"""
+        expand = self.default_expand if expand is None else expand
+        return Selection(self, list(self.columns),
+                         {name: self.expandable[name].all() for name in expand})
+
+    def parse(self, args):
+        """
+        Build a Selection from request.args
+
+        Raises:
+            FieldSetError: Unknown field or expansion name
+        """
+        requested = _split(args.get('fields'))
+        if 'expand' in args:
+            expand = _split(args.get('expand')) or []
+        else:
+            expand = list(self.default_expand)
+
+        top = []
+        nested = {}
+        for name in requested or []:
+            prefix, dot, field = name.partition('.')
+            if dot:
+                nested.setdefault(prefix, []).append(field)
+                if prefix not in expand:
+                    expand.append(prefix)
+            else:
+                top.append(name)
+
+        unknown_expand = [name for name in expand if name not in self.expandable]
+        if unknown_expand:
+            raise FieldSetError(f"Unknown expand: {', '.join(unknown_expand)}. "
+                                f"Allowed: {', '.join(self.expandable) or 'none'}")
+
+        expanded = {}
+        for name in expand:
+            child = self.expandable[name]
+            expanded[name] = (Selection(child, child._select(nested[name], name + '.'), {})
+                              if name in nested else child.all())
+
+        fields = self._select(top, '') if requested else list(self.columns)
+        return Selection(self, fields, expanded)
+
+    def _select(self, names, prefix):
+        unknown = [name for name in names if name not in self.columns]
+        if unknown:
+            raise FieldSetError(f"Unknown field(s): {', '.join(prefix + name for name in unknown)}")
+        wanted = set(names) | set(self.required)
+        # Keep declaration order so responses look the same however fields= is written
+        return [name for name in self.columns if name in wanted]
+
+
+def _split(value):
+    if value is None:
+        return None
+    return [part.strip() for part in value.split(',') if part.strip()]
@@ -0,0 +1,134 @@
+"""
+Liveness and readiness endpoints
+
+    GET /api/health/live   - the process answers; no I/O at all
+    GET /api/health/ready  - the database answers; also reports pool
+                             saturation, cache warm state and background
+                             worker threads
+    GET /api/health        - original endpoint, now backed by the same
+                             cached probe
+
+The database probe (SELECT 1) runs at most once per HEALTH_DB_CHECK_INTERVAL
+seconds per process. Probes in between reuse the last result, so a
+load balancer polling every second does not take a pooled connection each
+time. When the cached result is stale, one request re-probes and the
+others keep answering from the previous result.
+"""
+
+import threading
+import time
+from flask import jsonify
+
+from .activity_log import activity_logger
+from .database import Database
+from .db_backends import DatabaseError
+from .sessions import session_store
+from .warmup import warmup
+
+# name -> callback() returning a dict with at least 'warm' (see register_cache_health)
+_cache_checks = {}
+
+
+class DatabaseProbe:
+    """SELECT 1 against the pool, cached for `interval` seconds"""
+
+    def __init__(self, interval=5.0):
+        self.interval = interval
+        self.ok = None
+        self.error = None
+        self.latency_ms = None
+        self.checked_at = None
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Return the cached result, re-probing once it is older than interval"""
+        now = time.monotonic()
+        stale = self.checked_at is None or now - self.checked_at >= self.interval
+        if stale and self._lock.acquire(blocking=self.checked_at is None):
+            try:
+                self._probe()
+            finally:
+                self._lock.release()
+        return self.result()
+
+    def _probe(self):
+        start = time.perf_counter()
+        try:
+            with Database.get_cursor(dictionary=False) as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            self.ok, self.error = True, None
+        except DatabaseError as e:
+            self.ok, self.error = False, str(e)
+        self.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        self.checked_at = time.monotonic()
+
+    def result(self):
+        return {
+            'ok': bool(self.ok),
+            'error': self.error,
+            'latency_ms': self.latency_ms,
+            'age_seconds': (round(time.monotonic() - self.checked_at, 2)
+                            if self.checked_at is not None else None),
+        }
+
+
+# Process-wide probe
+db_probe = DatabaseProbe()
+
+
+def register_cache_health(name, callback):
+    """Report a cache in /api/health/ready; callback() returns e.g. {'warm': True, 'entries': 3}"""
+    _cache_checks[name] = callback
+
+
+def readiness():
+    """
+    Build the readiness report
+
+    Returns:
+        Tuple of (report dict, ready bool) - ready means the database answered
+    """
+    database = db_probe.check()
+    caches = {'sessions': {'warm': True, 'entries': len(session_store.cache)}}
+    for name, callback in _cache_checks.items():
+        caches[name] = callback()
+
+    report = {
+        'status': 'ready' if database['ok'] else 'not_ready',
+        'database': database,
+        'pool': Database.pool_status(),
+        'caches': caches,
+        'workers': {
+            'warmup': warmup.stats(),
+            'activity_log_flusher': activity_logger.worker_state(),
+            'session_sweeper': session_store.worker_state(),
+        },
+    }
+    return report, database['ok']
+
+
+def init_health(app):
+    """Register the health endpoints; HEALTH_DB_CHECK_INTERVAL sets the probe cache"""
+    db_probe.interval = app.config.get('HEALTH_DB_CHECK_INTERVAL', 5)
+
+    @app.route('/api/health/live', methods=['GET'])
+    def health_live():
+        """Liveness: the process is up and serving requests"""
+        return jsonify({'status': 'alive'}), 200
+
+    @app.route('/api/health/ready', methods=['GET'])
+    def health_ready():
+        """Readiness: safe to route traffic here"""
+        report, ready = readiness()
+        return jsonify(report), 200 if ready else 503
+
+    @app.route('/api/health', methods=['GET'])
+    def health_check():
+        """Health check endpoint"""
+        database = db_probe.check()
+        return jsonify({
+            'status': 'healthy' if database['ok'] else 'unhealthy',
+            'database': 'connected' if database['ok'] else 'disconnected',
+            'message': 'Food Ordering System API is running'
+        }), 200 if database['ok'] else 503
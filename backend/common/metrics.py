@@ -0,0 +1,234 @@
+"""
+Request and database metrics exposed in Prometheus text format
+
+Usage:
+    from common.metrics import init_metrics
+    init_metrics(app)   # records every request, serves GET /metrics
+
+Each process keeps its own registry; under gunicorn every worker reports
+its own numbers, so scrape each worker or aggregate at the collector.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from flask import g, request, has_request_context, Response
+
+from .database import Database
+
+
+# Latency buckets in seconds (Prometheus defaults, plus a sub-millisecond bucket)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Response payload buckets in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# Statements per request
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+
+class Histogram:
+    """Fixed-bucket histogram (not thread-safe; guarded by the registry lock)"""
+
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """In-process registry of counters, gauges and histograms keyed by label values"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help = {}
+        self._types = {}
+        self._counters = {}
+        self._histograms = {}
+        self._gauge_callbacks = {}
+
+    def counter(self, name, help_text):
+        self._help[name] = help_text
+        self._types[name] = 'counter'
+
+    def histogram(self, name, help_text, buckets):
+        self._help[name] = help_text
+        self._types[name] = ('histogram', buckets)
+
+    def gauge_callback(self, name, help_text, callback):
+        """Register a gauge whose value is read from callback() at scrape time"""
+        self._help[name] = help_text
+        self._types[name] = 'gauge'
+        self._gauge_callbacks[name] = callback
+
+    def inc(self, name, labels=(), amount=1):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._types[name][1])
+            histogram.observe(value)
+
+    def record_request(self, labels, status_labels, duration, size, queries, db_time):
+        """Record all per-request series under a single lock acquisition"""
+        with self._lock:
+            key = ('http_requests_total', status_labels)
+            self._counters[key] = self._counters.get(key, 0) + 1
+            for name, value in (('http_request_duration_seconds', duration),
+                                ('http_response_size_bytes', size),
+                                ('db_queries_per_request', queries),
+                                ('db_time_per_request_seconds', db_time)):
+                histogram = self._histograms.get((name, labels))
+                if histogram is None:
+                    histogram = self._histograms[(name, labels)] = Histogram(self._types[name][1])
+                histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self):
+        """Render all series in Prometheus text exposition format"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(h.counts), h.total, h.count)
+                          for key, h in self._histograms.items()}
+
+        lines = []
+        for name, kind in self._types.items():
+            kind_name = kind[0] if isinstance(kind, tuple) else kind
+            lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind_name}")
+
+            if kind_name == 'counter':
+                for (series, labels), value in counters.items():
+                    if series == name:
+                        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+            elif kind_name == 'gauge':
+                try:
+                    value = self._gauge_callbacks[name]()
+                except Exception:
+                    continue
+                lines.append(f"{name} {value}")
+
+            else:
+                buckets = kind[1]
+                for (series, labels), (counts, total, count) in histograms.items():
+                    if series != name:
+                        continue
+                    cumulative = 0
+                    for bound, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        le = labels + (('le', _format_number(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(le)} {cumulative}")
+                    le = labels + (('le', '+Inf'),)
+                    lines.append(f"{name}_bucket{_format_labels(le)} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = []
+    for key, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+metrics.counter('http_requests_total',
+                'HTTP requests by blueprint, endpoint, method and status code')
+metrics.histogram('http_request_duration_seconds',
+                  'Request latency in seconds', LATENCY_BUCKETS)
+metrics.histogram('http_response_size_bytes',
+                  'Response payload size in bytes', SIZE_BUCKETS)
+metrics.histogram('db_queries_per_request',
+                  'SQL statements executed per request', QUERY_COUNT_BUCKETS)
+metrics.histogram('db_time_per_request_seconds',
+                  'Time spent in SQL statements per request', LATENCY_BUCKETS)
+metrics.counter('db_queries_total',
+                'SQL statements executed (including outside requests)')
+metrics.histogram('db_pool_wait_seconds',
+                  'Time spent waiting for a pooled connection', LATENCY_BUCKETS)
+
+
+# ============================================
+# DATABASE HOOKS
+# ============================================
+
+def _on_query(statement, params, elapsed, rowcount):
+    """Accumulate per-request statement count and time on flask.g"""
+    metrics.inc('db_queries_total')
+    if has_request_context():
+        g.db_query_count = g.get('db_query_count', 0) + 1
+        g.db_query_time = g.get('db_query_time', 0.0) + elapsed
+
+
+def _on_checkout(wait):
+    metrics.observe('db_pool_wait_seconds', (), wait)
+
+
+# ============================================
+# FLASK INTEGRATION
+# ============================================
+
+def init_metrics(app):
+    """Register request hooks, database hooks and the /metrics endpoint"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    Database.add_query_hook(_on_query)
+    Database.add_checkout_hook(_on_checkout)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+        g.db_query_count = 0
+        g.db_query_time = 0.0
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get('request_started')
+        if started is None:
+            return response
+
+        duration = time.perf_counter() - started
+        blueprint = request.blueprint or ''
+        endpoint = request.endpoint or 'unmatched'
+        labels = (('blueprint', blueprint), ('endpoint', endpoint))
+        status_labels = labels + (('method', request.method),
+                                  ('status', str(response.status_code)))
+        size = response.calculate_content_length() or 0
+
+        metrics.record_request(labels, status_labels, duration, size,
+                               g.get('db_query_count', 0), g.get('db_query_time', 0.0))
+        return response
+
+    @app.route(app.config.get('METRICS_PATH', '/metrics'), methods=['GET'])
+    def prometheus_metrics():
+        """Prometheus scrape endpoint"""
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
@@ -8,6 +8,10 @@ import jwt
 from datetime import datetime, timedelta
 
 
+# WSGI environ key holding (token, payload) once a request's token is decoded
+TOKEN_PAYLOAD_KEY = 'food_order.token_payload'
+
+
 def get_token_from_request():
     """Extract JWT token from Authorization header"""
     auth_header = request.headers.get('Authorization')
@@ -17,18 +21,30 @@ def get_token_from_request():
 
 
 def decode_token(token):
-    """Decode and validate JWT token"""
+    """
+    Decode and validate JWT token
+
+    The result is remembered on the request, so routes and decorators that
+    decode the same token (and /api/batch sub-requests) verify it only once.
+    """
+    cached = request.environ.get(TOKEN_PAYLOAD_KEY) if request else None
+    if cached and cached[0] == token:
+        return cached[1]
+
     try:
         payload = jwt.decode(
             token,
             current_app.config['SECRET_KEY'],
             algorithms=['HS256']
         )
-        return payload
     except jwt.ExpiredSignatureError:
-        return None
+        payload = None
     except jwt.InvalidTokenError:
-        return None
+        payload = None
+
+    if request:
+        request.environ[TOKEN_PAYLOAD_KEY] = (token, payload)
+    return payload
 
 
 def login_required(f):
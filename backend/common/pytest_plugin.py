@@ -0,0 +1,146 @@
+"""
+Pytest plugin - SQL query budgets and N+1 detection
+
+Enable it from a conftest.py in the backend directory:
+
+    pytest_plugins = ['common.pytest_plugin']
+
+Fixture (explicit budget around a block):
+
+    def test_menu(client, query_budget):
+        with query_budget(1):
+            client.get('/api/order/menu')
+
+        with query_budget(3, endpoint='order.place_order'):
+            client.post('/api/order/place', json=...)
+
+Marker (budget for every request the test makes, per endpoint if given):
+
+    @pytest.mark.query_budget(2, endpoint='order.get_my_orders')
+    def test_my_orders(client): ...
+
+Any N+1 detected by the query guard fails the test, even when the route
+catches the NPlusOneError and turns it into a 500. Opt out with
+@pytest.mark.allow_n_plus_one.
+"""
+
+from contextlib import contextmanager
+from itertools import count
+import pytest
+from flask import has_request_context, request
+
+from .database import Database
+from .query_guard import query_guard
+from .query_trace import normalize_sql, current_route
+
+
+class QueryRecorder:
+    """Records every statement with the request and endpoint that ran it"""
+
+    def __init__(self):
+        self.statements = []
+        self._sequence = count(1)
+
+    def __call__(self, statement, params, elapsed, rowcount):
+        if has_request_context():
+            # Tag the WSGI environ so each request is counted separately
+            request_key = request.environ.get('query_budget.request')
+            if request_key is None:
+                request_key = request.environ['query_budget.request'] = next(self._sequence)
+            endpoint = current_route()
+        else:
+            request_key = None
+            endpoint = 'background'
+        self.statements.append((request_key, endpoint, normalize_sql(statement)))
+
+    def per_request(self, endpoint=None):
+        """List of (endpoint, statement count) for each request seen"""
+        counts = {}
+        for request_key, statement_endpoint, _ in self.statements:
+            if request_key is None:
+                continue
+            if endpoint and statement_endpoint != endpoint:
+                continue
+            key = (request_key, statement_endpoint)
+            counts[key] = counts.get(key, 0) + 1
+        return [(ep, total) for (_, ep), total in counts.items()]
+
+    def describe(self, endpoint=None):
+        lines = [f"  [{ep}] {shape}" for _, ep, shape in self.statements
+                 if not endpoint or ep == endpoint]
+        return '\n'.join(lines)
+
+
+def _check_budget(recorder, max_queries, endpoint=None):
+    for ep, total in recorder.per_request(endpoint):
+        if total > max_queries:
+            pytest.fail(
+                f"Query budget exceeded for {ep}: {total} statements "
+                f"(budget {max_queries})\n{recorder.describe(ep)}",
+                pytrace=False
+            )
+
+
+@contextmanager
+def _recording():
+    recorder = QueryRecorder()
+    Database.add_query_hook(recorder)
+    try:
+        yield recorder
+    finally:
+        Database.remove_query_hook(recorder)
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager asserting a maximum number of statements per request"""
+    @contextmanager
+    def budget(max_queries, endpoint=None):
+        with _recording() as recorder:
+            yield recorder
+        _check_budget(recorder, max_queries, endpoint)
+    return budget
+
+
+@pytest.fixture(autouse=True)
+def _query_budget_marker(request):
+    """Apply @pytest.mark.query_budget and fail on detected N+1 patterns"""
+    marker = request.node.get_closest_marker('query_budget')
+    check_n_plus_one = request.node.get_closest_marker('allow_n_plus_one') is None
+
+    query_guard.install()
+    raise_errors = query_guard.raise_errors
+    query_guard.raise_errors = check_n_plus_one
+    query_guard.clear()
+
+    try:
+        if marker is None:
+            yield
+        else:
+            max_queries = marker.args[0] if marker.args else marker.kwargs['max_queries']
+            endpoint = marker.kwargs.get('endpoint')
+            with _recording() as recorder:
+                yield
+            _check_budget(recorder, max_queries, endpoint)
+
+        if check_n_plus_one and query_guard.violations:
+            details = '\n'.join(
+                f"  {v['route']} at {v['call_site']}: {v['statement']}"
+                for v in query_guard.violations
+            )
+            query_guard.clear()
+            pytest.fail(f"N+1 query pattern detected:\n{details}", pytrace=False)
+    finally:
+        # Leave the app's own setting (N_PLUS_ONE_RAISE) for the next test
+        query_guard.raise_errors = raise_errors
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'query_budget(max_queries, endpoint=None): fail if a request runs more SQL statements'
+    )
+    config.addinivalue_line(
+        'markers',
+        'allow_n_plus_one: do not fail the test on repeated-statement (N+1) warnings'
+    )
@@ -0,0 +1,116 @@
+"""
+N+1 query detector for development and test runs
+
+Counts identical (normalized) statements per request. When one statement
+shape runs more than N_PLUS_ONE_THRESHOLD times in a single request the
+guard logs a warning naming the route and the call site - or raises
+NPlusOneError when N_PLUS_ONE_RAISE is set (the testing config does).
+
+Enabled automatically in debug and testing configs; see also
+common/pytest_plugin.py for per-endpoint query budgets in tests.
+"""
+
+import logging
+import os
+import threading
+import traceback
+from collections import deque
+from flask import g, has_request_context
+
+from .database import Database
+from .query_trace import normalize_sql, current_route
+
+logger = logging.getLogger('food_ordering.n_plus_one')
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# Most recent violations kept for inspection (tests, debugging); older ones are dropped
+VIOLATIONS_KEPT = 100
+
+
+class NPlusOneError(Exception):
+    """Raised when a request repeats one statement shape past the threshold"""
+
+
+def find_call_site():
+    """Innermost application frame (outside common/ and third-party code)"""
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(_BACKEND_DIR) and not filename.startswith(_COMMON_DIR):
+            return f"{os.path.relpath(filename, _BACKEND_DIR)}:{frame.lineno} in {frame.name}"
+    return 'unknown'
+
+
+class QueryGuard:
+    """Per-request repeated-statement detector"""
+
+    def __init__(self):
+        self.threshold = 5
+        self.raise_errors = False
+        self.installed = False
+        self._lock = threading.Lock()
+        self.violations = deque(maxlen=VIOLATIONS_KEPT)
+
+    def configure(self, config):
+        self.threshold = config.get('N_PLUS_ONE_THRESHOLD', 5)
+        self.raise_errors = bool(config.get('N_PLUS_ONE_RAISE', False))
+
+    def install(self):
+        if not self.installed:
+            Database.add_query_hook(self.on_query)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            Database.remove_query_hook(self.on_query)
+            self.installed = False
+
+    def on_query(self, statement, params, elapsed, rowcount):
+        """Database query hook"""
+        if not has_request_context():
+            return
+
+        shape = normalize_sql(statement)
+        counts = g.get('query_shape_counts')
+        if counts is None:
+            counts = g.query_shape_counts = {}
+        count = counts[shape] = counts.get(shape, 0) + 1
+
+        # Report once per shape per request, on the first call past the threshold
+        if count != self.threshold + 1:
+            return
+
+        violation = {
+            'route': current_route(),
+            'call_site': find_call_site(),
+            'statement': shape,
+            'threshold': self.threshold
+        }
+        with self._lock:
+            self.violations.append(violation)
+
+        message = (f"Possible N+1: statement ran more than {self.threshold} times "
+                   f"in {violation['route']} ({violation['call_site']}): {shape}")
+        if self.raise_errors:
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+    def clear(self):
+        with self._lock:
+            self.violations.clear()
+
+
+# Process-wide guard
+query_guard = QueryGuard()
+
+
+def init_query_guard(app):
+    """Install the guard for debug/testing apps (or when N_PLUS_ONE_GUARD is set)"""
+    query_guard.configure(app.config)
+    enabled = app.config.get('N_PLUS_ONE_GUARD')
+    if enabled is None:
+        enabled = app.debug or app.testing
+    if enabled:
+        query_guard.install()
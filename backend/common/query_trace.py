@@ -0,0 +1,197 @@
+"""
+Query-level tracing and slow-query log
+
+Opt-in (SQL_TRACE_ENABLED). Every statement run through Database is
+normalized (literals stripped), tagged with the calling route and
+aggregated by total time. Statements slower than SLOW_QUERY_THRESHOLD_MS
+are logged with their EXPLAIN plan. The aggregate is served to admins at
+GET /api/admin/queries.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from flask import g, request, has_request_context
+
+from .database import Database
+
+logger = logging.getLogger('food_ordering.slow_query')
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement):
+    """
+    Reduce a statement to its shape: literals and placeholders become '?',
+    IN lists and multi-row VALUES collapse, whitespace is squeezed
+
+    Example:
+        >>> normalize_sql("SELECT * FROM t WHERE id IN (%s, %s) AND name = 'x'")
+        'SELECT * FROM t WHERE id IN (...) AND name = ?'
+    """
+    if isinstance(statement, bytes):
+        statement = statement.decode('utf-8', 'replace')
+    statement = _STRING_LITERAL.sub('?', statement)
+    statement = _PLACEHOLDER.sub('?', statement)
+    statement = _NUMBER_LITERAL.sub('?', statement)
+    statement = _IN_LIST.sub('IN (...)', statement)
+    statement = _VALUES_LIST.sub('), ...', statement)
+    return _WHITESPACE.sub(' ', statement).strip()
+
+
+def current_route():
+    """Endpoint name of the active request, or 'background' outside requests"""
+    if has_request_context():
+        return request.endpoint or 'unmatched'
+    return 'background'
+
+
+class QueryTracer:
+    """Aggregates per-statement timings and keeps a bounded slow-query log"""
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = 0.1
+        self.top_n = 20
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._slow = deque(maxlen=100)
+        self._local = threading.local()
+        self.started_at = time.time()
+
+    def configure(self, config):
+        self.threshold = config.get('SLOW_QUERY_THRESHOLD_MS', 100) / 1000.0
+        self.top_n = config.get('SQL_TRACE_TOP_N', 20)
+        self._slow = deque(self._slow, maxlen=config.get('SQL_SLOW_LOG_SIZE', 100))
+
+    # ------------------------------------------
+    # Recording
+    # ------------------------------------------
+
+    def on_query(self, statement, params, elapsed, rowcount):
+        """Database query hook"""
+        if getattr(self._local, 'suppressed', False):
+            return
+
+        shape = normalize_sql(statement)
+        route = current_route()
+        rows = rowcount if rowcount and rowcount > 0 else 0
+
+        with self._lock:
+            entry = self._stats.get(shape)
+            if entry is None:
+                entry = self._stats[shape] = {
+                    'count': 0, 'total_time': 0.0, 'max_time': 0.0,
+                    'rows': 0, 'routes': {}
+                }
+            entry['count'] += 1
+            entry['total_time'] += elapsed
+            entry['rows'] += rows
+            if elapsed > entry['max_time']:
+                entry['max_time'] = elapsed
+            entry['routes'][route] = entry['routes'].get(route, 0) + 1
+
+        if elapsed >= self.threshold:
+            slow = {
+                'statement': shape,
+                'route': route,
+                'duration_ms': round(elapsed * 1000, 3),
+                'rows': rows,
+                'at': time.time(),
+                'plan': None
+            }
+            if has_request_context():
+                # EXPLAIN once the request has released its connection
+                g.setdefault('slow_queries', []).append((slow, statement, params))
+            else:
+                self._finish_slow(slow, statement, params)
+
+    def flush_request(self, exc=None):
+        """teardown_request: explain and log the slow statements of this request"""
+        for slow, statement, params in g.pop('slow_queries', []):
+            self._finish_slow(slow, statement, params)
+
+    def _finish_slow(self, slow, statement, params):
+        slow['plan'] = self.explain(statement, params)
+        with self._lock:
+            self._slow.append(slow)
+        logger.warning(
+            "Slow query %.1f ms (%s rows) in %s: %s | plan: %s",
+            slow['duration_ms'], slow['rows'], slow['route'], slow['statement'], slow['plan']
+        )
+
+    def explain(self, statement, params):
+        """Run EXPLAIN for a SELECT without tracing the EXPLAIN itself"""
+        if isinstance(statement, bytes):
+            statement = statement.decode('utf-8', 'replace')
+        if not statement.lstrip().upper().startswith('SELECT'):
+            return None
+        if params and isinstance(params, (list, tuple)) and isinstance(params[0], (list, tuple)):
+            return None  # executemany parameter sets
+
+        self._local.suppressed = True
+        try:
+            prefix = Database.get_backend().explain_prefix
+            return Database.execute_query(prefix + statement, params, fetch_all=True)
+        except Exception as e:
+            return [{'error': str(e)}]
+        finally:
+            self._local.suppressed = False
+
+    # ------------------------------------------
+    # Reporting
+    # ------------------------------------------
+
+    def top(self, limit=None):
+        """Statement shapes ordered by total time"""
+        limit = limit or self.top_n
+        with self._lock:
+            rows = [
+                {
+                    'statement': shape,
+                    'count': entry['count'],
+                    'total_ms': round(entry['total_time'] * 1000, 3),
+                    'avg_ms': round(entry['total_time'] * 1000 / entry['count'], 3),
+                    'max_ms': round(entry['max_time'] * 1000, 3),
+                    'rows': entry['rows'],
+                    'routes': dict(entry['routes'])
+                }
+                for shape, entry in self._stats.items()
+            ]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows[:limit]
+
+    def slow_queries(self, limit=None):
+        """Most recent slow statements, newest first"""
+        with self._lock:
+            entries = list(self._slow)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+        self.started_at = time.time()
+
+
+# Process-wide tracer
+query_tracer = QueryTracer()
+
+
+def init_query_trace(app):
+    """Enable tracing when SQL_TRACE_ENABLED is set"""
+    query_tracer.configure(app.config)
+    if not app.config.get('SQL_TRACE_ENABLED'):
+        return
+
+    query_tracer.enabled = True
+    Database.add_query_hook(query_tracer.on_query)
+    app.teardown_request(query_tracer.flush_request)
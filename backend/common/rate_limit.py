@@ -0,0 +1,234 @@
+"""
+Token-bucket rate limiting for the login endpoints
+
+Each login attempt takes one token from two buckets: one keyed by client
+IP (credential stuffing from one host) and one keyed by the login
+identifier (many hosts guessing one account). A bucket holds up to
+`burst` tokens and refills at `per_minute` tokens a minute. An empty
+bucket rejects the request with 429 before any query or password hash
+runs.
+
+A successful login gives its identifier token back, so only failed
+attempts drain an account's bucket and its owner logging in (or a client
+re-authenticating) never locks it. The IP token is kept either way: the
+password hash ran. The trade-off of per-account buckets remains: someone
+who knows a username or email and keeps failing logins for it, even at
+the refill rate, keeps that bucket empty, and the owner gets 429 too for
+as long as they do. That is the price of stopping a distributed guess
+against one account; loosen LOGIN_RATE_LIMIT_ID_* if lockouts matter more.
+
+Buckets live in a MemoryBucketStore by default: a bounded LRU map, O(1) per
+check, private to each process. With several gunicorn workers each worker
+has its own buckets, so the effective limit is multiplied by the worker
+count. Point RATE_LIMIT_STORAGE_URL at Redis (redis://host:6379/0, needs
+`pip install redis`) to share buckets between processes and hosts.
+
+Usage:
+    from common.rate_limit import login_rate_limited
+
+    @user_bp.route('/login', methods=['POST'])
+    @login_rate_limited
+    def login(): ...
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import request, jsonify, make_response
+
+from .metrics import metrics
+
+
+# ============================================
+# BUCKET STORES
+# ============================================
+
+class MemoryBucketStore:
+    """In-process token buckets; least recently used keys are evicted past max_keys"""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, burst, rate):
+        """
+        Take one token from a bucket
+
+        Args:
+            rate: Tokens added per second
+
+        Returns:
+            Tuple of (allowed, retry_after_seconds)
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                # An evicted key starts again with a full bucket
+                self._buckets.popitem(last=False)
+        return retry_after == 0.0, retry_after
+
+    def refund(self, key, burst):
+        """Give one token back to a bucket (capped at burst)"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = (min(burst, bucket[0] + 1), bucket[1])
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class RedisBucketStore:
+    """Token buckets shared through Redis; refill and take run atomically in Lua"""
+
+    SCRIPT = """
+        local burst = tonumber(ARGV[1])
+        local rate = tonumber(ARGV[2])
+        local now = tonumber(ARGV[3])
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+        local tokens = tonumber(bucket[1]) or burst
+        local updated = tonumber(bucket[2]) or now
+        tokens = math.min(burst, tokens + math.max(now - updated, 0) * rate)
+        local retry_after = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+        else
+            retry_after = (1 - tokens) / rate
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+        redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+        return tostring(retry_after)
+    """
+
+    REFUND_SCRIPT = """
+        local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+        if tokens then
+            redis.call('HSET', KEYS[1], 'tokens', math.min(tonumber(ARGV[1]), tokens + 1))
+        end
+    """
+
+    def __init__(self, url, prefix='ratelimit:'):
+        import redis  # optional dependency, only needed for a shared store
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._take = self.client.register_script(self.SCRIPT)
+        self._refund = self.client.register_script(self.REFUND_SCRIPT)
+
+    def take(self, key, burst, rate):
+        retry_after = float(self._take(keys=[self.prefix + key], args=[burst, rate, time.time()]))
+        return retry_after == 0.0, retry_after
+
+    def refund(self, key, burst):
+        self._refund(keys=[self.prefix + key], args=[burst])
+
+    def reset(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+def create_bucket_store(url=None, max_keys=100000):
+    """MemoryBucketStore, or RedisBucketStore for a redis:// URL"""
+    if url:
+        return RedisBucketStore(url)
+    return MemoryBucketStore(max_keys)
+
+
+# ============================================
+# LOGIN LIMITER
+# ============================================
+
+class LoginRateLimiter:
+    """Per-IP and per-identifier buckets for login attempts"""
+
+    def __init__(self):
+        self.enabled = True
+        self.store = MemoryBucketStore()
+        self.ip_burst = 20
+        self.ip_rate = 10 / 60.0
+        self.identifier_burst = 5
+        self.identifier_rate = 1 / 60.0
+
+    def configure(self, config):
+        self.enabled = config.get('LOGIN_RATE_LIMIT_ENABLED', True)
+        self.store = create_bucket_store(config.get('RATE_LIMIT_STORAGE_URL'),
+                                         config.get('RATE_LIMIT_MAX_KEYS', 100000))
+        self.ip_burst = config.get('LOGIN_RATE_LIMIT_IP_BURST', 20)
+        self.ip_rate = config.get('LOGIN_RATE_LIMIT_IP_PER_MINUTE', 10) / 60.0
+        self.identifier_burst = config.get('LOGIN_RATE_LIMIT_ID_BURST', 5)
+        self.identifier_rate = config.get('LOGIN_RATE_LIMIT_ID_PER_MINUTE', 1) / 60.0
+
+    def check(self, scope, ip_address, identifier):
+        """
+        Take a token from the IP bucket and, if given, the identifier bucket
+
+        Returns:
+            Seconds to wait before retrying, or 0 when the attempt is allowed
+        """
+        allowed, retry_after = self.store.take(f'{scope}:ip:{ip_address}',
+                                               self.ip_burst, self.ip_rate)
+        if allowed and identifier:
+            allowed, retry_after = self.store.take(f'{scope}:id:{identifier}',
+                                                   self.identifier_burst, self.identifier_rate)
+        return 0 if allowed else retry_after
+
+    def refund(self, scope, identifier):
+        """Give back the identifier token taken by check() after a successful login"""
+        if identifier:
+            self.store.refund(f'{scope}:id:{identifier}', self.identifier_burst)
+
+
+# Process-wide limiter
+login_limiter = LoginRateLimiter()
+
+metrics.counter('login_rate_limited_total', 'Login attempts rejected by the rate limiter')
+
+
+def login_rate_limited(f):
+    """
+    Decorator for login routes: 429 + Retry-After once a bucket is empty
+
+    The identifier is the username or email from the JSON body, lowercased.
+    A 200 response refunds its identifier token (see the module docstring).
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not login_limiter.enabled:
+            return f(*args, **kwargs)
+
+        data = request.get_json(silent=True) or {}
+        identifier = data.get('email') or data.get('username')
+        identifier = str(identifier).strip().lower()[:255] if identifier else None
+
+        retry_after = login_limiter.check(request.blueprint, request.remote_addr, identifier)
+        if retry_after:
+            seconds = max(int(math.ceil(retry_after)), 1)
+            metrics.inc('login_rate_limited_total', (('blueprint', request.blueprint or ''),))
+            response = jsonify({
+                'error': f'Too many login attempts. Try again in {seconds} seconds'
+            })
+            response.headers['Retry-After'] = str(seconds)
+            return response, 429
+
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200:
+            login_limiter.refund(request.blueprint, identifier)
+        return response
+
+    return decorated_function
+
+
+def init_rate_limit(app):
+    """Apply LOGIN_RATE_LIMIT_* and RATE_LIMIT_* settings from the app config"""
+    login_limiter.configure(app.config)
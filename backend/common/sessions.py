@@ -0,0 +1,283 @@
+"""
+Server-side sessions stored in the user_sessions table
+
+The session cookie carries only an opaque random token. The session data
+(user_id, user_type, username, admin_role) lives in user_sessions, so a
+session can be revoked by deleting its row.
+
+Reads go through a per-process LRU cache (SESSION_CACHE_SIZE entries,
+SESSION_CACHE_TTL seconds), so a cache hit costs microseconds and no query.
+Expiry is checked lazily on lookup; a background sweeper deletes expired
+rows in small batches every SESSION_SWEEP_INTERVAL seconds, walking the
+expires_at index.
+
+Only sessions with a logged-in user_id are stored. Revocation from another
+process becomes visible here once the cached entry's TTL runs out.
+
+Usage:
+    from common.sessions import init_sessions, revoke_user_sessions
+    init_sessions(app)                 # SESSION_BACKEND='database'
+    revoke_user_sessions(user_id)      # log a user out everywhere
+"""
+
+import os
+import secrets
+import threading
+import time
+from datetime import datetime
+from flask import request
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from .cache import LRUCache
+from .database import Database
+from .db_backends import DatabaseError
+from .metrics import metrics
+
+SESSION_USER_TYPES = ('user', 'admin')
+MAX_TOKEN_LENGTH = 255
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its token and who it belonged to when loaded"""
+
+    def __init__(self, initial=None, sid=None, owner=None):
+        def on_update(session):
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.owner = owner
+        self.new = sid is None
+        self.modified = False
+
+
+class SessionStore:
+    """user_sessions access with an LRU read-through cache in front"""
+
+    def __init__(self):
+        self.serializer = TaggedJSONSerializer()
+        self.cache = LRUCache(maxsize=10000, ttl=30)
+        self.sweep_interval = 300
+        self.sweep_batch = 1000
+        self._sweeper = None
+        self._sweeper_pid = None
+        self._lock = threading.Lock()
+
+    def configure(self, config):
+        self.cache = LRUCache(maxsize=config.get('SESSION_CACHE_SIZE', 10000),
+                              ttl=config.get('SESSION_CACHE_TTL', 30))
+        self.sweep_interval = config.get('SESSION_SWEEP_INTERVAL', 300)
+        self.sweep_batch = config.get('SESSION_SWEEP_BATCH', 1000)
+
+    # ------------------------------------------
+    # Lookup and persistence
+    # ------------------------------------------
+
+    def load(self, sid):
+        """
+        Return (data, owner) for a live session token, or None
+
+        owner is the (user_id, user_type) the row was created for.
+        """
+        entry = self.cache.get(sid)
+        if entry is None:
+            row = Database.execute_query(
+                """SELECT user_id, user_type, data, expires_at
+                   FROM user_sessions WHERE session_token = %s""",
+                (sid,),
+                fetch_one=True
+            )
+            if not row or not row['data']:
+                return None
+            entry = (self.serializer.loads(row['data']),
+                     (row['user_id'], row['user_type']), row['expires_at'])
+            self.cache.set(sid, entry)
+
+        data, owner, expires_at = entry
+        if expires_at <= datetime.now():
+            # Lazy expiry; the sweeper deletes the row later
+            self.cache.pop(sid)
+            return None
+        return dict(data), owner
+
+    def create(self, data, expires_at, ip_address=None, user_agent=None):
+        """Insert a session row and return its new token"""
+        sid = secrets.token_urlsafe(32)
+        owner = (data['user_id'], data['user_type'])
+        Database.execute_query(
+            """INSERT INTO user_sessions
+               (user_id, session_token, user_type, data, ip_address, user_agent, expires_at)
+               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+            (owner[0], sid, owner[1], self.serializer.dumps(dict(data)),
+             ip_address, user_agent, expires_at)
+        )
+        self.cache.set(sid, (dict(data), owner, expires_at))
+        self._ensure_sweeper()
+        return sid
+
+    def update(self, sid, data, owner, expires_at):
+        Database.execute_query(
+            "UPDATE user_sessions SET data = %s, expires_at = %s WHERE session_token = %s",
+            (self.serializer.dumps(dict(data)), expires_at, sid)
+        )
+        self.cache.set(sid, (dict(data), owner, expires_at))
+
+    def delete(self, sid):
+        self.cache.pop(sid)
+        Database.execute_query("DELETE FROM user_sessions WHERE session_token = %s", (sid,))
+
+    def revoke(self, user_id, user_type='user'):
+        """
+        Delete every session of one account
+
+        Returns:
+            Number of sessions removed from this process's cache
+        """
+        Database.execute_query(
+            "DELETE FROM user_sessions WHERE user_id = %s AND user_type = %s",
+            (user_id, user_type)
+        )
+        return self.cache.discard_where(lambda entry: entry[1] == (user_id, user_type))
+
+    # ------------------------------------------
+    # Expired row sweeper
+    # ------------------------------------------
+
+    def sweep(self, batch_size=None):
+        """
+        Delete expired sessions, batch_size rows per statement
+
+        Returns:
+            Number of rows deleted
+        """
+        batch_size = batch_size or self.sweep_batch
+        total = 0
+        while True:
+            with Database.get_cursor() as cursor:
+                cursor.execute(
+                    """SELECT id FROM user_sessions
+                       WHERE expires_at < NOW()
+                       ORDER BY expires_at
+                       LIMIT %s""",
+                    (batch_size,)
+                )
+                ids = [row['id'] for row in cursor.fetchall()]
+                if ids:
+                    placeholders = ','.join(['%s'] * len(ids))
+                    cursor.execute(f"DELETE FROM user_sessions WHERE id IN ({placeholders})",
+                                   tuple(ids))
+            total += len(ids)
+            if len(ids) < batch_size:
+                return total
+
+    def _sweep_forever(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                deleted = self.sweep()
+                if deleted:
+                    metrics.inc('sessions_expired_deleted_total', amount=deleted)
+            except DatabaseError as e:
+                print(f"[WARN] Session sweep failed: {e}")
+
+    def worker_state(self):
+        """'running', 'idle' (not started in this process yet), 'off' or 'dead'"""
+        if not self.sweep_interval:
+            return 'off'
+        if self._sweeper is None or self._sweeper_pid != os.getpid():
+            return 'idle'
+        return 'running' if self._sweeper.is_alive() else 'dead'
+
+    def _ensure_sweeper(self):
+        # One sweeper per process, started after fork on first use
+        if self._sweeper_pid == os.getpid() or not self.sweep_interval:
+            return
+        with self._lock:
+            if self._sweeper_pid == os.getpid():
+                return
+            self._sweeper_pid = os.getpid()
+            self._sweeper = threading.Thread(target=self._sweep_forever,
+                                             name='session-sweeper', daemon=True)
+            self._sweeper.start()
+
+
+# Process-wide store
+session_store = SessionStore()
+
+metrics.gauge_callback('session_cache_entries', 'Sessions held in the in-process cache',
+                       lambda: len(session_store.cache))
+metrics.counter('sessions_expired_deleted_total', 'Expired session rows deleted by the sweeper')
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface backed by SessionStore"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid and len(sid) <= MAX_TOKEN_LENGTH:
+            loaded = self.store.load(sid)
+            if loaded is not None:
+                data, owner = loaded
+                return ServerSession(data, sid=sid, owner=owner)
+        return ServerSession()
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        if not session.modified:
+            return
+
+        owner = (session.get('user_id'), session.get('user_type'))
+        if owner[0] is None or owner[1] not in SESSION_USER_TYPES:
+            # Logged out (or never logged in): nothing to keep server-side
+            if session.sid:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+            return
+
+        expires_at = datetime.now() + app.permanent_session_lifetime
+        if session.sid and session.owner == owner:
+            self.store.update(session.sid, session, owner, expires_at)
+            sid = session.sid
+        else:
+            # New login (or a different account): issue a fresh token
+            if session.sid:
+                self.store.delete(session.sid)
+            sid = self.store.create(session, expires_at, request.remote_addr,
+                                    request.headers.get('User-Agent'))
+
+        response.set_cookie(
+            name, sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+
+def revoke_user_sessions(user_id, user_type='user'):
+    """Log an account out of every server-side session"""
+    return session_store.revoke(user_id, user_type)
+
+
+def init_sessions(app):
+    """Use server-side sessions unless SESSION_BACKEND is 'cookie'"""
+    if app.config.get('SESSION_BACKEND', 'database') != 'database':
+        return
+    session_store.configure(app.config)
+    app.session_interface = ServerSessionInterface(session_store)
@@ -125,28 +125,3 @@ def generate_invoice_number():
     date_str = datetime.now().strftime('%Y%m%d')
     random_num = random.randint(100, 999)
     return f"INV-{date_str}-{random_num}"
-
-
-def calculate_order_total(items, tax_rate=0.10, delivery_fee=5.00):
-    """
-    Calculate order total with tax and delivery fee
-    
-    Args:
-        items: List of items with 'price' and 'quantity'
-        tax_rate: Tax rate (default 10%)
-        delivery_fee: Delivery fee (default $5.00)
-        
-    Returns:
-        Dictionary with subtotal, tax, delivery_fee, and total
-    """
-    subtotal = sum(item['price'] * item['quantity'] for item in items)
-    tax = subtotal * tax_rate
-    total = subtotal + tax + delivery_fee
-    
-    return {
-        'subtotal': round(subtotal, 2),
-        'tax': round(tax, 2),
-        'delivery_fee': round(delivery_fee, 2),
-        'total': round(total, 2)
-    }
-
@@ -0,0 +1,137 @@
+"""
+Background database warm-up
+
+create_app() only records the pool settings (DB_LAZY_INIT). This module
+starts a daemon thread that creates the pool, retrying with the backoff in
+Database._create_backend while MySQL is not up yet, then checks out
+DB_WARMUP_CONNECTIONS connections at once so their handshakes are done
+before the first customer request. Registered tasks (the menu and
+category caches) run last.
+
+Startup never waits for this thread. A request that arrives first simply
+creates the pool itself.
+
+Usage:
+    from common.warmup import register_warmup_task
+    register_warmup_task('menu', prime_menu_cache)
+"""
+
+import os
+import threading
+import time
+
+from .database import Database
+from .db_backends import DatabaseError
+
+
+class WarmUp:
+    """Per-process warm-up thread and its progress"""
+
+    def __init__(self):
+        self.connections = 2
+        self.tasks = []
+        self.state = 'idle'
+        self.attempts = 0
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def configure(self, config):
+        # Never ask for more connections than one process's pool holds
+        self.connections = min(config.get('DB_WARMUP_CONNECTIONS', 2),
+                               config.get('DB_POOL_SIZE', 5))
+
+    def add_task(self, name, func):
+        if name not in [task_name for task_name, _ in self.tasks]:
+            self.tasks.append((name, func))
+
+    def start(self):
+        """Start the thread once per process (again after a fork)"""
+        if not self.connections:
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self.state = 'connecting'
+            self.attempts = 0
+            self.error = None
+            self.started_at = time.time()
+            self.finished_at = None
+            self._thread = threading.Thread(target=self._run, name='db-warmup', daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        """Block until this process's warm-up has finished (or timeout)"""
+        thread = self._thread
+        if thread is not None and self._pid == os.getpid():
+            thread.join(timeout)
+
+    def _run(self):
+        # Create the pool, waiting out the backoff window between attempts
+        while True:
+            self.attempts += 1
+            try:
+                Database.get_backend()
+                break
+            except DatabaseError as e:
+                self.error = str(e)
+                time.sleep(max(Database.retry_delay(), 0.1))
+
+        self.state = 'warming'
+        connections = []
+        try:
+            for _ in range(self.connections):
+                connections.append(Database.get_connection())
+            for connection in connections:
+                cursor = connection.cursor(dictionary=False, buffered=True)
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+                cursor.close()
+        except DatabaseError as e:
+            # Pool smaller than DB_WARMUP_CONNECTIONS, or a dropped connection
+            self.error = str(e)
+        finally:
+            for connection in connections:
+                connection.close()
+
+        for name, func in self.tasks:
+            try:
+                func()
+            except Exception as e:
+                self.error = f"{name}: {e}"
+                print(f"[WARN] Warm-up task '{name}' failed: {e}")
+
+        self.state = 'ready'
+        self.finished_at = time.time()
+        print(f"[OK] Database warm-up done in {self.finished_at - self.started_at:.2f}s "
+              f"({self.attempts} connect attempt(s))")
+
+    def stats(self):
+        thread = self._thread
+        return {
+            'state': self.state,
+            'alive': thread is not None and thread.is_alive() and self._pid == os.getpid(),
+            'attempts': self.attempts,
+            'error': self.error,
+            'duration_seconds': (round(self.finished_at - self.started_at, 3)
+                                 if self.finished_at else None),
+        }
+
+
+# Process-wide warm-up
+warmup = WarmUp()
+
+
+def register_warmup_task(name, func):
+    """Run func() in the warm-up thread once the pool is connected"""
+    warmup.add_task(name, func)
+
+
+def init_warmup(app):
+    """Apply DB_WARMUP_CONNECTIONS and start the warm-up thread"""
+    warmup.configure(app.config)
+    warmup.start()
@@ -1,99 +0,0 @@
-"""
-Configuration file for Food Ordering System
-"""
-
-import os
-from datetime import timedelta
-
-class Config:
-    """Base configuration"""
-    
-    # Application
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    DEBUG = True
-    
-    # MySQL Database Configuration (XAMPP)
-    MYSQL_HOST = os.environ.get('MYSQL_HOST') or 'localhost'
-    MYSQL_USER = os.environ.get('MYSQL_USER') or 'root'
-    MYSQL_PASSWORD = os.environ.get('MYSQL_PASSWORD') or ''  # Default XAMPP has no password
-    MYSQL_DB = os.environ.get('MYSQL_DB') or 'food_ordering_system'
-    MYSQL_PORT = int(os.environ.get('MYSQL_PORT') or 3306)
-    
-    # Session Configuration
-    SESSION_COOKIE_NAME = 'food_order_session'
-    SESSION_COOKIE_HTTPONLY = True
-    SESSION_COOKIE_SAMESITE = 'Lax'
-    PERMANENT_SESSION_LIFETIME = timedelta(days=7)
-    
-    # JWT Configuration (for API tokens)
-    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-    JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
-    
-    # File Upload Configuration
-    UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'uploads')
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
-    
-    # Pagination
-    ITEMS_PER_PAGE = 20
-    
-    # Email Configuration (optional - for future use)
-    MAIL_SERVER = os.environ.get('MAIL_SERVER')
-    MAIL_PORT = int(os.environ.get('MAIL_PORT') or 587)
-    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'true').lower() in ['true', 'on', '1']
-    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
-    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
-    
-    # Tax and Discount
-    TAX_RATE = 0.10  # 10% tax
-    DELIVERY_FEE = 5.00
-    MIN_ORDER_AMOUNT = 10.00
-    
-    # Order Settings
-    ORDER_STATUSES = ['pending', 'confirmed', 'preparing', 'ready', 'delivered', 'cancelled']
-    PAYMENT_METHODS = ['cash', 'card', 'online']
-    
-    # Rating Settings
-    MIN_RATING = 1
-    MAX_RATING = 5
-    
-    @staticmethod
-    def init_app(app):
-        """Initialize application with config"""
-        # Create upload folder if it doesn't exist
-        if not os.path.exists(Config.UPLOAD_FOLDER):
-            os.makedirs(Config.UPLOAD_FOLDER)
-
-
-class DevelopmentConfig(Config):
-    """Development configuration"""
-    DEBUG = True
-    TESTING = False
-
-
-class ProductionConfig(Config):
-    """Production configuration"""
-    DEBUG = False
-    TESTING = False
-    
-    # Override with environment variables in production
-    SECRET_KEY = os.environ.get('SECRET_KEY')
-    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
-
-
-class TestingConfig(Config):
-    """Testing configuration"""
-    TESTING = True
-    DEBUG = True
-    MYSQL_DB = 'food_ordering_system_test'
-
-
-# Configuration dictionary
-config = {
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'testing': TestingConfig,
-    'default': DevelopmentConfig
-}
-
@@ -0,0 +1,110 @@
+"""
+Test fixtures - the full API on the embedded in-memory SQLite backend
+
+    cd backend && python -m pytest
+
+No MySQL server is needed: DB_BACKEND is forced to sqlite with
+SQLITE_PATH=':memory:', so the schema and seed data in
+database/schema_sqlite.sql are created fresh for each test run.
+"""
+
+import os
+import itertools
+
+os.environ['DB_BACKEND'] = 'sqlite'
+os.environ['SQLITE_PATH'] = ':memory:'
+os.environ['LOGIN_RATE_LIMIT_ENABLED'] = 'false'
+
+import pytest
+
+from app import create_app
+from common import Database
+from common.warmup import warmup
+from modules.order.menu_cache import invalidate_menu_cache
+
+pytest_plugins = ['common.pytest_plugin']
+
+_customer_numbers = itertools.count(1)
+
+
+@pytest.fixture(scope='session')
+def app():
+    app = create_app('testing')
+    warmup.wait(10)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def admin_headers(app):
+    response = app.test_client().post('/api/admin/login',
+                                      json={'username': 'admin', 'password': 'admin123'})
+    return {'Authorization': f"Bearer {response.json['token']}"}
+
+
+@pytest.fixture
+def customer(client):
+    """A freshly registered customer: {'id', 'username', 'email', 'headers'}"""
+    number = next(_customer_numbers)
+    username = f'customer{number}'
+    email = f'customer{number}@example.com'
+    response = client.post('/api/user/register', json={
+        'username': username, 'email': email, 'password': 'Passw0rd!',
+        'phone': f'555{number:04d}', 'address': '1 Test Street'
+    })
+    assert response.status_code == 201, response.json
+    token = client.post('/api/user/login',
+                        json={'email': email, 'password': 'Passw0rd!'}).json['token']
+    return {'id': response.json['user_id'], 'username': username, 'email': email,
+            'headers': {'Authorization': f'Bearer {token}'}}
+
+
+@pytest.fixture
+def place_order(client):
+    """place_order(customer, [(menu_item_id, quantity), ...]) -> response"""
+    def place(customer, items):
+        return client.post('/api/order/place', headers=customer['headers'], json={
+            'items': [{'menu_item_id': item_id, 'quantity': quantity}
+                      for item_id, quantity in items],
+            'delivery_address': '1 Test Street',
+            'payment_method': 'cash'
+        })
+    return place
+
+
+@pytest.fixture
+def menu_items():
+    """Restores stock and availability of the menu items a test touches"""
+    original = {row['id']: row for row in Database.execute_query(
+        "SELECT id, stock_quantity, is_available FROM menu_items", fetch_all=True)}
+    yield sorted(original)
+    Database.execute_many(
+        "UPDATE menu_items SET stock_quantity = %s, is_available = %s WHERE id = %s",
+        [(row['stock_quantity'], row['is_available'], item_id)
+         for item_id, row in original.items()]
+    )
+    invalidate_menu_cache()
+
+
+@pytest.fixture
+def set_stock():
+    """set_stock(item_id, n) - change stock as another worker would (no cache invalidation)"""
+    def set_stock(item_id, stock_quantity):
+        Database.execute_query("UPDATE menu_items SET stock_quantity = %s WHERE id = %s",
+                               (stock_quantity, item_id))
+    return set_stock
+
+
+@pytest.fixture
+def stock_of():
+    """stock_of(item_id) -> {'stock_quantity', 'is_available'}"""
+    def stock_of(item_id):
+        row = Database.execute_query(
+            "SELECT stock_quantity, is_available FROM menu_items WHERE id = %s",
+            (item_id,), fetch_one=True)
+        return {'stock_quantity': row['stock_quantity'], 'is_available': bool(row['is_available'])}
+    return stock_of
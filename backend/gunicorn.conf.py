@@ -0,0 +1,58 @@
+"""
+Gunicorn configuration for the Food Ordering System backend
+
+Usage (from the backend directory):
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Graceful reload (new workers replace old ones once in-flight requests drain):
+    kill -HUP <master pid>
+
+Because the app is preloaded in the master, HUP does not pick up code changes.
+To deploy new code without dropping connections, start a new master with
+USR2 and then stop the old one with QUIT.
+"""
+
+import multiprocessing
+import os
+
+from common import Config, Database
+from common.warmup import warmup
+
+# Server socket
+bind = Config.WEB_BIND
+
+# Worker processes - one per core pair plus one, threaded workers for I/O-bound views
+workers = Config.WEB_WORKERS or multiprocessing.cpu_count() * 2 + 1
+worker_class = 'gthread'
+threads = Config.WEB_THREADS
+
+# Load the app once in the master so workers fork with modules already imported
+preload_app = True
+
+# Timeouts and worker recycling
+timeout = Config.WEB_TIMEOUT
+graceful_timeout = Config.WEB_GRACEFUL_TIMEOUT
+keepalive = 5
+max_requests = Config.WEB_MAX_REQUESTS
+max_requests_jitter = max_requests // 10
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('WEB_LOG_LEVEL', 'info')
+
+
+def when_ready(server):
+    """Master is ready: close the pool opened while preloading the app"""
+    # Let the preload warm-up finish first so it cannot reopen the pool afterwards
+    warmup.wait(Config.WEB_TIMEOUT)
+    # Workers must never inherit live MySQL sockets from the master
+    Database.dispose_pool()
+    server.log.info("Master ready, preload connections closed")
+
+
+def post_fork(server, worker):
+    """Each worker builds its own connection pool and warms it in the background"""
+    Database.reset_pool()
+    warmup.start()
+    server.log.info(f"Worker {worker.pid} spawned")
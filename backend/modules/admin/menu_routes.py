@@ -3,18 +3,30 @@ Admin Menu Management Routes - CRUD for Categories and Menu Items
 """
 
 from flask import Blueprint, request, jsonify, session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from common import Database, dict_to_sql_insert, dict_to_sql_update
 from common.middleware import admin_required
+from common.activity_log import log_activity
+from modules.order.menu_cache import invalidate_menu_cache
 
 menu_admin_bp = Blueprint('menu_admin', __name__, url_prefix='/api/admin/menu')
 
 
+def _parse_stock(value):
+    """stock_quantity from a request: None (not counted) or a whole number >= 0"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError('stock_quantity must be a whole number or null')
+    try:
+        stock = int(value)
+    except ValueError:
+        raise ValueError('stock_quantity must be a whole number or null')
+    if stock < 0:
+        raise ValueError('stock_quantity cannot be negative')
+    return stock
+
+
 # ============================================
 # CATEGORY CRUD
 # ============================================
@@ -84,6 +96,8 @@ def create_category():
         # Insert category
         query, values = dict_to_sql_insert('categories', category_data)
         category_id = Database.execute_query(query, values)
+        invalidate_menu_cache()
+        log_activity('admin_category_created', f"Created category {category_id} ({data['name']})")
         
         return jsonify({
             'message': 'Category created successfully',
@@ -121,6 +135,9 @@ def update_category(category_id):
         # Update category
         query, values = dict_to_sql_update('categories', update_data, 'id = %s', (category_id,))
         Database.execute_query(query, values)
+        invalidate_menu_cache()
+        log_activity('admin_category_updated',
+                     f"Updated category {category_id}: {', '.join(sorted(update_data))}")
         
         return jsonify({'message': 'Category updated successfully'}), 200
         
@@ -150,6 +167,8 @@ def delete_category(category_id):
             "DELETE FROM categories WHERE id = %s",
             (category_id,)
         )
+        invalidate_menu_cache()
+        log_activity('admin_category_deleted', f"Deleted category {category_id}")
         
         return jsonify({'message': 'Category deleted successfully'}), 200
 
@@ -174,7 +193,7 @@ def get_all_menu_items():
         query = """
             SELECT
                 m.id, m.category_id, m.name, m.description, m.price,
-                m.image_url, m.is_available, m.is_featured, m.preparation_time,
+                m.image_url, m.is_available, m.stock_quantity, m.is_featured, m.preparation_time,
                 m.created_at, m.updated_at,
                 c.name as category_name,
                 COALESCE(r.average_rating, 0) as average_rating,
@@ -212,7 +231,7 @@ def get_menu_item(item_id):
         item = Database.execute_query(
             """SELECT
                 m.id, m.category_id, m.name, m.description, m.price,
-                m.image_url, m.is_available, m.is_featured, m.preparation_time,
+                m.image_url, m.is_available, m.stock_quantity, m.is_featured, m.preparation_time,
                 m.created_at, m.updated_at,
                 c.name as category_name
             FROM menu_items m
@@ -245,6 +264,10 @@ def create_menu_item():
             return jsonify({'error': 'Category is required'}), 400
         if not data.get('price'):
             return jsonify({'error': 'Price is required'}), 400
+        try:
+            stock_quantity = _parse_stock(data.get('stock_quantity'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
         # Validate category exists
         category = Database.execute_query(
@@ -263,7 +286,8 @@ def create_menu_item():
             'description': data.get('description', ''),
             'price': data['price'],
             'image_url': data.get('image_url', ''),
-            'is_available': data.get('is_available', True),
+            'is_available': data.get('is_available', True) and stock_quantity != 0,
+            'stock_quantity': stock_quantity,
             'is_featured': data.get('is_featured', False),
             'preparation_time': data.get('preparation_time', 15)
         }
@@ -277,6 +301,8 @@ def create_menu_item():
             "INSERT INTO menu_item_ratings (menu_item_id, total_ratings, average_rating) VALUES (%s, 0, 0.00)",
             (item_id,)
         )
+        invalidate_menu_cache()
+        log_activity('admin_menu_item_created', f"Created menu item {item_id} ({data['name']})")
 
         return jsonify({
             'message': 'Menu item created successfully',
@@ -296,7 +322,7 @@ def update_menu_item(item_id):
 
         # Check if item exists
         item = Database.execute_query(
-            "SELECT id FROM menu_items WHERE id = %s",
+            "SELECT id, stock_quantity FROM menu_items WHERE id = %s",
             (item_id,),
             fetch_one=True
         )
@@ -316,15 +342,31 @@ def update_menu_item(item_id):
 
         # Prepare update data
         allowed_fields = ['category_id', 'name', 'description', 'price', 'image_url',
-                         'is_available', 'is_featured', 'preparation_time']
+                         'is_available', 'stock_quantity', 'is_featured', 'preparation_time']
         update_data = {k: v for k, v in data.items() if k in allowed_fields}
 
         if not update_data:
             return jsonify({'error': 'No valid fields to update'}), 400
 
+        # Setting stock sells an item out at 0 and brings back one that had sold out,
+        # unless is_available is given explicitly
+        if 'stock_quantity' in update_data:
+            try:
+                stock = update_data['stock_quantity'] = _parse_stock(update_data['stock_quantity'])
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            if 'is_available' not in update_data:
+                if stock == 0:
+                    update_data['is_available'] = False
+                elif stock and item['stock_quantity'] == 0:
+                    update_data['is_available'] = True
+
         # Update menu item
         query, values = dict_to_sql_update('menu_items', update_data, 'id = %s', (item_id,))
         Database.execute_query(query, values)
+        invalidate_menu_cache()
+        log_activity('admin_menu_item_updated',
+                     f"Updated menu item {item_id}: {', '.join(sorted(update_data))}")
 
         return jsonify({'message': 'Menu item updated successfully'}), 200
 
@@ -352,6 +394,8 @@ def delete_menu_item(item_id):
             "DELETE FROM menu_items WHERE id = %s",
             (item_id,)
         )
+        invalidate_menu_cache()
+        log_activity('admin_menu_item_deleted', f"Deleted menu item {item_id}")
 
         return jsonify({'message': 'Menu item deleted successfully'}), 200
 
@@ -0,0 +1,106 @@
+"""
+Admin Module SQL - Customer list statements and their ?fields= columns
+"""
+
+from common.fieldsets import FieldSet
+
+# Per-customer totals kept by triggers on orders (migration 004)
+USER_STATS_FIELDS = FieldSet(
+    columns={
+        'order_count': ('order_count', None),
+        'total_spent': ('total_spent', None),
+        'last_order_at': ('last_order_at', None),
+    },
+)
+
+USER_FIELDS = FieldSet(
+    columns={
+        'id': ('u.id', None),
+        'username': ('u.username', None),
+        'email': ('u.email', None),
+        'phone': ('u.phone', None),
+        'is_active': ('u.is_active', None),
+        'created_at': ('u.created_at', None),
+        'updated_at': ('u.updated_at', None),
+        'profile_image': ('u.profile_image', None),
+    },
+    required=('id',),
+    expandable={'stats': USER_STATS_FIELDS},
+)
+
+USER_LIST_SELECT = """SELECT
+                {columns}
+            FROM users u{where}
+            ORDER BY u.id DESC
+            LIMIT %s OFFSET %s"""
+
+USER_COUNT_SELECT = """SELECT COUNT(*) as total
+            FROM users u{where}"""
+
+USER_STATS_SELECT = """SELECT
+                user_id, {columns}
+            FROM user_order_stats
+            WHERE user_id IN ({placeholders})"""
+
+# Prefix search only, so each branch can use its index (username, email, phone)
+USER_SEARCH_CONDITION = """
+            WHERE u.username LIKE %s ESCAPE '!'
+                OR u.email LIKE %s ESCAPE '!'
+                OR u.phone LIKE %s ESCAPE '!'"""
+
+
+def _search_filter(search):
+    if not search:
+        return '', ()
+    # Escape LIKE wildcards so the term is matched literally ('!' works on MySQL and SQLite)
+    prefix = search.replace('!', '!!').replace('%', '!%').replace('_', '!_') + '%'
+    return USER_SEARCH_CONDITION, (prefix, prefix, prefix)
+
+
+def build_users_query(selection, search=None, limit=20, offset=0):
+    """
+    Build one page of customers, newest first (id order, no filesort)
+
+    Returns:
+        Tuple of (query, params)
+    """
+    where, params = _search_filter(search)
+    query = USER_LIST_SELECT.format(columns=selection.columns_sql(), where=where)
+    return query, params + (limit, offset)
+
+
+def build_users_count_query(search=None):
+    """
+    Count customers matching the same search as build_users_query
+
+    Returns:
+        Tuple of (query, params) - params is None without a search
+    """
+    where, params = _search_filter(search)
+    return USER_COUNT_SELECT.format(where=where), params or None
+
+
+def build_user_stats_query(users, selection):
+    """
+    Fetch user_order_stats rows for one page of customers
+
+    Returns:
+        Tuple of (query, user_ids)
+    """
+    user_ids = tuple(user['id'] for user in users)
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    query = USER_STATS_SELECT.format(columns=selection.columns_sql(), placeholders=placeholders)
+    return query, user_ids
+
+
+def attach_stats(users, stats_list, selection):
+    """Attach each customer's totals as 'stats' (zeros for customers without orders)"""
+    empty = {'order_count': 0, 'total_spent': 0, 'last_order_at': None}
+    stats_by_user = {}
+    for row in stats_list:
+        stats_by_user[row['user_id']] = {name: row[name] for name in selection.fields}
+
+    for user in users:
+        user['stats'] = stats_by_user.get(user['id'],
+                                          {name: empty[name] for name in selection.fields})
+    return users
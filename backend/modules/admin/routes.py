@@ -2,19 +2,27 @@
 Admin Module Routes - Handle admin registration, login, logout, and profile management
 """
 
+import logging
 from flask import Blueprint, request, jsonify, session
 from werkzeug.security import generate_password_hash, check_password_hash
-import sys
 import os
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-from common import Database, dict_to_sql_insert, dict_to_sql_update
+from common import Database, Config, dict_to_sql_insert, dict_to_sql_update
 from common.middleware import login_required, admin_required, super_admin_required, create_token
+from common.query_trace import query_tracer
+from common.activity_log import log_activity
+from common.sessions import revoke_user_sessions
+from common.rate_limit import login_rate_limited
+from common.fieldsets import FieldSetError
+from modules.user.dashboard import invalidate_user_dashboard
+from .queries import (
+    USER_FIELDS, build_users_query, build_users_count_query, build_user_stats_query, attach_stats
+)
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
+logger = logging.getLogger('food_ordering.admin')
+
 
 # ============================================
 # ADMIN REGISTRATION
@@ -74,6 +82,7 @@ def register():
 # ============================================
 
 @admin_bp.route('/login', methods=['POST'])
+@login_rate_limited
 def login():
     """Admin login - supports login by username or email"""
     try:
@@ -116,6 +125,8 @@ def login():
         session['admin_role'] = admin['role']
         session['username'] = admin['username']
         session.permanent = True
+        log_activity('admin_login', f"Admin {admin['username']} logged in",
+                     user_id=admin['id'], user_type='admin')
 
         # Create JWT token
         token = create_token(
@@ -215,18 +226,44 @@ def update_profile():
 @admin_bp.route('/users', methods=['GET'])
 @admin_required
 def get_all_users():
-    """Get all users (admin only)"""
+    """Get one page of users, newest first (admin only)"""
     try:
-        users = Database.execute_query(
-            """SELECT id, username, email, phone, 
-                      is_active, created_at, updated_at, profile_image
-               FROM users
-               ORDER BY created_at DESC""",
-            fetch_all=True
-        )
-        
-        return jsonify({'users': users}), 200
+        # ?page=1&per_page=20
+        try:
+            page = int(request.args.get('page', 1))
+            per_page = int(request.args.get('per_page', Config.ITEMS_PER_PAGE))
+        except ValueError:
+            return jsonify({'error': 'page and per_page must be numbers'}), 400
+        if page < 1 or per_page < 1 or per_page > Config.MAX_ITEMS_PER_PAGE:
+            return jsonify({'error': f'page must be >= 1 and per_page between 1 and {Config.MAX_ITEMS_PER_PAGE}'}), 400
+
+        # ?search= matches the start of username, email or phone
+        search = request.args.get('search', '').strip()
+
+        # ?fields= / ?expand=stats (order count, spend, last order from user_order_stats)
+        selection = USER_FIELDS.parse(request.args)
+
+        query, params = build_users_query(selection, search, per_page, (page - 1) * per_page)
+        users = Database.execute_query(query, params, fetch_all=True)
+
+        count_query, count_params = build_users_count_query(search)
+        total = Database.execute_query(count_query, count_params, fetch_one=True)['total']
+
+        if users and selection.expands('stats'):
+            stats_query, user_ids = build_user_stats_query(users, selection['stats'])
+            stats_list = Database.execute_query(stats_query, user_ids, fetch_all=True)
+            attach_stats(users, stats_list, selection['stats'])
+
+        return jsonify({
+            'users': users,
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': (total + per_page - 1) // per_page
+        }), 200
     
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -316,6 +353,7 @@ def create_user_admin():
             (user_id,),
             fetch_one=True
         )
+        log_activity('admin_user_created', f"Created customer {user_id} ({data['username']})")
         
         return jsonify({
             'message': 'Customer created successfully',
@@ -354,16 +392,12 @@ def get_user(user_id):
 def update_user(user_id):
     """Update user details"""
     try:
-        print(f"[DEBUG] Update user {user_id} - request.is_json: {request.is_json}, files: {list(request.files.keys())}", flush=True)
-        
         # Handle both JSON and FormData
         if request.is_json:
             data = request.json
         else:
             data = request.form.to_dict()
         
-        print(f"[DEBUG] Update data: {data}", flush=True)
-        
         # Check if user exists
         user = Database.execute_query(
             "SELECT id, profile_image FROM users WHERE id = %s",
@@ -378,8 +412,6 @@ def update_user(user_id):
         allowed_fields = ['phone', 'is_active']
         update_data = {k: v for k, v in data.items() if k in allowed_fields}
         
-        print(f"[DEBUG] Filtered update_data: {update_data}", flush=True)
-        
         # Handle profile image upload
         if 'profile_image' in request.files:
             file = request.files['profile_image']
@@ -402,7 +434,6 @@ def update_user(user_id):
                 filepath = os.path.join(upload_dir, filename)
                 file.save(filepath)
                 update_data['profile_image'] = f"uploads/{filename}"
-                print(f"[DEBUG] Saved image to: {update_data['profile_image']}", flush=True)
         
         # Parse is_active if present
         if 'is_active' in update_data:
@@ -412,15 +443,14 @@ def update_user(user_id):
             else:
                 is_active = bool(int(is_active)) if isinstance(is_active, (int, str)) else bool(is_active)
             update_data['is_active'] = is_active
-            print(f"[DEBUG] Parsed is_active: {is_active} (type: {type(is_active)})", flush=True)
         
         if not update_data:
             return jsonify({'error': 'No valid fields to update'}), 400
         
         # Update user
         query, values = dict_to_sql_update('users', update_data, 'id = %s', (user_id,))
-        print(f"[DEBUG] SQL Query: {query}, Values: {values}", flush=True)
         Database.execute_query(query, values)
+        invalidate_user_dashboard(user_id)
         
         # Return updated user
         updated_user = Database.execute_query(
@@ -430,13 +460,14 @@ def update_user(user_id):
             fetch_one=True
         )
         
-        print(f"[DEBUG] Updated user: {updated_user}", flush=True)
+        if update_data.get('is_active') is False:
+            revoke_user_sessions(user_id)
+        log_activity('admin_user_updated',
+                     f"Updated customer {user_id}: {', '.join(sorted(update_data))}")
         return jsonify({'message': 'User updated successfully', 'user': updated_user}), 200
     
     except Exception as e:
-        print(f"[ERROR] Update user error: {str(e)}", flush=True)
-        import traceback
-        traceback.print_exc()
+        logger.exception('Update user %s failed', user_id)
         return jsonify({'error': str(e)}), 500
 
 
@@ -457,6 +488,9 @@ def delete_user(user_id):
         
         # Delete user
         Database.execute_query("DELETE FROM users WHERE id = %s", (user_id,))
+        revoke_user_sessions(user_id)
+        invalidate_user_dashboard(user_id)
+        log_activity('admin_user_deleted', f"Deleted customer {user_id}")
         
         return jsonify({'message': 'User deleted successfully'}), 200
     
@@ -505,7 +539,8 @@ def change_user_password(user_id):
             "UPDATE users SET password = %s WHERE id = %s",
             (hashed_password, user_id)
         )
-        
+        revoke_user_sessions(user_id)
+        log_activity('admin_user_password_changed', f"Changed password of customer {user_id}")
         
         return jsonify({'message': 'Password changed successfully'}), 200
     
@@ -574,6 +609,8 @@ def create_feedback_admin():
         
         query, values = dict_to_sql_insert('feedback', feedback_data)
         feedback_id = Database.execute_query(query, values)
+        invalidate_user_dashboard(order['user_id'])
+        log_activity('admin_feedback_created', f"Created feedback {feedback_id} for order {order_id}")
         
         return jsonify({
             'message': 'Feedback created successfully',
@@ -593,10 +630,11 @@ def get_feedback_list():
             """SELECT
                 f.id, f.rating, f.comment, f.created_at,
                 u.username, u.email,
-                o.order_number as order_id
+                COALESCE(o.order_number, oa.order_number) as order_id
             FROM feedback f
             JOIN users u ON f.user_id = u.id
-            JOIN orders o ON f.order_id = o.id
+            LEFT JOIN orders o ON f.order_id = o.id
+            LEFT JOIN orders_archive oa ON f.order_id = oa.id
             ORDER BY f.created_at DESC""",
             fetch_all=True
         )
@@ -616,10 +654,9 @@ def get_feedback(feedback_id):
             """SELECT
                 f.id, f.rating, f.comment, f.created_at,
                 u.email,
-                o.id as order_id
+                f.order_id
             FROM feedback f
             JOIN users u ON f.user_id = u.id
-            JOIN orders o ON f.order_id = o.id
             WHERE f.id = %s""",
             (feedback_id,),
             fetch_one=True
@@ -661,6 +698,7 @@ def update_feedback(feedback_id):
         # Update feedback
         query, values = dict_to_sql_update('feedback', update_data, 'id = %s', (feedback_id,))
         Database.execute_query(query, values)
+        log_activity('admin_feedback_updated', f"Updated feedback {feedback_id}")
         
         return jsonify({'message': 'Feedback updated successfully'}), 200
     
@@ -675,7 +713,7 @@ def delete_feedback_admin(feedback_id):
     try:
         # Check if feedback exists
         feedback = Database.execute_query(
-            "SELECT id FROM feedback WHERE id = %s",
+            "SELECT id, user_id FROM feedback WHERE id = %s",
             (feedback_id,),
             fetch_one=True
         )
@@ -685,9 +723,45 @@ def delete_feedback_admin(feedback_id):
         
         # Delete feedback
         Database.execute_query("DELETE FROM feedback WHERE id = %s", (feedback_id,))
+        invalidate_user_dashboard(feedback['user_id'])
+        log_activity('admin_feedback_deleted', f"Deleted feedback {feedback_id}")
         
         return jsonify({'message': 'Feedback deleted successfully'}), 200
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+
+# ============================================
+# ADMIN: QUERY TRACING
+# ============================================
+
+@admin_bp.route('/queries', methods=['GET'])
+@admin_required
+def get_query_stats():
+    """Get top SQL statements by total time and the slow-query log"""
+    try:
+        limit = request.args.get('limit', type=int)
+
+        return jsonify({
+            'enabled': query_tracer.enabled,
+            'threshold_ms': query_tracer.threshold * 1000,
+            'since': query_tracer.started_at,
+            'top': query_tracer.top(limit),
+            'slow': query_tracer.slow_queries(limit)
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@admin_bp.route('/queries', methods=['DELETE'])
+@admin_required
+def reset_query_stats():
+    """Reset the SQL statement statistics"""
+    try:
+        query_tracer.reset()
+        return jsonify({'message': 'Query statistics reset'}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
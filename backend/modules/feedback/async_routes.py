@@ -0,0 +1,34 @@
+"""
+Feedback Module Async Routes - Read-only menu item feedback endpoint (ASGI)
+Same SQL and response shapes as routes.py, served on the asyncio event loop.
+"""
+
+import asyncio
+from quart import Blueprint, jsonify
+from common.async_database import AsyncDatabase
+from .queries import MENU_ITEM_FEEDBACK_QUERY, RATING_SUMMARY_QUERY, empty_rating_summary
+
+feedback_async_bp = Blueprint('feedback_async', __name__, url_prefix='/api/feedback')
+
+
+# ============================================
+# GET FEEDBACK FOR MENU ITEM
+# ============================================
+
+@feedback_async_bp.route('/menu-item/<int:menu_item_id>', methods=['GET'])
+async def get_menu_item_feedback(menu_item_id):
+    """Get approved feedback for a menu item"""
+    try:
+        # Both lookups are independent - run them concurrently on two pooled connections
+        feedback_list, rating_summary = await asyncio.gather(
+            AsyncDatabase.execute_query(MENU_ITEM_FEEDBACK_QUERY, (menu_item_id,), fetch_all=True),
+            AsyncDatabase.execute_query(RATING_SUMMARY_QUERY, (menu_item_id,), fetch_one=True)
+        )
+
+        return jsonify({
+            'feedback': feedback_list,
+            'rating_summary': rating_summary or empty_rating_summary()
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
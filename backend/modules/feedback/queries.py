@@ -0,0 +1,103 @@
+"""
+Feedback Module SQL - Statements shared by the sync (Flask) and async (Quart) routes
+"""
+
+from common.fieldsets import FieldSet
+
+MENU_ITEM_FEEDBACK_QUERY = """SELECT
+                f.id, f.rating, f.comment, f.created_at,
+                u.username as customer_name
+            FROM feedback f
+            JOIN users u ON f.user_id = u.id
+            WHERE f.menu_item_id = %s AND f.is_approved = TRUE
+            ORDER BY f.created_at DESC
+            LIMIT 50"""
+
+RATING_SUMMARY_QUERY = """SELECT
+                average_rating, total_ratings,
+                rating_1_count, rating_2_count, rating_3_count,
+                rating_4_count, rating_5_count
+            FROM menu_item_ratings
+            WHERE menu_item_id = %s"""
+
+
+# Columns for ?fields= on the feedback lists (see common/fieldsets.py)
+FEEDBACK_JOINS = {
+    'users': 'JOIN users u ON f.user_id = u.id',
+    # Feedback of archived orders keeps its order number
+    'orders': """LEFT JOIN orders o ON f.order_id = o.id
+            LEFT JOIN orders_archive oa ON f.order_id = oa.id""",
+    'menu_items': 'LEFT JOIN menu_items m ON f.menu_item_id = m.id',
+}
+
+MY_FEEDBACK_FIELDS = FieldSet(
+    columns={
+        'id': ('f.id', None),
+        'order_id': ('f.order_id', None),
+        'rating': ('f.rating', None),
+        'comment': ('f.comment', None),
+        'is_approved': ('f.is_approved', None),
+        'created_at': ('f.created_at', None),
+        'order_number': ('COALESCE(o.order_number, oa.order_number)', 'orders'),
+        'menu_item_name': ('m.name', 'menu_items'),
+    },
+    joins=FEEDBACK_JOINS,
+    required=('id',),
+)
+
+ALL_FEEDBACK_FIELDS = FieldSet(
+    columns={
+        'id': ('f.id', None),
+        'rating': ('f.rating', None),
+        'comment': ('f.comment', None),
+        'is_approved': ('f.is_approved', None),
+        'created_at': ('f.created_at', None),
+        'customer_name': ('u.username', 'users'),
+        'customer_email': ('u.email', 'users'),
+        'order_number': ('COALESCE(o.order_number, oa.order_number)', 'orders'),
+        'menu_item_name': ('m.name', 'menu_items'),
+    },
+    joins=FEEDBACK_JOINS,
+    required=('id',),
+)
+
+FEEDBACK_LIST_SELECT = """
+            SELECT
+                {columns}
+            FROM feedback f{joins}
+        """
+
+
+def build_feedback_list_query(selection, user_id=None, approved_only=False):
+    """
+    Build a feedback list, newest first
+
+    Returns:
+        Tuple of (query, params) - params is None when there are no filters
+    """
+    query = FEEDBACK_LIST_SELECT.format(columns=selection.columns_sql(),
+                                        joins=selection.joins_sql())
+    conditions = []
+    params = []
+    if user_id is not None:
+        conditions.append("f.user_id = %s")
+        params.append(user_id)
+    if approved_only:
+        conditions.append("f.is_approved = TRUE")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY f.created_at DESC"
+    return query, tuple(params) if params else None
+
+
+def empty_rating_summary():
+    """Rating summary returned for items that have never been rated"""
+    return {
+        'average_rating': 0,
+        'total_ratings': 0,
+        'rating_1_count': 0,
+        'rating_2_count': 0,
+        'rating_3_count': 0,
+        'rating_4_count': 0,
+        'rating_5_count': 0
+    }
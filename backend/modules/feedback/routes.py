@@ -4,12 +4,15 @@ Feedback Module - Handle customer feedback and ratings
 
 from flask import Blueprint, request, jsonify, session
 from datetime import datetime
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from common import Database, dict_to_sql_insert
+
+from common import Database, Config, dict_to_sql_insert
 from common.middleware import get_token_from_request, decode_token
-from config import Config
+from common.fieldsets import FieldSetError
+from modules.user.dashboard import invalidate_user_dashboard
+from .queries import (
+    MENU_ITEM_FEEDBACK_QUERY, RATING_SUMMARY_QUERY, MY_FEEDBACK_FIELDS, ALL_FEEDBACK_FIELDS,
+    build_feedback_list_query, empty_rating_summary
+)
 
 feedback_bp = Blueprint('feedback', __name__, url_prefix='/api/feedback')
 
@@ -93,6 +96,7 @@ def submit_feedback():
         
         query, values = dict_to_sql_insert('feedback', feedback_data)
         feedback_id = Database.execute_query(query, values)
+        invalidate_user_dashboard(user_id)
         
         return jsonify({
             'message': 'Feedback submitted successfully. It will be visible after admin approval.',
@@ -113,41 +117,21 @@ def get_menu_item_feedback(menu_item_id):
     try:
         # Get feedback
         feedback_list = Database.execute_query(
-            """SELECT 
-                f.id, f.rating, f.comment, f.created_at,
-                u.username as customer_name
-            FROM feedback f
-            JOIN users u ON f.user_id = u.id
-            WHERE f.menu_item_id = %s AND f.is_approved = TRUE
-            ORDER BY f.created_at DESC
-            LIMIT 50""",
+            MENU_ITEM_FEEDBACK_QUERY,
             (menu_item_id,),
             fetch_all=True
         )
         
         # Get rating summary
         rating_summary = Database.execute_query(
-            """SELECT 
-                average_rating, total_ratings,
-                rating_1_count, rating_2_count, rating_3_count,
-                rating_4_count, rating_5_count
-            FROM menu_item_ratings
-            WHERE menu_item_id = %s""",
+            RATING_SUMMARY_QUERY,
             (menu_item_id,),
             fetch_one=True
         )
         
         return jsonify({
             'feedback': feedback_list,
-            'rating_summary': rating_summary or {
-                'average_rating': 0,
-                'total_ratings': 0,
-                'rating_1_count': 0,
-                'rating_2_count': 0,
-                'rating_3_count': 0,
-                'rating_4_count': 0,
-                'rating_5_count': 0
-            }
+            'rating_summary': rating_summary or empty_rating_summary()
         }), 200
         
     except Exception as e:
@@ -182,22 +166,14 @@ def get_my_feedback():
         if not user_id or user_type != 'user':
             return jsonify({'error': 'Unauthorized'}), 401
         
-        feedback_list = Database.execute_query(
-            """SELECT 
-                f.id, f.order_id, f.rating, f.comment, f.is_approved, f.created_at,
-                o.order_number,
-                m.name as menu_item_name
-            FROM feedback f
-            JOIN orders o ON f.order_id = o.id
-            LEFT JOIN menu_items m ON f.menu_item_id = m.id
-            WHERE f.user_id = %s
-            ORDER BY f.created_at DESC""",
-            (user_id,),
-            fetch_all=True
-        )
+        selection = MY_FEEDBACK_FIELDS.parse(request.args)
+        query, params = build_feedback_list_query(selection, user_id=user_id)
+        feedback_list = Database.execute_query(query, params, fetch_all=True)
         
         return jsonify({'feedback': feedback_list}), 200
 
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -229,27 +205,14 @@ def get_all_feedback():
 
         approved_only = request.args.get('approved', 'false').lower() == 'true'
 
-        query = """
-            SELECT
-                f.id, f.rating, f.comment, f.is_approved, f.created_at,
-                u.username as customer_name, u.email as customer_email,
-                o.order_number,
-                m.name as menu_item_name
-            FROM feedback f
-            JOIN users u ON f.user_id = u.id
-            JOIN orders o ON f.order_id = o.id
-            LEFT JOIN menu_items m ON f.menu_item_id = m.id
-        """
-
-        if approved_only:
-            query += " WHERE f.is_approved = TRUE"
-
-        query += " ORDER BY f.created_at DESC"
-
-        feedback_list = Database.execute_query(query, fetch_all=True)
+        selection = ALL_FEEDBACK_FIELDS.parse(request.args)
+        query, params = build_feedback_list_query(selection, approved_only=approved_only)
+        feedback_list = Database.execute_query(query, params, fetch_all=True)
 
         return jsonify({'feedback': feedback_list}), 200
 
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -313,10 +276,18 @@ def delete_feedback(feedback_id):
         if user_type != 'admin':
             return jsonify({'error': 'Unauthorized. Admin access required'}), 403
 
+        feedback = Database.execute_query(
+            "SELECT user_id FROM feedback WHERE id = %s",
+            (feedback_id,),
+            fetch_one=True
+        )
+
         Database.execute_query(
             "DELETE FROM feedback WHERE id = %s",
             (feedback_id,)
         )
+        if feedback:
+            invalidate_user_dashboard(feedback['user_id'])
 
         return jsonify({'message': 'Feedback deleted successfully'}), 200
 
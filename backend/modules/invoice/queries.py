@@ -0,0 +1,55 @@
+"""
+Invoice Module SQL - Invoice list statements and their ?fields= columns
+"""
+
+from common.fieldsets import FieldSet
+
+MY_INVOICE_FIELDS = FieldSet(
+    columns={
+        'id': ('i.id', None),
+        'invoice_number': ('i.invoice_number', None),
+        'total_amount': ('i.total_amount', None),
+        'invoice_date': ('i.invoice_date', None),
+        'order_number': ('o.order_number', 'orders'),
+        'order_status': ('o.status', 'orders'),
+    },
+    joins={'orders': 'JOIN {orders} o ON i.order_id = o.id'},
+    required=('id', 'invoice_date'),
+)
+
+ALL_INVOICE_FIELDS = FieldSet(
+    columns=dict(MY_INVOICE_FIELDS.columns,
+                 customer_name=('u.username', 'users'),
+                 customer_email=('u.email', 'users')),
+    joins=dict(MY_INVOICE_FIELDS.joins, users='JOIN users u ON i.user_id = u.id'),
+    required=('id', 'invoice_date'),
+)
+
+INVOICE_LIST_SELECT = """SELECT
+                {columns}
+            FROM {invoices} i{joins}"""
+
+
+def build_invoice_list_query(tables, selection, user_id=None):
+    """
+    Build an invoice list over (invoices, orders) table pairs
+
+    Args:
+        tables: Pairs from _invoice_tables() (hot, plus archive on request)
+        selection: From MY_INVOICE_FIELDS / ALL_INVOICE_FIELDS .parse()
+        user_id: Only this customer's invoices
+
+    Returns:
+        Tuple of (query, params)
+    """
+    parts = []
+    for invoices_table, orders_table in tables:
+        part = INVOICE_LIST_SELECT.format(columns=selection.columns_sql(), invoices=invoices_table,
+                                          joins=selection.joins_sql().format(orders=orders_table))
+        if user_id is not None:
+            part += "\n            WHERE i.user_id = %s"
+        parts.append(part)
+
+    query = " UNION ALL ".join(parts) + " ORDER BY invoice_date DESC"
+    params = (user_id,) * len(tables) if user_id is not None else None
+    return query, params
@@ -0,0 +1,84 @@
+"""
+Order Module Async Routes - Read-only menu and order history endpoints (ASGI)
+Same SQL and response shapes as routes.py, served on the asyncio event loop.
+"""
+
+from quart import Blueprint, request, jsonify
+from common.async_database import AsyncDatabase
+from common.async_middleware import get_request_identity
+from common.fieldsets import FieldSetError
+from .queries import (
+    CATEGORIES_QUERY, MY_ORDER_FIELDS,
+    build_menu_query, build_my_orders_query, build_order_items_query, attach_items
+)
+
+order_async_bp = Blueprint('order_async', __name__, url_prefix='/api/order')
+
+
+# ============================================
+# MENU LIST
+# ============================================
+
+@order_async_bp.route('/categories', methods=['GET'])
+async def get_categories():
+    """Get all active categories"""
+    try:
+        categories = await AsyncDatabase.execute_query(CATEGORIES_QUERY, fetch_all=True)
+
+        return jsonify({'categories': categories}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@order_async_bp.route('/menu', methods=['GET'])
+async def get_menu():
+    """Get menu items with optional category filter"""
+    try:
+        category_id = request.args.get('category_id')
+        featured_only = request.args.get('featured', 'false').lower() == 'true'
+
+        query, params = build_menu_query(category_id, featured_only)
+        menu_items = await AsyncDatabase.execute_query(query, params, fetch_all=True)
+
+        return jsonify({'menu_items': menu_items}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# ============================================
+# ORDER LIST
+# ============================================
+
+@order_async_bp.route('/my-orders', methods=['GET'])
+async def get_my_orders():
+    """Get current user's orders with items"""
+    try:
+        user_id, user_type = await get_request_identity()
+
+        if not user_id or user_type != 'user':
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        # Hot orders only unless the archive is requested explicitly
+        include_archived = request.args.get('include_archived', 'false').lower() == 'true'
+
+        selection = MY_ORDER_FIELDS.parse(request.args)
+
+        # Get orders
+        query, params = build_my_orders_query(user_id, include_archived, selection)
+        orders = await AsyncDatabase.execute_query(query, params, fetch_all=True)
+
+        # Get items for all orders
+        if orders and selection.expands('items'):
+            items_query, order_ids = build_order_items_query(orders, include_archived,
+                                                             selection['items'])
+            items_list = await AsyncDatabase.execute_query(items_query, order_ids, fetch_all=True)
+            attach_items(orders, items_list)
+
+        return jsonify({'orders': orders}), 200
+
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,154 @@
+"""
+Order Module - Menu item stock
+
+menu_items.stock_quantity (migration 006) is NULL for items that are not
+counted and the number left for items that are. Placing an order reserves
+stock for its counted items with one set-based conditional UPDATE inside
+the order transaction:
+
+    UPDATE menu_items SET stock_quantity = stock_quantity - CASE id WHEN ? THEN ? ... END
+    WHERE id IN (...) AND stock_quantity IS NOT NULL AND is_available = TRUE
+        AND stock_quantity >= CASE id ... END
+
+Which items are counted comes from the prices place_order reads inside the
+same transaction (load_prices), never from the per-process price table.
+Only those rows are updated, and so locked until commit: most items are not
+counted, and orders that share only such items never wait on each other.
+Their availability is checked from that same read. The order goes through
+only if the UPDATE matched every counted item, otherwise the whole
+transaction rolls back with a 409 - no SELECT ... FOR UPDATE and no read
+between check and write. The UPDATE runs right after the order row is
+written; an item that reaches 0 is marked unavailable in the same statement.
+
+Each order line records what it took (order_items.reserved_quantity,
+migration 007) and cancelling restocks exactly that.
+"""
+
+from .pricing import PricingError, price_table
+from .menu_cache import menu_cache
+
+# is_available is assigned first: MySQL evaluates SET left to right with
+# the new values, SQLite with the old ones
+RESERVE_QUERY = """UPDATE menu_items
+            SET is_available = CASE WHEN stock_quantity - {wanted} > 0
+                                    THEN is_available ELSE FALSE END,
+                stock_quantity = stock_quantity - {wanted}
+            WHERE id IN ({placeholders}) AND stock_quantity IS NOT NULL
+                AND is_available = TRUE AND stock_quantity >= {wanted}"""
+
+RESTOCK_QUERY = """UPDATE menu_items
+            SET is_available = CASE WHEN stock_quantity = 0 THEN TRUE ELSE is_available END,
+                stock_quantity = stock_quantity + {returned}
+            WHERE id IN ({placeholders}) AND stock_quantity IS NOT NULL"""
+
+STOCK_SELECT = """SELECT id, stock_quantity, is_available
+            FROM menu_items WHERE id IN ({placeholders})"""
+
+RESERVED_QUANTITIES_SELECT = """SELECT menu_item_id, SUM(reserved_quantity) as quantity
+            FROM order_items
+            WHERE order_id IN ({placeholders}) AND reserved_quantity > 0
+            GROUP BY menu_item_id
+            ORDER BY menu_item_id"""
+
+
+class StockError(PricingError):
+    """Not enough stock left to place the order"""
+
+    def __init__(self, message):
+        super().__init__(message, status=409)
+
+
+def _placeholders(values):
+    return ', '.join(['%s'] * len(values))
+
+
+def _per_item(quantities):
+    """CASE id WHEN ? THEN ? ... END over a {menu_item_id: quantity} dict, and its params"""
+    item_ids = sorted(quantities)
+    sql = 'CASE id ' + ' '.join(['WHEN %s THEN %s'] * len(item_ids)) + ' END'
+    params = []
+    for item_id in item_ids:
+        params += [item_id, quantities[item_id]]
+    return sql, tuple(params), tuple(item_ids)
+
+
+def _read_stock(cursor, item_ids):
+    if not item_ids:
+        return []
+    cursor.execute(STOCK_SELECT.format(placeholders=_placeholders(item_ids)), tuple(item_ids))
+    return cursor.fetchall()
+
+
+def _shortage(rows, wanted):
+    for row in sorted(rows, key=lambda r: r['id']):
+        if not row['is_available']:
+            return f"Menu item {row['id']} is not available"
+        if row['stock_quantity'] is not None and row['stock_quantity'] < wanted[row['id']]:
+            return f"Only {row['stock_quantity']} of menu item {row['id']} left"
+    return 'Menu items changed while placing the order'
+
+
+def reserve_stock(cursor, lines, prices):
+    """
+    Take stock for quote lines inside the order transaction
+
+    Sets 'reserved_quantity' on each line (its quantity for stock-tracked
+    items, 0 otherwise) for the order_items insert.
+
+    Args:
+        cursor: Cursor from Database.get_cursor()
+        lines: Quote lines ('menu_item_id', 'quantity')
+        prices: load_prices() output read in the same transaction
+
+    Returns:
+        Stock rows to pass to apply_stock_rows() after commit
+
+    Raises:
+        StockError: An item ran out or was withdrawn; the caller's transaction rolls back
+    """
+    wanted = {}
+    for line in lines:
+        tracked = prices[line['menu_item_id']]['stock_quantity'] is not None
+        line['reserved_quantity'] = line['quantity'] if tracked else 0
+        if tracked:
+            wanted[line['menu_item_id']] = wanted.get(line['menu_item_id'], 0) + line['quantity']
+    if not wanted:
+        return []
+
+    case_sql, case_params, item_ids = _per_item(wanted)
+    query = RESERVE_QUERY.format(wanted=case_sql, placeholders=_placeholders(item_ids))
+    cursor.execute(query, case_params * 2 + item_ids + case_params)
+    matched = cursor.rowcount
+
+    # Rows are locked by the UPDATE until commit, so this is the state it saw
+    rows = _read_stock(cursor, item_ids)
+    if matched != len(item_ids):
+        raise StockError(_shortage(rows, wanted))
+    return rows
+
+
+def restock_orders(cursor, order_ids):
+    """
+    Put back the stock reserved by cancelled orders (same transaction as the cancel)
+
+    Returns:
+        Stock rows to pass to apply_stock_rows() after commit
+    """
+    if not order_ids:
+        return []
+    cursor.execute(RESERVED_QUANTITIES_SELECT.format(placeholders=_placeholders(order_ids)),
+                   tuple(order_ids))
+    returned = {row['menu_item_id']: int(row['quantity']) for row in cursor.fetchall()}
+    if not returned:
+        return []
+    case_sql, case_params, item_ids = _per_item(returned)
+    query = RESTOCK_QUERY.format(returned=case_sql, placeholders=_placeholders(item_ids))
+    cursor.execute(query, case_params + item_ids)
+    return _read_stock(cursor, item_ids)
+
+
+def apply_stock_rows(rows):
+    """After commit: update the price table, and drop menu snapshots if an item sold out or came back"""
+    if rows and price_table.apply_stock(rows):
+        # The price table already holds the new stock, so only the snapshots go
+        menu_cache.clear()
@@ -0,0 +1,78 @@
+"""
+Order Module - Menu and category snapshot cache
+
+GET /api/order/menu and /api/order/categories are the first requests every
+client makes and the rows rarely change. Results are kept per process for
+MENU_CACHE_TTL seconds, keyed by the query filters, and primed by the
+warm-up thread (common/warmup.py) before the first request. Entries are
+PrecompressedPayloads, so a hit also skips JSON encoding and compression.
+
+Admin menu writes call invalidate_menu_cache() in the process that handled
+them; other workers see the change once their entries expire. Ratings
+change through feedback triggers, so the averages in the snapshot may lag
+by up to MENU_CACHE_TTL seconds.
+"""
+
+from common import Database
+from common.cache import LRUCache
+from common.compression import PrecompressedPayload
+from common.health import register_cache_health
+from common.warmup import register_warmup_task
+from .pricing import price_table, invalidate_prices
+from .queries import CATEGORIES_QUERY, build_menu_query
+
+# One entry per (category_id, featured) filter; the LRU bound caps odd ids
+menu_cache = LRUCache(maxsize=64, ttl=60)
+
+
+def get_categories():
+    """{'categories': [...]} payload, from the snapshot when it is fresh"""
+    payload = menu_cache.get('categories')
+    if payload is None:
+        categories = Database.execute_query(CATEGORIES_QUERY, fetch_all=True)
+        payload = PrecompressedPayload({'categories': categories})
+        if menu_cache.ttl:
+            menu_cache.set('categories', payload)
+    return payload
+
+
+def get_menu(category_id=None, featured_only=False):
+    """{'menu_items': [...]} payload for one filter, from the snapshot when it is fresh"""
+    key = ('menu', str(category_id or ''), featured_only)
+    payload = menu_cache.get(key)
+    if payload is None:
+        query, params = build_menu_query(category_id, featured_only)
+        menu_items = Database.execute_query(query, params, fetch_all=True)
+        payload = PrecompressedPayload({'menu_items': menu_items})
+        if menu_cache.ttl:
+            menu_cache.set(key, payload)
+    return payload
+
+
+def invalidate_menu_cache():
+    """Drop every snapshot and the price table; call after any category or menu item write"""
+    menu_cache.clear()
+    invalidate_prices()
+
+
+def prime_menu_cache():
+    """Load the unfiltered menu, the categories and the price table (warm-up task)"""
+    get_categories()
+    get_menu()
+    price_table.prices()
+
+
+register_warmup_task('menu', prime_menu_cache)
+register_cache_health('menu', lambda: {
+    'warm': 'categories' in menu_cache and ('menu', '', False) in menu_cache,
+    'entries': len(menu_cache),
+    'prices': len(price_table),
+})
+
+
+def init_menu_cache(app):
+    """Apply MENU_CACHE_TTL from the app config (0 disables the cache)"""
+    menu_cache.ttl = app.config.get('MENU_CACHE_TTL', 60)
+    menu_cache.clear()
+    price_table.ttl = menu_cache.ttl
+    price_table.invalidate()
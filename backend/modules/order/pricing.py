@@ -0,0 +1,267 @@
+"""
+Order Module - Cart pricing
+
+One place computes what an order costs, so the quote shown at checkout,
+the order total and the invoice always agree:
+
+    subtotal      sum of price x quantity per line
+    tax           subtotal x TAX_RATE
+    delivery_fee  DELIVERY_FEE
+    total         subtotal + tax + delivery_fee
+
+All amounts are Decimal and rounded half-up to cents at each step. An order
+needs a subtotal of at least MIN_ORDER_AMOUNT.
+
+Quotes (POST /api/order/quote) come from a per-process price table (id ->
+price, name, availability, stock) loaded with one query and refreshed when
+the menu changes (invalidate_prices, called by invalidate_menu_cache) or
+after MENU_CACHE_TTL seconds. Other workers only see a menu write when
+their table expires, so placing an order never trusts it: place_order
+reads the ordered items with load_prices() (one SELECT ... WHERE id IN)
+inside its transaction.
+
+Usage:
+    quote = quote_cart(data['items'])     # cached prices, raises PricingError
+
+    cart = parse_cart(data['items'])
+    quote = price_cart(cart, load_prices(cursor, [i['menu_item_id'] for i in cart]))
+    quote.total, quote.lines, quote.to_dict()
+"""
+
+import threading
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+from common import Database, Config
+
+CENT = Decimal('0.01')
+
+PRICE_TABLE_QUERY = "SELECT id, name, price, is_available, stock_quantity FROM menu_items"
+
+PRICES_SELECT = PRICE_TABLE_QUERY + " WHERE id IN ({placeholders})"
+
+
+def to_money(value):
+    """Decimal rounded to cents (accepts Decimal, float, int or str)"""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def _price_entry(row):
+    return {'name': row['name'],
+            'price': to_money(row['price']),
+            'is_available': bool(row['is_available']),
+            'stock_quantity': row['stock_quantity']}
+
+
+class PricingError(ValueError):
+    """Cart that cannot be priced; status is the HTTP status to answer with"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class PriceTable:
+    """Menu prices held in memory, reloaded after invalidate() or ttl seconds"""
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._prices = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _fresh(self, prices, loaded_at):
+        return prices is not None and self.ttl and time.monotonic() - loaded_at < self.ttl
+
+    def prices(self):
+        """Dict of menu_item_id -> {'name', 'price', 'is_available', 'stock_quantity'}"""
+        prices, loaded_at = self._prices, self._loaded_at
+        if self._fresh(prices, loaded_at):
+            return prices
+        with self._lock:
+            if self._fresh(self._prices, self._loaded_at):
+                return self._prices
+            rows = Database.execute_query(PRICE_TABLE_QUERY, fetch_all=True)
+            prices = {row['id']: _price_entry(row) for row in rows}
+            self._prices, self._loaded_at = prices, time.monotonic()
+            return prices
+
+    def apply_stock(self, rows):
+        """
+        Record committed stock levels
+
+        Returns:
+            True if an item's availability changed or may have (menu snapshots are stale)
+        """
+        prices = self._prices
+        if prices is None:
+            return True
+        flipped = False
+        with self._lock:
+            for row in rows:
+                entry = prices.get(row['id'])
+                if entry is None:
+                    continue
+                available = bool(row['is_available'])
+                flipped = flipped or available != entry['is_available']
+                prices[row['id']] = dict(entry, is_available=available,
+                                         stock_quantity=row['stock_quantity'])
+        return flipped
+
+    def invalidate(self):
+        self._prices = None
+
+    def __len__(self):
+        return len(self._prices or ())
+
+
+# Process-wide price table
+price_table = PriceTable()
+
+
+def invalidate_prices():
+    """Reload prices on the next quote; call after any menu item write"""
+    price_table.invalidate()
+
+
+class Quote:
+    """Priced cart: lines plus subtotal, tax, delivery fee and total (Decimal)"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.tax_rate = Decimal(str(Config.TAX_RATE))
+        self.min_order_amount = to_money(Config.MIN_ORDER_AMOUNT)
+        self.subtotal = to_money(sum((line['subtotal'] for line in lines), Decimal('0')))
+        self.tax = to_money(self.subtotal * self.tax_rate)
+        self.delivery_fee = to_money(Config.DELIVERY_FEE)
+        self.total = self.subtotal + self.tax + self.delivery_fee
+
+    @property
+    def meets_minimum(self):
+        return self.subtotal >= self.min_order_amount
+
+    def to_dict(self):
+        """JSON-ready quote (amounts as numbers rounded to cents)"""
+        return {
+            'items': [dict(line, price=float(line['price']), subtotal=float(line['subtotal']))
+                      for line in self.lines],
+            'subtotal': float(self.subtotal),
+            'tax_rate': float(self.tax_rate),
+            'tax': float(self.tax),
+            'delivery_fee': float(self.delivery_fee),
+            'total': float(self.total),
+            'min_order_amount': float(self.min_order_amount),
+            'meets_minimum': self.meets_minimum,
+        }
+
+
+def price_lines(rows):
+    """
+    Quote already-priced lines, e.g. order_items rows for an invoice
+
+    Args:
+        rows: Dicts with 'price' and 'quantity'
+    """
+    lines = []
+    for row in rows:
+        price = to_money(row['price'])
+        lines.append(dict(row, price=price, subtotal=to_money(price * int(row['quantity']))))
+    return Quote(lines)
+
+
+def parse_cart(items):
+    """
+    Validate cart items from a request
+
+    Args:
+        items: List of {'menu_item_id', 'quantity', 'special_request'?}
+
+    Returns:
+        List of {'menu_item_id', 'quantity', 'special_request'}
+
+    Raises:
+        PricingError: Empty cart, or a quantity below 1 or above MAX_ITEM_QUANTITY (400)
+    """
+    if not isinstance(items, list) or not items:
+        raise PricingError('Order must contain at least one item')
+
+    cart = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise PricingError('Each item must be an object')
+        try:
+            menu_item_id = int(item.get('menu_item_id'))
+            quantity = int(item.get('quantity', 1))
+        except (TypeError, ValueError):
+            raise PricingError('menu_item_id and quantity must be numbers')
+        if quantity < 1:
+            raise PricingError(f'Quantity for menu item {menu_item_id} must be at least 1')
+        if quantity > Config.MAX_ITEM_QUANTITY:
+            raise PricingError(f'Quantity for menu item {menu_item_id} must be at most '
+                               f'{Config.MAX_ITEM_QUANTITY}')
+        cart.append({'menu_item_id': menu_item_id, 'quantity': quantity,
+                     'special_request': item.get('special_request', '') or ''})
+    return cart
+
+
+def load_prices(cursor, item_ids):
+    """
+    Read prices for some menu items inside the caller's transaction
+
+    Returns:
+        Dict shaped like PriceTable.prices()
+    """
+    item_ids = sorted(set(item_ids))
+    placeholders = ', '.join(['%s'] * len(item_ids))
+    cursor.execute(PRICES_SELECT.format(placeholders=placeholders), tuple(item_ids))
+    return {row['id']: _price_entry(row) for row in cursor.fetchall()}
+
+
+def price_cart(cart, prices):
+    """
+    Price parsed cart items
+
+    Args:
+        cart: parse_cart() output
+        prices: PriceTable.prices() or load_prices() output
+
+    Returns:
+        Quote whose lines are ready to insert into order_items
+
+    Raises:
+        PricingError: Unknown item (404), unavailable item (400), not enough stock left (409)
+    """
+    lines = []
+    for item in cart:
+        menu_item_id, quantity = item['menu_item_id'], item['quantity']
+        entry = prices.get(menu_item_id)
+        if entry is None:
+            raise PricingError(f'Menu item {menu_item_id} not found', status=404)
+        if not entry['is_available']:
+            raise PricingError(f'Menu item {menu_item_id} is not available')
+        stock = entry['stock_quantity']
+        if stock is not None and quantity > stock:
+            raise PricingError(f'Only {stock} of menu item {menu_item_id} left', status=409)
+
+        lines.append({
+            'menu_item_id': menu_item_id,
+            'name': entry['name'],
+            'quantity': quantity,
+            'price': entry['price'],
+            'subtotal': to_money(entry['price'] * quantity),
+            'special_request': item['special_request'],
+        })
+    return Quote(lines)
+
+
+def quote_cart(items):
+    """
+    Price cart items against the cached price table (for /quote; placing an
+    order prices from load_prices() inside its transaction instead)
+
+    Raises:
+        PricingError: see parse_cart() and price_cart()
+    """
+    return price_cart(parse_cart(items), price_table.prices())
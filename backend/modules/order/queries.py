@@ -0,0 +1,276 @@
+"""
+Order Module SQL - Statements shared by the sync (Flask) and async (Quart) routes
+"""
+
+from common import Config
+from common.fieldsets import FieldSet
+
+CATEGORIES_QUERY = """SELECT id, name, description, image_url, display_order
+               FROM categories
+               WHERE is_active = TRUE
+               ORDER BY display_order, name"""
+
+MENU_QUERY = """
+            SELECT
+                m.id, m.name, m.description, m.price, m.image_url,
+                m.is_available, m.is_featured, m.preparation_time,
+                c.name as category_name, c.id as category_id,
+                COALESCE(r.average_rating, 0) as average_rating,
+                COALESCE(r.total_ratings, 0) as total_ratings
+            FROM menu_items m
+            JOIN categories c ON m.category_id = c.id
+            LEFT JOIN menu_item_ratings r ON m.id = r.menu_item_id
+            WHERE m.is_available = TRUE
+        """
+
+# Columns for ?fields= / ?expand= (see common/fieldsets.py)
+ORDER_ITEM_FIELDS = FieldSet(
+    columns={
+        'id': ('oi.id', None),
+        'quantity': ('oi.quantity', None),
+        'price': ('oi.price', None),
+        'subtotal': ('oi.subtotal', None),
+        'special_request': ('oi.special_request', None),
+        'item_name': ('m.name', 'menu_items'),
+        'item_description': ('m.description', 'menu_items'),
+        'image_url': ('m.image_url', 'menu_items'),
+    },
+    joins={'menu_items': 'JOIN menu_items m ON oi.menu_item_id = m.id'},
+)
+
+MY_ORDER_FIELDS = FieldSet(
+    columns={
+        'id': ('id', None),
+        'order_number': ('order_number', None),
+        'total_amount': ('total_amount', None),
+        'status': ('status', None),
+        'payment_method': ('payment_method', None),
+        'payment_status': ('payment_status', None),
+        'delivery_address': ('delivery_address', None),
+        'created_at': ('created_at', None),
+        'delivered_at': ('delivered_at', None),
+    },
+    required=('id', 'created_at'),
+    expandable={'items': ORDER_ITEM_FIELDS},
+    default_expand=('items',),
+)
+
+ALL_ORDER_FIELDS = FieldSet(
+    columns={
+        'id': ('o.id', None),
+        'order_number': ('o.order_number', None),
+        'total_amount': ('o.total_amount', None),
+        'status': ('o.status', None),
+        'payment_method': ('o.payment_method', None),
+        'payment_status': ('o.payment_status', None),
+        'delivery_address': ('o.delivery_address', None),
+        # Aliased for the UNION sort: users has created_at too
+        'created_at': ('o.created_at', None),
+        'customer_phone': ('u.phone', 'users'),
+        'customer_name': ('u.username', 'users'),
+    },
+    joins={'users': 'JOIN users u ON o.user_id = u.id'},
+    required=('id', 'created_at'),
+    expandable={'items': ORDER_ITEM_FIELDS},
+    default_expand=('items',),
+)
+
+MY_ORDERS_SELECT = """SELECT
+                {columns}
+            FROM {orders}
+            WHERE user_id = %s"""
+
+ALL_ORDERS_SELECT = """
+            SELECT
+                {columns}
+            FROM {orders} o{joins}
+        """
+
+ORDER_ITEM_INSERT = """INSERT INTO order_items
+                (order_id, menu_item_id, quantity, reserved_quantity, price, subtotal, special_request)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)"""
+
+ORDER_ITEMS_SELECT = """SELECT
+                oi.order_id, {columns}
+            FROM {order_items} oi{joins}
+            WHERE oi.order_id IN ({placeholders})"""
+
+# Compare-and-set: only rows still in an allowed previous status change,
+# so the affected-row count says which transitions won
+ORDER_STATUS_UPDATE = """UPDATE orders
+            SET status = %s{delivered_at}{owner}
+            WHERE id IN ({placeholders}) AND status IN ({previous})"""
+
+ORDER_STATUS_SELECT = """SELECT id, status, user_id
+            FROM orders WHERE id IN ({placeholders})"""
+
+
+class TransitionConflict(Exception):
+    """Orders changed between the status check and the UPDATE"""
+
+
+def allowed_previous_statuses(new_status):
+    """
+    Statuses an order may move to new_status from: forward only along
+    ORDER_STATUSES, and 'cancelled' from anything but delivered or cancelled
+    """
+    if new_status == 'cancelled':
+        return tuple(s for s in Config.ORDER_STATUSES if s not in ('delivered', 'cancelled'))
+    flow = [s for s in Config.ORDER_STATUSES if s != 'cancelled']
+    return tuple(flow[:flow.index(new_status)])
+
+
+def transition_error(current_status, new_status):
+    """Why an order in current_status cannot move to new_status (None if it can)"""
+    if current_status in allowed_previous_statuses(new_status):
+        return None
+    if current_status == new_status:
+        return f'Order is already {new_status}'
+    if current_status == 'cancelled':
+        return 'Cannot change a cancelled order'
+    if new_status == 'cancelled':
+        return 'Cannot cancel a delivered order'
+    return 'Cannot revert to a previous status'
+
+
+def build_status_update(new_status, order_ids, previous, return_owner=False):
+    """
+    Conditional status change for a set of orders
+
+    Args:
+        previous: Statuses the orders must still be in (non-empty)
+        return_owner: Report the (last) updated order's user_id as cursor.lastrowid,
+            through MySQL's LAST_INSERT_ID(expr), so no SELECT is needed to find it
+
+    Returns:
+        Tuple of (query, params)
+    """
+    query = ORDER_STATUS_UPDATE.format(
+        delivered_at=', delivered_at = NOW()' if new_status == 'delivered' else '',
+        owner=', user_id = LAST_INSERT_ID(user_id)' if return_owner else '',
+        placeholders=', '.join(['%s'] * len(order_ids)),
+        previous=', '.join(['%s'] * len(previous)),
+    )
+    return query, (new_status,) + tuple(order_ids) + tuple(previous)
+
+
+def build_status_select(order_ids, for_update=False):
+    """Current status and owner of a set of orders (locked until commit with for_update)"""
+    placeholders = ', '.join(['%s'] * len(order_ids))
+    query = ORDER_STATUS_SELECT.format(placeholders=placeholders)
+    if for_update:
+        query += " FOR UPDATE"
+    return query, tuple(order_ids)
+
+
+def build_menu_query(category_id=None, featured_only=False):
+    """
+    Build the menu listing query with optional filters
+
+    Returns:
+        Tuple of (query, params) - params is None when there are no filters
+    """
+    query = MENU_QUERY
+    params = []
+
+    if category_id:
+        query += " AND m.category_id = %s"
+        params.append(category_id)
+
+    if featured_only:
+        query += " AND m.is_featured = TRUE"
+
+    query += " ORDER BY m.is_featured DESC, m.name"
+
+    return query, tuple(params) if params else None
+
+
+def build_my_orders_query(user_id, include_archived=False, selection=None):
+    """
+    Build the order history query for one user
+
+    The hot orders table is read by default; include_archived adds
+    orders_archive (see database/archive_orders.py). selection (from
+    MY_ORDER_FIELDS.parse) limits the columns; default is all of them.
+
+    Returns:
+        Tuple of (query, params)
+    """
+    columns = (selection or MY_ORDER_FIELDS.all()).columns_sql()
+    tables = ['orders', 'orders_archive'] if include_archived else ['orders']
+    query = " UNION ALL ".join(
+        MY_ORDERS_SELECT.format(columns=columns, orders=table) for table in tables
+    ) + """
+            ORDER BY created_at DESC"""
+    return query, (user_id,) * len(tables)
+
+
+def build_all_orders_query(status=None, include_archived=False, selection=None):
+    """
+    Build the admin order board query with an optional status filter
+
+    selection (from ALL_ORDER_FIELDS.parse) limits the columns; the users
+    join is only added when a customer_* column is selected.
+
+    Returns:
+        Tuple of (query, params) - params is None when there are no filters
+    """
+    selection = selection or ALL_ORDER_FIELDS.all()
+    tables = ['orders', 'orders_archive'] if include_archived else ['orders']
+    parts = []
+    params = []
+    for table in tables:
+        part = ALL_ORDERS_SELECT.format(columns=selection.columns_sql(), orders=table,
+                                        joins=selection.joins_sql())
+        if status:
+            part += " WHERE o.status = %s"
+            params.append(status)
+        parts.append(part)
+
+    if include_archived:
+        # A UNION is sorted by result column name (created_at is always selected)
+        query = " UNION ALL ".join(parts) + " ORDER BY created_at DESC"
+    else:
+        query = parts[0] + " ORDER BY o.created_at DESC"
+
+    return query, tuple(params) if params else None
+
+
+def build_order_items_query(orders, include_archived=False, selection=None):
+    """
+    Build the item hydration query for a list of orders
+
+    selection (from the parent's selection['items']) limits the columns;
+    the menu_items join is skipped when no menu column is selected.
+
+    Returns:
+        Tuple of (query, params)
+    """
+    selection = selection or ORDER_ITEM_FIELDS.all()
+    order_ids = tuple(order['id'] for order in orders)
+    placeholders = ','.join(['%s'] * len(order_ids))
+    tables = ['order_items', 'order_items_archive'] if include_archived else ['order_items']
+    query = " UNION ALL ".join(
+        ORDER_ITEMS_SELECT.format(columns=selection.columns_sql(), order_items=table,
+                                  joins=selection.joins_sql(), placeholders=placeholders)
+        for table in tables
+    )
+    return query, order_ids * len(tables)
+
+
+def attach_items(orders, items_list):
+    """Group item rows by order_id and attach them to each order as 'items'"""
+    items_by_order = {}
+    for item in items_list:
+        order_id = item['order_id']
+        if order_id not in items_by_order:
+            items_by_order[order_id] = []
+        # Remove order_id from item dict before adding to list
+        item_copy = dict(item)
+        del item_copy['order_id']
+        items_by_order[order_id].append(item_copy)
+
+    for order in orders:
+        order['items'] = items_by_order.get(order['id'], [])
+
+    return orders
@@ -4,11 +4,22 @@ Order Module - Handle menu list, cart, and order placement
 
 from flask import Blueprint, request, jsonify, session
 from datetime import datetime
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from common import Database, dict_to_sql_insert
+
+from common import Database, Config, dict_to_sql_insert
 from common.middleware import get_token_from_request, decode_token
+from common.activity_log import log_activity
+from .menu_cache import get_categories as get_cached_categories, get_menu as get_cached_menu
+from .pricing import quote_cart, parse_cart, load_prices, price_cart, PricingError
+from .inventory import reserve_stock, restock_orders, apply_stock_rows
+from modules.user.dashboard import invalidate_user_dashboard
+from common.fieldsets import FieldSetError
+from .queries import (
+    MY_ORDER_FIELDS, ALL_ORDER_FIELDS,
+    build_my_orders_query, build_all_orders_query,
+    build_order_items_query, attach_items, ORDER_ITEM_INSERT,
+    allowed_previous_statuses, transition_error, build_status_update, build_status_select,
+    TransitionConflict
+)
 
 order_bp = Blueprint('order', __name__, url_prefix='/api/order')
 
@@ -21,15 +32,8 @@ order_bp = Blueprint('order', __name__, url_prefix='/api/order')
 def get_categories():
     """Get all active categories"""
     try:
-        categories = Database.execute_query(
-            """SELECT id, name, description, image_url, display_order 
-               FROM categories 
-               WHERE is_active = TRUE 
-               ORDER BY display_order, name""",
-            fetch_all=True
-        )
-        
-        return jsonify({'categories': categories}), 200
+        # Cached payload: encoded and compressed once per snapshot
+        return get_cached_categories().response()
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -42,34 +46,7 @@ def get_menu():
         category_id = request.args.get('category_id')
         featured_only = request.args.get('featured', 'false').lower() == 'true'
         
-        # Base query with ratings
-        query = """
-            SELECT 
-                m.id, m.name, m.description, m.price, m.image_url,
-                m.is_available, m.is_featured, m.preparation_time,
-                c.name as category_name, c.id as category_id,
-                COALESCE(r.average_rating, 0) as average_rating,
-                COALESCE(r.total_ratings, 0) as total_ratings
-            FROM menu_items m
-            JOIN categories c ON m.category_id = c.id
-            LEFT JOIN menu_item_ratings r ON m.id = r.menu_item_id
-            WHERE m.is_available = TRUE
-        """
-        
-        params = []
-        
-        if category_id:
-            query += " AND m.category_id = %s"
-            params.append(category_id)
-        
-        if featured_only:
-            query += " AND m.is_featured = TRUE"
-        
-        query += " ORDER BY m.is_featured DESC, m.name"
-        
-        menu_items = Database.execute_query(query, tuple(params) if params else None, fetch_all=True)
-        
-        return jsonify({'menu_items': menu_items}), 200
+        return get_cached_menu(category_id, featured_only).response()
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -121,6 +98,24 @@ def get_menu_item(item_id):
         return jsonify({'error': str(e)}), 500
 
 
+# ============================================
+# PRICE QUOTE
+# ============================================
+
+@order_bp.route('/quote', methods=['POST'])
+def get_quote():
+    """Price a cart: lines, subtotal, tax, delivery fee, total and minimum check"""
+    try:
+        data = request.json or {}
+        quote = quote_cart(data.get('items'))
+        return jsonify(quote.to_dict()), 200
+
+    except PricingError as e:
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 # ============================================
 # PLACE ORDER
 # ============================================
@@ -149,78 +144,66 @@ def place_order():
         if not user_id or user_type != 'user':
             return jsonify({'error': 'Please login to place an order'}), 401
 
-        data = request.json
-        
-        # Validate required fields
-        if not data.get('items') or len(data['items']) == 0:
-            return jsonify({'error': 'Order must contain at least one item'}), 400
-        
-        # Calculate total
-        total_amount = 0
-        order_items = []
-        
-        for item in data['items']:
-            # Get menu item price
-            menu_item = Database.execute_query(
-                "SELECT id, price, is_available FROM menu_items WHERE id = %s",
-                (item['menu_item_id'],),
-                fetch_one=True
-            )
-            
-            if not menu_item:
-                return jsonify({'error': f'Menu item {item["menu_item_id"]} not found'}), 404
-            
-            if not menu_item['is_available']:
-                return jsonify({'error': f'Menu item {item["menu_item_id"]} is not available'}), 400
-            
-            quantity = int(item['quantity'])
-            price = float(menu_item['price'])
-            subtotal = price * quantity
-            total_amount += subtotal
-            
-            order_items.append({
-                'menu_item_id': menu_item['id'],
-                'quantity': quantity,
-                'price': price,
-                'subtotal': subtotal,
-                'special_request': item.get('special_request', '')
-            })
-        
-        # Create order
-        order_data = {
-            'user_id': user_id,
-            'order_number': '',  # Will be auto-generated by trigger
-            'total_amount': total_amount,
-            'status': 'pending',
-            'payment_method': data.get('payment_method', 'cash'),
-            'payment_status': 'pending',
-            'delivery_address': data.get('delivery_address', ''),
-            'special_instructions': data.get('special_instructions', '')
-        }
-        
-        query, values = dict_to_sql_insert('orders', order_data)
-        order_id = Database.execute_query(query, values)
-        
-        # Insert order items
-        for item in order_items:
-            item['order_id'] = order_id
-            query, values = dict_to_sql_insert('order_items', item)
-            Database.execute_query(query, values)
-        
-        # Get order number
-        order = Database.execute_query(
-            "SELECT order_number FROM orders WHERE id = %s",
-            (order_id,),
-            fetch_one=True
-        )
-        
+        data = request.json or {}
+
+        cart = parse_cart(data.get('items'))
+
+        # Order, stock and items in one transaction: one set-based stock UPDATE,
+        # items in a single executemany
+        with Database.get_cursor() as cursor:
+            # Current prices and availability (the price table may be stale in this worker)
+            prices = load_prices(cursor, [item['menu_item_id'] for item in cart])
+            quote = price_cart(cart, prices)
+            if not quote.meets_minimum:
+                raise PricingError(
+                    f'Minimum order amount is {quote.min_order_amount} (subtotal {quote.subtotal})'
+                )
+
+            # Create order
+            order_data = {
+                'user_id': user_id,
+                'order_number': '',  # Will be auto-generated by trigger
+                'total_amount': quote.total,
+                'status': 'pending',
+                'payment_method': data.get('payment_method', 'cash'),
+                'payment_status': 'pending',
+                'delivery_address': data.get('delivery_address', ''),
+                'special_instructions': data.get('special_instructions', '')
+            }
+            query, values = dict_to_sql_insert('orders', order_data)
+            cursor.execute(query, values)
+            order_id = cursor.lastrowid
+
+            # Sets each line's reserved_quantity; raises StockError (409) if an item ran out
+            stock_rows = reserve_stock(cursor, quote.lines, prices)
+
+            cursor.executemany(ORDER_ITEM_INSERT, [
+                (order_id, line['menu_item_id'], line['quantity'], line['reserved_quantity'],
+                 line['price'], line['subtotal'], line['special_request'])
+                for line in quote.lines
+            ])
+
+            # Get order number
+            cursor.execute("SELECT order_number FROM orders WHERE id = %s", (order_id,))
+            order = cursor.fetchone()
+
+        apply_stock_rows(stock_rows)
+        invalidate_user_dashboard(user_id)
+        log_activity('order_placed', f"Order {order['order_number']} ({quote.total})",
+                     user_id=user_id, user_type='user')
+
         return jsonify({
             'message': 'Order placed successfully',
             'order_id': order_id,
             'order_number': order['order_number'],
-            'total_amount': total_amount
+            'subtotal': float(quote.subtotal),
+            'tax': float(quote.tax),
+            'delivery_fee': float(quote.delivery_fee),
+            'total_amount': float(quote.total)
         }), 201
 
+    except PricingError as e:
+        return jsonify({'error': str(e)}), e.status
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -253,48 +236,27 @@ def get_my_orders():
         if not user_id or user_type != 'user':
             return jsonify({'error': 'Unauthorized'}), 401
 
+        # Hot orders only unless the archive is requested explicitly
+        include_archived = request.args.get('include_archived', 'false').lower() == 'true'
+
+        # ?fields= / ?expand=items (items are attached unless expand is given without them)
+        selection = MY_ORDER_FIELDS.parse(request.args)
+
         # Get orders
-        orders = Database.execute_query(
-            """SELECT
-                id, order_number, total_amount, status,
-                payment_method, payment_status, delivery_address, created_at, delivered_at
-            FROM orders
-            WHERE user_id = %s
-            ORDER BY created_at DESC""",
-            (user_id,),
-            fetch_all=True
-        )
+        query, params = build_my_orders_query(user_id, include_archived, selection)
+        orders = Database.execute_query(query, params, fetch_all=True)
 
         # Get items for all orders
-        if orders:
-            order_ids = tuple(order['id'] for order in orders)
-            items_query = """SELECT
-                oi.order_id, oi.id, oi.quantity, oi.price, oi.subtotal, 
-                oi.special_request, m.name as item_name, 
-                m.description as item_description, m.image_url
-            FROM order_items oi
-            JOIN menu_items m ON oi.menu_item_id = m.id
-            WHERE oi.order_id IN ({})""".format(','.join(['%s']*len(order_ids)))
-            
+        if orders and selection.expands('items'):
+            items_query, order_ids = build_order_items_query(orders, include_archived,
+                                                             selection['items'])
             items_list = Database.execute_query(items_query, order_ids, fetch_all=True)
-            
-            # Group items by order_id
-            items_by_order = {}
-            for item in items_list:
-                order_id = item['order_id']
-                if order_id not in items_by_order:
-                    items_by_order[order_id] = []
-                # Remove order_id from item dict before adding to list
-                item_copy = dict(item)
-                del item_copy['order_id']
-                items_by_order[order_id].append(item_copy)
-            
-            # Add items to each order
-            for order in orders:
-                order['items'] = items_by_order.get(order['id'], [])
+            attach_items(orders, items_list)
 
         return jsonify({'orders': orders}), 200
 
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -318,20 +280,29 @@ def get_order_details(order_id):
             user_id = session.get('user_id')
             user_type = session.get('user_type')
 
-        # Get order
-        order = Database.execute_query(
-            """SELECT
-                o.id, o.order_number, o.total_amount, o.status,
-                o.payment_method, o.payment_status, o.delivery_address,
-                o.special_instructions, o.created_at, o.delivered_at,
-                u.phone as customer_phone,
-                u.email as customer_email
-            FROM orders o
-            JOIN users u ON o.user_id = u.id
-            WHERE o.id = %s""",
-            (order_id,),
-            fetch_one=True
-        )
+        # Get order (falls back to the archive only when asked to)
+        include_archived = request.args.get('include_archived', 'false').lower() == 'true'
+        tables = [('orders', 'order_items')]
+        if include_archived:
+            tables.append(('orders_archive', 'order_items_archive'))
+
+        order = None
+        for orders_table, items_table in tables:
+            order = Database.execute_query(
+                f"""SELECT
+                    o.id, o.order_number, o.total_amount, o.status,
+                    o.payment_method, o.payment_status, o.delivery_address,
+                    o.special_instructions, o.created_at, o.delivered_at,
+                    u.phone as customer_phone,
+                    u.email as customer_email
+                FROM {orders_table} o
+                JOIN users u ON o.user_id = u.id
+                WHERE o.id = %s""",
+                (order_id,),
+                fetch_one=True
+            )
+            if order:
+                break
 
         if not order:
             return jsonify({'error': 'Order not found'}), 404
@@ -339,7 +310,7 @@ def get_order_details(order_id):
         # Check permission (user can only see their own orders, admin can see all)
         if user_type == 'user':
             order_user = Database.execute_query(
-                "SELECT user_id FROM orders WHERE id = %s",
+                f"SELECT user_id FROM {orders_table} WHERE id = %s",
                 (order_id,),
                 fetch_one=True
             )
@@ -348,11 +319,11 @@ def get_order_details(order_id):
 
         # Get order items
         items = Database.execute_query(
-            """SELECT
+            f"""SELECT
                 oi.id, oi.quantity, oi.price, oi.subtotal, oi.special_request,
                 m.name as item_name, m.description as item_description,
                 m.image_url
-            FROM order_items oi
+            FROM {items_table} oi
             JOIN menu_items m ON oi.menu_item_id = m.id
             WHERE oi.order_id = %s""",
             (order_id,),
@@ -392,55 +363,24 @@ def get_all_orders():
             return jsonify({'error': 'Unauthorized. Admin access required'}), 403
 
         status = request.args.get('status')
+        include_archived = request.args.get('include_archived', 'false').lower() == 'true'
 
-        query = """
-            SELECT
-                o.id, o.order_number, o.total_amount, o.status,
-                o.payment_method, o.payment_status, o.delivery_address,
-                o.created_at, u.phone as customer_phone, u.username as customer_name
-            FROM orders o
-            JOIN users u ON o.user_id = u.id
-        """
-
-        params = []
-        if status:
-            query += " WHERE o.status = %s"
-            params.append(status)
+        selection = ALL_ORDER_FIELDS.parse(request.args)
 
-        query += " ORDER BY o.created_at DESC"
+        query, params = build_all_orders_query(status, include_archived, selection)
+        orders = Database.execute_query(query, params, fetch_all=True)
 
-        orders = Database.execute_query(query, tuple(params) if params else None, fetch_all=True)
-
-        # Get items for all orders
-        if orders:
-            order_ids = tuple(order['id'] for order in orders)
-            items_query = """SELECT
-                oi.order_id, oi.id, oi.quantity, oi.price, oi.subtotal, 
-                oi.special_request, m.name as item_name, 
-                m.description as item_description, m.image_url
-            FROM order_items oi
-            JOIN menu_items m ON oi.menu_item_id = m.id
-            WHERE oi.order_id IN ({})""".format(','.join(['%s']*len(order_ids)))
-            
+        # Get items for all orders (the order board passes expand= for headers only)
+        if orders and selection.expands('items'):
+            items_query, order_ids = build_order_items_query(orders, include_archived,
+                                                             selection['items'])
             items_list = Database.execute_query(items_query, order_ids, fetch_all=True)
-            
-            # Group items by order_id
-            items_by_order = {}
-            for item in items_list:
-                order_id = item['order_id']
-                if order_id not in items_by_order:
-                    items_by_order[order_id] = []
-                # Remove order_id from item dict before adding to list
-                item_copy = dict(item)
-                del item_copy['order_id']
-                items_by_order[order_id].append(item_copy)
-            
-            # Add items to each order
-            for order in orders:
-                order['items'] = items_by_order.get(order['id'], [])
+            attach_items(orders, items_list)
 
         return jsonify({'orders': orders}), 200
 
+    except FieldSetError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -450,62 +390,173 @@ def update_order_status(order_id):
     """Update order status (admin only)"""
     try:
         # Check if admin is logged in - support JWT token or session cookie
+        user_id = None
         user_type = None
 
         token = get_token_from_request()
         if token:
             payload = decode_token(token)
             if payload:
+                user_id = payload.get('user_id')
                 user_type = payload.get('user_type')
 
         if not user_type:
+            user_id = session.get('user_id')
             user_type = session.get('user_type')
 
         if user_type != 'admin':
             return jsonify({'error': 'Unauthorized. Admin access required'}), 403
 
-        data = request.json
+        data = request.json or {}
         new_status = data.get('status')
+        expected_status = data.get('expected_status')
 
         if not new_status:
             return jsonify({'error': 'Status is required'}), 400
 
         # Validate status
-        valid_statuses = ['pending', 'confirmed', 'preparing', 'ready', 'delivered', 'cancelled']
-        if new_status not in valid_statuses:
+        if new_status not in Config.ORDER_STATUSES:
             return jsonify({'error': 'Invalid status'}), 400
+        if expected_status is not None and expected_status not in Config.ORDER_STATUSES:
+            return jsonify({'error': 'Invalid expected_status'}), 400
+
+        # Forward-only progression is enforced by the UPDATE itself: it only
+        # matches while the order is in an allowed previous status (or exactly
+        # expected_status when the client sends the status it saw)
+        previous = allowed_previous_statuses(new_status)
+        if expected_status is not None:
+            previous = tuple(s for s in previous if s == expected_status)
+
+        updated = 0
+        owner = None
+        stock_rows = []
+        if previous:
+            with Database.get_cursor() as cursor:
+                query, params = build_status_update(new_status, [order_id], previous,
+                                                    return_owner=True)
+                cursor.execute(query, params)
+                updated = cursor.rowcount
+                owner = cursor.lastrowid
+                if updated and new_status == 'cancelled':
+                    stock_rows = restock_orders(cursor, [order_id])
+
+        if not updated:
+            # Report the current state: 400 if the move is not allowed from it,
+            # 409 if the order is no longer in the status the client expected
+            query, params = build_status_select([order_id])
+            order = Database.execute_query(query, params, fetch_one=True)
+            if not order:
+                return jsonify({'error': 'Order not found'}), 404
+            current = {'id': order['id'], 'status': order['status']}
+            error = transition_error(order['status'], new_status)
+            if error and (expected_status is None or order['status'] == expected_status):
+                return jsonify({'error': error, 'order': current}), 400
+            return jsonify({'error': f"Order status has changed to {order['status']}",
+                            'order': current}), 409
+
+        apply_stock_rows(stock_rows)
+        invalidate_user_dashboard(owner)
+        log_activity('order_status_changed', f"Order {order_id} -> {new_status}",
+                     user_id=user_id, user_type='admin')
+
+        return jsonify({'message': 'Order status updated successfully',
+                        'order': {'id': order_id, 'status': new_status}}), 200
 
-        # Fetch current status
-        current_status_query = "SELECT status FROM orders WHERE id = %s"
-        current_status_result = Database.execute_query(current_status_query, (order_id,), fetch_one=True)
-        if not current_status_result:
-            return jsonify({'error': 'Order not found'}), 404
-        current_status = current_status_result['status']
-
-        # Enforce strict forward-only progression (except 'cancelled')
-        current_index = valid_statuses.index(current_status)
-        new_index = valid_statuses.index(new_status)
-        if new_status == 'cancelled':
-            # Allow cancelling at any stage except after 'delivered'
-            if current_status == 'delivered':
-                return jsonify({'error': 'Cannot cancel a delivered order'}), 400
-        elif new_index <= current_index:
-            return jsonify({'error': 'Cannot revert to a previous status'}), 400
-
-        # Update order
-        update_query = "UPDATE orders SET status = %s"
-        params = [new_status]
-
-        if new_status == 'delivered':
-            update_query += ", delivered_at = NOW()"
-
-        update_query += " WHERE id = %s"
-        params.append(order_id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        Database.execute_query(update_query, tuple(params))
 
-        return jsonify({'message': 'Order status updated successfully'}), 200
+@order_bp.route('/update-status', methods=['PUT'])
+def update_orders_status():
+    """Move many orders to one status in one transaction (admin only)"""
+    try:
+        # Check if admin is logged in - support JWT token or session cookie
+        user_id = None
+        user_type = None
+
+        token = get_token_from_request()
+        if token:
+            payload = decode_token(token)
+            if payload:
+                user_id = payload.get('user_id')
+                user_type = payload.get('user_type')
+
+        if not user_type:
+            user_id = session.get('user_id')
+            user_type = session.get('user_type')
+
+        if user_type != 'admin':
+            return jsonify({'error': 'Unauthorized. Admin access required'}), 403
 
+        data = request.json or {}
+        new_status = data.get('status')
+        order_ids = data.get('order_ids')
+
+        if not new_status:
+            return jsonify({'error': 'Status is required'}), 400
+        if new_status not in Config.ORDER_STATUSES:
+            return jsonify({'error': 'Invalid status'}), 400
+        if not isinstance(order_ids, list) or not order_ids:
+            return jsonify({'error': 'order_ids must be a non-empty list'}), 400
+        if any(isinstance(i, bool) or not isinstance(i, int) for i in order_ids):
+            return jsonify({'error': 'order_ids must be integers'}), 400
+        order_ids = list(dict.fromkeys(order_ids))
+        if len(order_ids) > Config.ORDER_BULK_MAX:
+            return jsonify({'error': f'At most {Config.ORDER_BULK_MAX} orders per request'}), 400
+
+        results = {}
+        updated = []
+        stock_rows = []
+        with Database.get_cursor() as cursor:
+            # One fetch validates every transition; FOR UPDATE holds the rows
+            # so the check stays true until the UPDATE below commits
+            query, params = build_status_select(sorted(order_ids), for_update=True)
+            cursor.execute(query, params)
+            orders = {row['id']: row for row in cursor.fetchall()}
+
+            for order_id in order_ids:
+                order = orders.get(order_id)
+                if not order:
+                    results[order_id] = {'id': order_id, 'status': None, 'updated': False,
+                                         'error': 'Order not found'}
+                    continue
+                error = transition_error(order['status'], new_status)
+                if error:
+                    results[order_id] = {'id': order_id, 'status': order['status'],
+                                         'updated': False, 'error': error}
+                else:
+                    updated.append(order_id)
+
+            if updated:
+                query, params = build_status_update(new_status, updated,
+                                                    allowed_previous_statuses(new_status))
+                cursor.execute(query, params)
+                if cursor.rowcount != len(updated):
+                    # Rolls the whole batch back
+                    raise TransitionConflict('Orders changed while updating; nothing was applied')
+                if new_status == 'cancelled':
+                    stock_rows = restock_orders(cursor, updated)
+
+        for order_id in updated:
+            results[order_id] = {'id': order_id, 'status': new_status, 'updated': True}
+
+        # One notification for the whole batch
+        if updated:
+            apply_stock_rows(stock_rows)
+            for owner in {orders[order_id]['user_id'] for order_id in updated}:
+                invalidate_user_dashboard(owner)
+            log_activity('order_status_changed',
+                         f"Orders {', '.join(map(str, updated))} -> {new_status}",
+                         user_id=user_id, user_type='admin')
+
+        return jsonify({
+            'results': [results[order_id] for order_id in order_ids],
+            'updated': len(updated),
+            'failed': len(order_ids) - len(updated)
+        }), 200
+
+    except TransitionConflict as e:
+        return jsonify({'error': str(e)}), 409
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -515,15 +566,18 @@ def update_order(order_id):
     """Update allowed order fields (admin only)"""
     try:
         # Check admin - support JWT token or session cookie
+        user_id = None
         user_type = None
 
         token = get_token_from_request()
         if token:
             payload = decode_token(token)
             if payload:
+                user_id = payload.get('user_id')
                 user_type = payload.get('user_type')
 
         if not user_type:
+            user_id = session.get('user_id')
             user_type = session.get('user_type')
 
         if user_type != 'admin':
@@ -546,6 +600,8 @@ def update_order(order_id):
         params.append(order_id)
 
         Database.execute_query(update_query, tuple(params))
+        log_activity('order_updated', f"Order {order_id}: {', '.join(k for k in allowed if k in data)}",
+                     user_id=user_id, user_type='admin')
 
         return jsonify({'message': 'Order updated successfully'}), 200
 
@@ -0,0 +1,79 @@
+"""
+User Module - Dashboard summary cache
+
+GET /api/user/dashboard returns everything the customer dashboard shows
+(profile, order counts by status, total spend, recent orders and the number
+of delivered orders still waiting for feedback) from four indexed queries.
+
+Summaries are cached per user for USER_DASHBOARD_CACHE_TTL seconds. Order,
+feedback and profile writes call invalidate_user_dashboard(user_id) in the
+process that handled them, so the customer sees their own change
+immediately; other workers pick it up when their entry expires.
+"""
+
+from common import Database, Config
+from common.cache import LRUCache
+from .queries import (
+    PROFILE_QUERY, ORDER_STATUS_TOTALS_QUERY, RECENT_ORDERS_QUERY, PENDING_FEEDBACK_QUERY
+)
+
+# Most recent orders kept per summary; ?recent= picks up to this many
+RECENT_ORDERS_MAX = 10
+
+# Orders still in progress (neither delivered nor cancelled)
+OPEN_STATUSES = ('pending', 'confirmed', 'preparing', 'ready')
+
+dashboard_cache = LRUCache(maxsize=10000, ttl=60)
+
+
+def _build_dashboard(user_id):
+    profile = Database.execute_query(PROFILE_QUERY, (user_id,), fetch_one=True)
+    if not profile:
+        return None
+
+    totals = Database.execute_query(ORDER_STATUS_TOTALS_QUERY, (user_id, user_id), fetch_all=True)
+    order_counts = {status: 0 for status in Config.ORDER_STATUSES}
+    total_spent = 0
+    for row in totals:
+        order_counts[row['status']] = int(row['order_count'])
+        if row['status'] != 'cancelled':
+            total_spent += row['total_amount'] or 0
+
+    recent_orders = Database.execute_query(RECENT_ORDERS_QUERY, (user_id, RECENT_ORDERS_MAX),
+                                           fetch_all=True)
+    pending = Database.execute_query(PENDING_FEEDBACK_QUERY, (user_id, user_id), fetch_one=True)
+
+    return {
+        'user': profile,
+        'order_counts': order_counts,
+        'total_orders': sum(order_counts.values()),
+        'open_orders': sum(order_counts[status] for status in OPEN_STATUSES),
+        'total_spent': round(float(total_spent), 2),
+        'recent_orders': recent_orders,
+        'pending_feedback': int(pending['pending']) if pending else 0,
+    }
+
+
+def get_dashboard(user_id, recent=3):
+    """Dashboard summary for one customer (None if the user does not exist)"""
+    summary = dashboard_cache.get(user_id)
+    if summary is None:
+        summary = _build_dashboard(user_id)
+        if summary is None:
+            return None
+        if dashboard_cache.ttl:
+            dashboard_cache.set(user_id, summary)
+    return dict(summary, recent_orders=summary['recent_orders'][:recent])
+
+
+def invalidate_user_dashboard(user_id):
+    """Drop one customer's summary; call after their orders or feedback change"""
+    if user_id is not None:
+        dashboard_cache.pop(user_id)
+
+
+def init_dashboard_cache(app):
+    """Apply USER_DASHBOARD_CACHE_SIZE / USER_DASHBOARD_CACHE_TTL (TTL 0 disables the cache)"""
+    dashboard_cache.maxsize = app.config.get('USER_DASHBOARD_CACHE_SIZE', 10000)
+    dashboard_cache.ttl = app.config.get('USER_DASHBOARD_CACHE_TTL', 60)
+    dashboard_cache.clear()
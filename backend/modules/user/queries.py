@@ -0,0 +1,35 @@
+"""
+User Module SQL - Dashboard aggregates
+"""
+
+PROFILE_QUERY = """SELECT id, username, email, phone, address,
+                      profile_image, created_at, updated_at
+               FROM users WHERE id = %s"""
+
+# Lifetime counts and totals per status (idx_orders_user / idx_orders_archive_user_created);
+# archived orders move between the tables but never change these sums
+ORDER_STATUS_TOTALS_QUERY = """SELECT status, SUM(order_count) as order_count,
+                   SUM(total_amount) as total_amount
+            FROM (
+                SELECT status, COUNT(*) as order_count, SUM(total_amount) as total_amount
+                FROM orders WHERE user_id = %s GROUP BY status
+                UNION ALL
+                SELECT status, COUNT(*) as order_count, SUM(total_amount) as total_amount
+                FROM orders_archive WHERE user_id = %s GROUP BY status
+            ) t
+            GROUP BY status"""
+
+# Newest first via idx_user_created (user_id, created_at)
+RECENT_ORDERS_QUERY = """SELECT id, order_number, total_amount, status, created_at
+            FROM orders
+            WHERE user_id = %s
+            ORDER BY created_at DESC
+            LIMIT %s"""
+
+# Same rule as /api/feedback/eligible-orders: delivered and not yet reviewed
+PENDING_FEEDBACK_QUERY = """SELECT COUNT(*) as pending
+            FROM orders o
+            LEFT JOIN feedback f ON o.id = f.order_id AND f.user_id = %s
+            WHERE o.user_id = %s
+                AND o.status = 'delivered'
+                AND f.id IS NULL"""
@@ -4,14 +4,13 @@ User Module Routes - Handle user registration, login, logout, and profile manage
 
 from flask import Blueprint, request, jsonify, session
 from werkzeug.security import generate_password_hash, check_password_hash
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from common import Database, dict_to_sql_insert, dict_to_sql_update
 from common.middleware import login_required, create_token
+from common.activity_log import log_activity
+from common.rate_limit import login_rate_limited
+from .dashboard import get_dashboard, invalidate_user_dashboard, RECENT_ORDERS_MAX
+from .queries import PROFILE_QUERY
 
 user_bp = Blueprint('user', __name__, url_prefix='/api/user')
 
@@ -57,6 +56,8 @@ def register():
         # Insert user
         query, values = dict_to_sql_insert('users', user_data)
         user_id = Database.execute_query(query, values)
+        log_activity('user_registered', f"User {data['username']} registered",
+                     user_id=user_id, user_type='user')
         
         return jsonify({
             'message': 'User registered successfully',
@@ -72,6 +73,7 @@ def register():
 # ============================================
 
 @user_bp.route('/login', methods=['POST'])
+@login_rate_limited
 def login():
     """User login - supports login by username or email"""
     try:
@@ -107,6 +109,8 @@ def login():
         session['user_type'] = 'user'
         session['username'] = user['username']
         session.permanent = True
+        log_activity('user_login', f"User {user['username']} logged in",
+                     user_id=user['id'], user_type='user')
 
         # Create JWT token
         token = create_token(
@@ -160,13 +164,7 @@ def get_profile():
             return jsonify({'error': 'Unauthorized'}), 401
 
         # Get user data
-        user = Database.execute_query(
-            """SELECT id, username, email, phone, address,
-                      profile_image, created_at, updated_at
-               FROM users WHERE id = %s""",
-            (user_id,),
-            fetch_one=True
-        )
+        user = Database.execute_query(PROFILE_QUERY, (user_id,), fetch_one=True)
 
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -177,6 +175,37 @@ def get_profile():
         return jsonify({'error': str(e)}), 500
 
 
+@user_bp.route('/dashboard', methods=['GET'])
+@login_required
+def get_user_dashboard():
+    """Get profile, order counts, spend, recent orders and pending feedback in one call"""
+    try:
+        # Get user_id from JWT token or session
+        user_id = getattr(request, 'user_id', None) or session.get('user_id')
+        user_type = getattr(request, 'user_type', None) or session.get('user_type')
+
+        # Check if user is logged in
+        if not user_id or user_type != 'user':
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        # Number of recent orders to include (?recent=3)
+        try:
+            recent = int(request.args.get('recent', 3))
+        except ValueError:
+            return jsonify({'error': 'recent must be a number'}), 400
+        if recent < 0 or recent > RECENT_ORDERS_MAX:
+            return jsonify({'error': f'recent must be between 0 and {RECENT_ORDERS_MAX}'}), 400
+
+        dashboard = get_dashboard(user_id, recent)
+        if dashboard is None:
+            return jsonify({'error': 'User not found'}), 404
+
+        return jsonify(dashboard), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @user_bp.route('/profile', methods=['PUT'])
 @login_required
 def update_profile():
@@ -202,6 +231,7 @@ def update_profile():
         # Update user
         query, values = dict_to_sql_update('users', update_data, 'id = %s', (user_id,))
         Database.execute_query(query, values)
+        invalidate_user_dashboard(user_id)
 
         return jsonify({'message': 'Profile updated successfully'}), 200
 
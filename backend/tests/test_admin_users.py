@@ -0,0 +1,39 @@
+"""
+Admin customer list: pagination, search and order stats
+"""
+
+
+def test_pagination(client, admin_headers, customer):
+    response = client.get('/api/admin/users?page=1&per_page=1', headers=admin_headers)
+
+    assert response.status_code == 200
+    body = response.json
+    assert body['page'] == 1 and body['per_page'] == 1
+    assert len(body['users']) == 1
+    assert body['pages'] == body['total']
+    assert body['users'][0]['id'] == customer['id']  # newest first
+
+
+def test_pagination_limits(client, admin_headers):
+    assert client.get('/api/admin/users?per_page=101', headers=admin_headers).status_code == 400
+    assert client.get('/api/admin/users?page=0', headers=admin_headers).status_code == 400
+
+
+def test_search_is_a_literal_prefix(client, admin_headers, customer):
+    found = client.get(f"/api/admin/users?search={customer['username']}",
+                       headers=admin_headers).json
+    assert [user['id'] for user in found['users']] == [customer['id']]
+
+    # LIKE wildcards are matched literally
+    assert client.get('/api/admin/users?search=%25', headers=admin_headers).json['total'] == 0
+
+
+def test_order_stats(client, admin_headers, customer, place_order):
+    place_order(customer, [(1, 1)])
+    place_order(customer, [(1, 2)])
+
+    users = client.get(f"/api/admin/users?search={customer['email']}&expand=stats",
+                       headers=admin_headers).json['users']
+
+    assert users[0]['stats']['order_count'] == 2
+    assert float(users[0]['stats']['total_spent']) > 0
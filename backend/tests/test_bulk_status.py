@@ -0,0 +1,72 @@
+"""
+Bulk order status updates for the kitchen and dispatch screens
+"""
+
+from modules.order import routes
+
+
+def _update(client, admin_headers, order_id, **body):
+    return client.put(f'/api/order/update-status/{order_id}', json=body, headers=admin_headers)
+
+
+def test_bulk_update_reports_each_order(client, admin_headers, customer, place_order):
+    moved = [place_order(customer, [(1, 1)]).json['order_id'] for _ in range(3)]
+    ahead = place_order(customer, [(1, 1)]).json['order_id']
+    _update(client, admin_headers, ahead, status='delivered')
+
+    response = client.put('/api/order/update-status', headers=admin_headers,
+                          json={'status': 'ready', 'order_ids': moved + [ahead, 999999, moved[0]]})
+
+    assert response.status_code == 200
+    assert response.json['updated'] == 3
+    assert response.json['failed'] == 2
+    results = {result['id']: result for result in response.json['results']}
+    assert len(response.json['results']) == 5  # duplicates collapse
+    assert all(results[order_id] == {'id': order_id, 'status': 'ready', 'updated': True}
+               for order_id in moved)
+    assert results[ahead]['updated'] is False
+    assert results[ahead]['status'] == 'delivered'
+    assert results[999999]['error'] == 'Order not found'
+
+
+def test_bulk_update_validates_input(client, admin_headers, customer):
+    url = '/api/order/update-status'
+    assert client.put(url, headers=admin_headers,
+                      json={'status': 'ready', 'order_ids': []}).status_code == 400
+    assert client.put(url, headers=admin_headers,
+                      json={'status': 'bogus', 'order_ids': [1]}).status_code == 400
+    assert client.put(url, headers=customer['headers'],
+                      json={'status': 'ready', 'order_ids': [1]}).status_code == 403
+
+
+def test_bulk_update_refreshes_dashboards(client, admin_headers, customer, place_order):
+    order_ids = [place_order(customer, [(1, 1)]).json['order_id'] for _ in range(2)]
+    client.get('/api/user/dashboard', headers=customer['headers'])
+
+    client.put('/api/order/update-status', json={'status': 'confirmed', 'order_ids': order_ids},
+               headers=admin_headers)
+
+    summary = client.get('/api/user/dashboard', headers=customer['headers']).json
+    assert summary['order_counts']['confirmed'] == 2
+
+
+def test_bulk_update_rolls_back_when_orders_change(client, admin_headers, customer, place_order,
+                                                   monkeypatch):
+    order_ids = [place_order(customer, [(1, 1)]).json['order_id'] for _ in range(2)]
+    build_status_update = routes.build_status_update
+
+    def skip_last(new_status, ids, previous, **kwargs):
+        # As if the last order moved on between the locked check and the UPDATE
+        query, params = build_status_update(new_status, ids, previous, **kwargs)
+        return query + ' AND id <> %s', params + (ids[-1],)
+
+    monkeypatch.setattr(routes, 'build_status_update', skip_last)
+    response = client.put('/api/order/update-status', headers=admin_headers,
+                          json={'status': 'confirmed', 'order_ids': order_ids})
+
+    assert response.status_code == 409
+    monkeypatch.undo()
+    for order_id in order_ids:
+        # Nothing was applied: each order can still be confirmed on its own
+        assert _update(client, admin_headers, order_id, status='confirmed',
+                       expected_status='pending').status_code == 200
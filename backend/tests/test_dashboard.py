@@ -0,0 +1,41 @@
+"""
+Customer dashboard summary and its cache invalidation
+"""
+
+
+def _dashboard(client, customer):
+    response = client.get('/api/user/dashboard', headers=customer['headers'])
+    assert response.status_code == 200
+    return response.json
+
+
+def test_new_order_shows_up(client, customer, place_order):
+    assert _dashboard(client, customer)['total_orders'] == 0
+
+    place_order(customer, [(1, 1)])
+
+    summary = _dashboard(client, customer)
+    assert summary['total_orders'] == 1
+    assert summary['open_orders'] == 1
+    assert summary['order_counts']['pending'] == 1
+
+
+def test_status_change_shows_up(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+    assert _dashboard(client, customer)['order_counts']['pending'] == 1
+
+    client.put(f'/api/order/update-status/{order_id}', json={'status': 'cancelled'},
+               headers=admin_headers)
+
+    summary = _dashboard(client, customer)
+    assert summary['order_counts']['cancelled'] == 1
+    assert summary['open_orders'] == 0
+    assert summary['total_spent'] == 0
+
+
+def test_profile_change_shows_up(client, customer):
+    _dashboard(client, customer)
+
+    client.put('/api/user/profile', json={'phone': '5559999'}, headers=customer['headers'])
+
+    assert _dashboard(client, customer)['user']['phone'] == '5559999'
@@ -0,0 +1,91 @@
+"""
+Order status transitions: one conditional UPDATE, 400 for moves that are never
+allowed, 409 when the order changed under the client
+"""
+
+from common import Database
+
+
+def _update(client, admin_headers, order_id, **body):
+    return client.put(f'/api/order/update-status/{order_id}', json=body, headers=admin_headers)
+
+
+def test_forward_transition(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+
+    response = _update(client, admin_headers, order_id, status='confirmed')
+
+    assert response.status_code == 200
+    assert response.json['order'] == {'id': order_id, 'status': 'confirmed'}
+
+
+def test_revert_is_rejected_with_current_state(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+    _update(client, admin_headers, order_id, status='delivered')
+
+    response = _update(client, admin_headers, order_id, status='pending')
+
+    assert response.status_code == 400
+    assert response.json['error'] == 'Cannot revert to a previous status'
+    assert response.json['order'] == {'id': order_id, 'status': 'delivered'}
+
+
+def test_expected_status_mismatch_is_a_conflict(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+    _update(client, admin_headers, order_id, status='preparing')
+
+    # Another screen still shows 'confirmed'
+    response = _update(client, admin_headers, order_id, status='ready', expected_status='confirmed')
+
+    assert response.status_code == 409
+    assert response.json['error'] == 'Order status has changed to preparing'
+    assert response.json['order']['status'] == 'preparing'
+
+
+def test_expected_status_that_cannot_move(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+    _update(client, admin_headers, order_id, status='delivered')
+
+    response = _update(client, admin_headers, order_id, status='cancelled',
+                       expected_status='delivered')
+
+    assert response.status_code == 400
+    assert response.json['error'] == 'Cannot cancel a delivered order'
+
+
+def test_cancel_applies_once(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+
+    assert _update(client, admin_headers, order_id, status='cancelled').status_code == 200
+    second = _update(client, admin_headers, order_id, status='cancelled')
+
+    assert second.status_code == 400
+    assert second.json['error'] == 'Order is already cancelled'
+
+
+def test_unknown_order(client, admin_headers):
+    assert _update(client, admin_headers, 999999, status='ready').status_code == 404
+
+
+def test_customers_cannot_change_status(client, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+
+    response = _update(client, customer['headers'], order_id, status='confirmed')
+
+    assert response.status_code == 403
+
+
+def test_owner_dashboard_refreshes_for_older_orders(client, admin_headers, customer, place_order):
+    oldest = place_order(customer, [(1, 1)]).json['order_id']
+    Database.execute_query("UPDATE orders SET created_at = %s WHERE id = %s",
+                           ('2020-01-01 00:00:00', oldest))
+    for _ in range(11):
+        place_order(customer, [(1, 1)])
+    summary = client.get('/api/user/dashboard?recent=10', headers=customer['headers']).json
+    assert oldest not in [order['id'] for order in summary['recent_orders']]
+
+    assert _update(client, admin_headers, oldest, status='cancelled').status_code == 200
+
+    summary = client.get('/api/user/dashboard', headers=customer['headers']).json
+    assert summary['order_counts']['cancelled'] == 1
+    assert summary['open_orders'] == 11
@@ -0,0 +1,63 @@
+"""
+Cart pricing: quotes, order totals and the minimum order amount
+"""
+
+from decimal import Decimal
+
+from common import Config
+
+
+def test_quote_totals(client):
+    response = client.post('/api/order/quote', json={'items': [
+        {'menu_item_id': 1, 'quantity': 2}, {'menu_item_id': 4, 'quantity': 1}
+    ]})
+
+    assert response.status_code == 200
+    quote = response.json
+    subtotal = sum(Decimal(str(line['price'])) * line['quantity'] for line in quote['items'])
+    tax = (subtotal * Decimal(str(Config.TAX_RATE))).quantize(Decimal('0.01'))
+    assert Decimal(str(quote['subtotal'])) == subtotal
+    assert Decimal(str(quote['tax'])) == tax
+    assert quote['delivery_fee'] == Config.DELIVERY_FEE
+    assert Decimal(str(quote['total'])) == subtotal + tax + Decimal(str(Config.DELIVERY_FEE))
+
+
+def test_order_total_matches_quote(client, customer, place_order):
+    quote = client.post('/api/order/quote', json={'items': [
+        {'menu_item_id': 1, 'quantity': 2}, {'menu_item_id': 4, 'quantity': 1}
+    ]}).json
+
+    response = place_order(customer, [(1, 2), (4, 1)])
+
+    assert response.status_code == 201
+    assert response.json['total_amount'] == quote['total']
+
+
+def test_quote_errors(client):
+    def quote(items):
+        return client.post('/api/order/quote', json={'items': items})
+
+    assert quote([]).status_code == 400
+    assert quote([{'menu_item_id': 1, 'quantity': 0}]).status_code == 400
+    assert quote([{'menu_item_id': 999999, 'quantity': 1}]).status_code == 404
+
+
+def test_minimum_order_amount(client, customer, place_order, monkeypatch):
+    monkeypatch.setattr(Config, 'MIN_ORDER_AMOUNT', 1000.00)
+
+    response = place_order(customer, [(1, 1)])
+
+    assert response.status_code == 400
+    assert 'Minimum order amount' in response.json['error']
+
+
+def test_quantity_limit(client, customer, place_order):
+    huge = [{'menu_item_id': 1, 'quantity': 10 ** 20}]
+    assert client.post('/api/order/quote', json={'items': huge}).status_code == 400
+
+    response = place_order(customer, [(1, 10 ** 20)])
+
+    assert response.status_code == 400
+    assert response.json['error'] == (
+        f'Quantity for menu item 1 must be at most {Config.MAX_ITEM_QUANTITY}')
+    assert place_order(customer, [(1, Config.MAX_ITEM_QUANTITY)]).status_code == 201
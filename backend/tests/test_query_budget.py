@@ -0,0 +1,26 @@
+"""
+SQL statement budgets on the hot endpoints (common.pytest_plugin)
+"""
+
+import pytest
+
+PLACE_ORDER_BUDGET = 6
+
+
+@pytest.mark.parametrize('item_count', [1, 8])
+def test_place_order_budget_is_flat(customer, place_order, query_budget, item_count):
+    # Seed menu items 1-8 are all available
+    with query_budget(PLACE_ORDER_BUDGET, endpoint='order.place_order'):
+        response = place_order(customer, [(item_id, 2) for item_id in range(1, item_count + 1)])
+
+    assert response.status_code == 201, response.json
+
+
+@pytest.mark.query_budget(1, endpoint='order.update_order_status')
+def test_status_change_is_one_statement(client, admin_headers, customer, place_order):
+    order_id = place_order(customer, [(1, 1)]).json['order_id']
+
+    response = client.put(f'/api/order/update-status/{order_id}', json={'status': 'confirmed'},
+                          headers=admin_headers)
+
+    assert response.status_code == 200
@@ -0,0 +1,35 @@
+"""
+Login throttling: per-account buckets are drained by failed attempts only
+"""
+
+import pytest
+
+from common.rate_limit import MemoryBucketStore, login_limiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setattr(login_limiter, 'enabled', True)
+    monkeypatch.setattr(login_limiter, 'store', MemoryBucketStore())
+    monkeypatch.setattr(login_limiter, 'ip_burst', 100)
+    monkeypatch.setattr(login_limiter, 'identifier_burst', 2)
+    return login_limiter
+
+
+def _login(client, customer, password):
+    return client.post('/api/user/login', json={'email': customer['email'], 'password': password})
+
+
+def test_successful_logins_do_not_lock_the_account(client, customer, limiter):
+    for _ in range(5):
+        assert _login(client, customer, 'Passw0rd!').status_code == 200
+
+
+def test_failed_logins_lock_the_account(client, customer, limiter):
+    assert _login(client, customer, 'wrong').status_code == 401
+    assert _login(client, customer, 'Passw0rd!').status_code == 200
+    assert _login(client, customer, 'wrong').status_code == 401
+
+    locked = _login(client, customer, 'Passw0rd!')
+    assert locked.status_code == 429
+    assert int(locked.headers['Retry-After']) > 0
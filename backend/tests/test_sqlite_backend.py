@@ -0,0 +1,51 @@
+"""
+Embedded SQLite backend: dialect translation, schema port and a full API round trip
+"""
+
+from common import Database
+from common.db_backends import translate
+
+
+def test_translate_mysql_dialect():
+    assert translate("SELECT id FROM orders WHERE id = %s FOR UPDATE") == (
+        "SELECT id FROM orders WHERE id = ?", True)
+    assert translate("SELECT * FROM users WHERE email LIKE %s") == (
+        "SELECT * FROM users WHERE email LIKE ?", False)
+    assert translate("UPDATE orders SET delivered_at = NOW() WHERE id = %(id)s") == (
+        "UPDATE orders SET delivered_at = datetime('now', 'localtime') WHERE id = :id", True)
+
+
+def test_seed_data_and_views(app):
+    assert Database.execute_query(
+        "SELECT username FROM admins WHERE username = %s", ('admin',), fetch_one=True)
+    rows = Database.execute_query("SELECT * FROM menu_with_ratings_view", fetch_all=True)
+    assert len(rows) >= 8
+
+
+def test_order_round_trip(client, customer, place_order):
+    placed = place_order(customer, [(1, 2)])
+    assert placed.status_code == 201
+    # after_order_insert_number trigger
+    assert placed.json['order_number'].startswith('ORD')
+
+    orders = client.get('/api/order/my-orders', headers=customer['headers']).json['orders']
+    assert [order['id'] for order in orders] == [placed.json['order_id']]
+    assert orders[0]['items'][0]['quantity'] == 2
+
+    # after_order_insert_stats trigger
+    stats = Database.execute_query(
+        "SELECT order_count FROM user_order_stats WHERE user_id = %s",
+        (customer['id'],), fetch_one=True)
+    assert stats['order_count'] == 1
+
+
+def test_failed_transaction_rolls_back(app):
+    count = "SELECT COUNT(*) as n FROM categories"
+    before = Database.execute_query(count, fetch_one=True)['n']
+    try:
+        with Database.get_cursor() as cursor:
+            cursor.execute("INSERT INTO categories (name) VALUES (%s)", ('Rolled back',))
+            raise RuntimeError('abort')
+    except RuntimeError:
+        pass
+    assert Database.execute_query(count, fetch_one=True)['n'] == before
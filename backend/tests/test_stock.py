@@ -0,0 +1,129 @@
+"""
+Menu item stock: reservation on order placement and restock on cancel
+"""
+
+import threading
+
+from common import Database
+
+
+def _cancel(client, admin_headers, order_id):
+    return client.put(f'/api/order/update-status/{order_id}',
+                      json={'status': 'cancelled'}, headers=admin_headers)
+
+
+def test_reservation_and_sellout(menu_items, set_stock, stock_of, customer, place_order):
+    set_stock(2, 3)
+
+    assert place_order(customer, [(2, 2)]).status_code == 201
+    assert stock_of(2) == {'stock_quantity': 1, 'is_available': True}
+
+    short = place_order(customer, [(2, 2)])
+    assert short.status_code == 409
+
+    assert place_order(customer, [(2, 1)]).status_code == 201
+    assert stock_of(2) == {'stock_quantity': 0, 'is_available': False}
+
+
+def test_failed_reservation_writes_nothing(app, menu_items, set_stock, customer, place_order):
+    set_stock(2, 1)
+    before = Database.execute_query("SELECT COUNT(*) as n FROM orders", fetch_one=True)['n']
+
+    response = place_order(customer, [(1, 1), (2, 5)])
+
+    assert response.status_code == 409
+    after = Database.execute_query("SELECT COUNT(*) as n FROM orders", fetch_one=True)['n']
+    assert after == before
+
+
+def test_stale_price_table_does_not_oversell(client, menu_items, set_stock, stock_of,
+                                             customer, place_order):
+    client.post('/api/order/quote', json={'items': [{'menu_item_id': 6, 'quantity': 1}]})
+    # Item becomes stock-tracked in another worker; this worker's cache still says untracked
+    set_stock(6, 1)
+
+    assert place_order(customer, [(6, 1)]).status_code == 201
+    sold_out = place_order(customer, [(6, 1)])
+    assert sold_out.status_code == 400
+    assert sold_out.json['error'] == 'Menu item 6 is not available'
+    assert stock_of(6)['stock_quantity'] == 0
+
+
+def test_cancel_restocks_what_was_reserved(client, admin_headers, menu_items, set_stock,
+                                           stock_of, customer, place_order):
+    set_stock(2, 2)
+    order_id = place_order(customer, [(2, 2), (4, 1)]).json['order_id']
+    assert stock_of(2) == {'stock_quantity': 0, 'is_available': False}
+    # Item 4 was not tracked when ordered; tracking it now must not add phantom stock
+    set_stock(4, 10)
+
+    assert _cancel(client, admin_headers, order_id).status_code == 200
+
+    assert stock_of(2) == {'stock_quantity': 2, 'is_available': True}
+    assert stock_of(4)['stock_quantity'] == 10
+
+
+def test_admin_stock_controls_availability(client, admin_headers, menu_items, stock_of):
+    assert client.put('/api/admin/menu/items/5', json={'stock_quantity': 0},
+                      headers=admin_headers).status_code == 200
+    assert stock_of(5) == {'stock_quantity': 0, 'is_available': False}
+
+    assert client.put('/api/admin/menu/items/5', json={'stock_quantity': 4},
+                      headers=admin_headers).status_code == 200
+    assert stock_of(5) == {'stock_quantity': 4, 'is_available': True}
+
+    assert client.put('/api/admin/menu/items/5', json={'stock_quantity': -1},
+                      headers=admin_headers).status_code == 400
+
+
+def _place_at_once(app, customer, items, count=2):
+    """Place the same order from several threads released together"""
+    barrier = threading.Barrier(count)
+    responses = [None] * count
+
+    def place(index):
+        client = app.test_client()
+        barrier.wait()
+        responses[index] = client.post('/api/order/place', headers=customer['headers'], json={
+            'items': [{'menu_item_id': item_id, 'quantity': quantity}
+                      for item_id, quantity in items],
+            'delivery_address': '1 Test Street',
+            'payment_method': 'cash'
+        })
+
+    threads = [threading.Thread(target=place, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return responses
+
+
+def test_untracked_items_are_not_locked(app, menu_items, stock_of, customer):
+    statements = []
+
+    def record(statement, params, elapsed, rowcount):
+        statements.append(statement)
+
+    assert stock_of(1)['stock_quantity'] is None
+    Database.add_query_hook(record)
+    try:
+        responses = _place_at_once(app, customer, [(1, 1)])
+    finally:
+        Database.remove_query_hook(record)
+
+    assert [response.status_code for response in responses] == [201, 201]
+    # Untracked rows are only read; nothing takes a row lock on menu_items
+    locking = [s for s in statements
+               if 'UPDATE MENU_ITEMS' in ' '.join(s.upper().split()) or 'FOR UPDATE' in s.upper()]
+    assert locking == []
+    assert stock_of(1) == {'stock_quantity': None, 'is_available': True}
+
+
+def test_last_unit_is_sold_once(app, menu_items, set_stock, stock_of, customer):
+    set_stock(2, 1)
+
+    responses = _place_at_once(app, customer, [(2, 1)])
+
+    assert [response.status_code for response in responses].count(201) == 1
+    assert stock_of(2) == {'stock_quantity': 0, 'is_available': False}
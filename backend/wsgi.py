@@ -0,0 +1,17 @@
+"""
+Food Ordering System - WSGI entry point
+Production serving through a multi-process server (see gunicorn.conf.py)
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import os
+
+# Production config unless explicitly overridden (SECRET_KEY / JWT_SECRET_KEY must be set)
+os.environ.setdefault('FLASK_ENV', 'production')
+
+from app import create_app  # noqa: E402
+
+app = create_app(os.environ['FLASK_ENV'])
+application = app
@@ -0,0 +1,213 @@
+"""
+Order History Archival Job for Food Ordering System
+Moves finished orders (delivered or cancelled) older than a horizon, with
+their items and invoices, from the hot tables into the *_archive tables,
+and old activity_logs rows into activity_logs_archive.
+
+Work is done in bounded batches, one transaction per batch, so row locks
+are held briefly and the job can be interrupted and re-run at any time.
+Archived rows keep their ids. Feedback rows stay where they are.
+
+Read endpoints serve only the hot tables unless ?include_archived=true.
+
+Requires migration 002 (python database/migrate.py).
+
+Usage:
+    python database/archive_orders.py                   # orders > 90 days, logs > 30 days
+    python database/archive_orders.py --days 180 --batch-size 500
+    python database/archive_orders.py --dry-run         # count what would move
+
+Schedule it daily (cron / Task Scheduler) during low traffic.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from mysql.connector import Error
+
+from migrate import connect
+
+DEFAULT_ORDER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS') or 90)
+DEFAULT_LOG_DAYS = int(os.environ.get('ARCHIVE_LOGS_AFTER_DAYS') or 30)
+
+FINISHED_STATUSES = ('delivered', 'cancelled')
+
+
+def table_columns(cursor, table):
+    """Column names of a table in ordinal order"""
+    cursor.execute(
+        """SELECT COLUMN_NAME FROM information_schema.COLUMNS
+           WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+           ORDER BY ORDINAL_POSITION""",
+        (table,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def copy_statement(cursor, table, where):
+    """INSERT INTO <table>_archive (...) SELECT ... FROM <table> WHERE <where>"""
+    archive_columns = set(table_columns(cursor, f"{table}_archive"))
+    if not archive_columns:
+        raise RuntimeError(f"{table}_archive is missing - run: python database/migrate.py")
+    columns = ', '.join(c for c in table_columns(cursor, table) if c in archive_columns)
+    return f"INSERT INTO {table}_archive ({columns}) SELECT {columns} FROM {table} WHERE {where}"
+
+
+def archive_orders(connection, cutoff, batch_size, pause, dry_run):
+    """
+    Move finished orders created before cutoff, batch by batch
+
+    Returns:
+        Number of orders archived
+    """
+    cursor = connection.cursor()
+    status_list = ', '.join(['%s'] * len(FINISHED_STATUSES))
+    select_batch = (
+        f"SELECT id FROM orders WHERE status IN ({status_list}) AND created_at < %s "
+        f"ORDER BY id LIMIT %s FOR UPDATE"
+    )
+
+    if dry_run:
+        cursor.execute(
+            f"SELECT COUNT(*) FROM orders WHERE status IN ({status_list}) AND created_at < %s",
+            FINISHED_STATUSES + (cutoff,)
+        )
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count
+
+    copy_orders = copy_statement(cursor, 'orders', 'id IN ({})')
+    copy_items = copy_statement(cursor, 'order_items', 'order_id IN ({})')
+    copy_invoices = copy_statement(cursor, 'invoices', 'order_id IN ({})')
+
+    total = 0
+    while True:
+        cursor.execute(select_batch, FINISHED_STATUSES + (cutoff, batch_size))
+        ids = tuple(row[0] for row in cursor.fetchall())
+        if not ids:
+            connection.rollback()
+            break
+
+        placeholders = ','.join(['%s'] * len(ids))
+        try:
+            # Children first, so nothing is left pointing at a moved order
+            cursor.execute(copy_items.format(placeholders), ids)
+            cursor.execute(copy_invoices.format(placeholders), ids)
+            cursor.execute(copy_orders.format(placeholders), ids)
+            cursor.execute(f"DELETE FROM order_items WHERE order_id IN ({placeholders})", ids)
+            cursor.execute(f"DELETE FROM invoices WHERE order_id IN ({placeholders})", ids)
+            cursor.execute(f"DELETE FROM orders WHERE id IN ({placeholders})", ids)
+            connection.commit()
+        except Error:
+            connection.rollback()
+            raise
+
+        total += len(ids)
+        print(f"   archived {total:,} orders (up to id {ids[-1]})", end='\r')
+        if len(ids) < batch_size:
+            break
+        time.sleep(pause)
+
+    cursor.close()
+    if total:
+        print()
+    return total
+
+
+def archive_activity_logs(connection, cutoff, batch_size, pause, dry_run):
+    """
+    Move activity log rows created before cutoff, batch by batch
+
+    Returns:
+        Number of log rows archived
+    """
+    cursor = connection.cursor()
+
+    if dry_run:
+        cursor.execute("SELECT COUNT(*) FROM activity_logs WHERE created_at < %s", (cutoff,))
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count
+
+    copy_logs = copy_statement(cursor, 'activity_logs', 'id BETWEEN %s AND %s AND created_at < %s')
+
+    total = 0
+    while True:
+        cursor.execute(
+            "SELECT id FROM activity_logs WHERE created_at < %s ORDER BY id LIMIT %s",
+            (cutoff, batch_size)
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            connection.rollback()
+            break
+
+        bounds = (ids[0], ids[-1], cutoff)
+        try:
+            cursor.execute(copy_logs, bounds)
+            cursor.execute(
+                "DELETE FROM activity_logs WHERE id BETWEEN %s AND %s AND created_at < %s", bounds
+            )
+            connection.commit()
+        except Error:
+            connection.rollback()
+            raise
+
+        total += len(ids)
+        print(f"   archived {total:,} activity log rows", end='\r')
+        if len(ids) < batch_size:
+            break
+        time.sleep(pause)
+
+    cursor.close()
+    if total:
+        print()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Archive old orders and activity logs')
+    parser.add_argument('--days', type=int, default=DEFAULT_ORDER_DAYS,
+                        help=f'archive finished orders older than this (default {DEFAULT_ORDER_DAYS})')
+    parser.add_argument('--log-days', type=int, default=DEFAULT_LOG_DAYS,
+                        help=f'archive activity logs older than this (default {DEFAULT_LOG_DAYS})')
+    parser.add_argument('--batch-size', type=int, default=1000, help='rows per transaction (default 1000)')
+    parser.add_argument('--pause', type=float, default=0.05,
+                        help='seconds to sleep between batches (default 0.05)')
+    parser.add_argument('--dry-run', action='store_true', help='only count what would be archived')
+    args = parser.parse_args(argv)
+
+    now = datetime.now()
+    order_cutoff = now - timedelta(days=args.days)
+    log_cutoff = now - timedelta(days=args.log_days)
+
+    try:
+        connection = connect()
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return 1
+
+    verb = 'Would archive' if args.dry_run else 'Archived'
+    try:
+        print(f"→ Orders finished before {order_cutoff:%Y-%m-%d %H:%M}...")
+        orders = archive_orders(connection, order_cutoff, args.batch_size, args.pause, args.dry_run)
+        print(f"✓ {verb} {orders:,} orders (with their items and invoices)")
+
+        print(f"→ Activity logs before {log_cutoff:%Y-%m-%d %H:%M}...")
+        logs = archive_activity_logs(connection, log_cutoff, args.batch_size, args.pause, args.dry_run)
+        print(f"✓ {verb} {logs:,} activity log rows")
+        return 0
+
+    except (Error, RuntimeError) as e:
+        print(f"\n✗ Archival failed: {e}")
+        return 1
+
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
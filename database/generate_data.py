@@ -0,0 +1,565 @@
+"""
+Synthetic Data Generator for Food Ordering System
+Fills the database with load-scale users, orders, order items, invoices and
+feedback so queries and endpoints can be benchmarked at realistic volume
+
+Distributions:
+  - menu item popularity follows a Zipf law (a few dishes dominate)
+  - order times peak at lunch and dinner, busier on Fri/Sat/Sun
+  - heavy users: a small share of customers place most of the orders
+  - basket sizes are geometric (mostly 1-3 lines), quantities mostly 1
+  - ratings are J-shaped (mostly 4-5 stars), skewed per dish quality tier
+
+Rows are generated in parallel chunks (one process and connection per
+worker) with pre-assigned ids, and loaded with multi-row INSERTs or with
+LOAD DATA LOCAL INFILE from generated TSV files (--method load-data, needs
+local_infile=ON on the server). New rows are appended after existing ids.
+
+Usage:
+    python database/generate_data.py --users 10000 --orders 50000
+    python database/generate_data.py --users 1000000 --orders 3000000 \\
+        --menu-items 300 --workers 8 --method load-data      # ~10M rows
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from multiprocessing import Pool, cpu_count
+
+import mysql.connector
+from mysql.connector import Error
+from werkzeug.security import generate_password_hash
+
+from migrate import DB_CONFIG, DB_NAME
+
+# Keep in sync with Config.TAX_RATE in backend/common/config.py
+TAX_RATE = 0.10
+
+# Password of every generated user
+DEFAULT_PASSWORD = 'password123'
+
+# Relative order volume per hour of day (lunch and dinner peaks)
+HOUR_WEIGHTS = [1.0, 0.5, 0.3, 0.2, 0.2, 0.3, 0.8, 1.5, 2.0, 2.0, 3.0, 7.0,
+                10.0, 8.0, 4.0, 2.5, 3.0, 6.0, 9.0, 10.0, 7.0, 4.0, 2.5, 1.5]
+# Relative volume per weekday (Monday = 0)
+WEEKDAY_WEIGHTS = [1.0, 0.95, 1.0, 1.05, 1.3, 1.35, 1.15]
+
+# Extra lines in a basket: P(another line) and the cap
+BASKET_CONTINUE = 0.45
+BASKET_MAX_LINES = 8
+QUANTITY_WEIGHTS = {1: 78, 2: 15, 3: 5, 4: 2}
+
+PAYMENT_METHOD_WEIGHTS = {'cash': 35, 'card': 45, 'online': 20}
+CANCEL_RATE = 0.06
+
+# Star-rating weights (1..5) per dish quality tier
+RATING_WEIGHTS = {
+    'great': [2, 3, 7, 28, 60],
+    'good': [4, 6, 13, 32, 45],
+    'poor': [15, 17, 25, 25, 18],
+}
+QUALITY_TIERS = {'great': 20, 'good': 65, 'poor': 15}
+
+COMMENTS = {
+    1: ['Cold on arrival.', 'Not what I ordered.', 'Would not order again.'],
+    2: ['Too salty.', 'Portion was small.', 'Took too long.'],
+    3: ['It was okay.', 'Average, nothing special.', 'Decent for the price.'],
+    4: ['Tasty, will order again.', 'Good portion size.', 'Arrived hot and fresh.'],
+    5: ['Excellent!', 'Best in town.', 'Perfect every time.'],
+}
+INSTRUCTIONS = ['Ring the bell', 'Leave at the door', 'Extra napkins please',
+                'No onions', 'Call on arrival', 'Extra spicy']
+STREETS = ['Main', 'Oak', 'Pine', 'Maple', 'Cedar', 'Elm', 'Lake', 'Hill',
+           'Park', 'River', 'Sunset', 'Market']
+CITIES = ['Springfield', 'Riverton', 'Lakeside', 'Fairview', 'Georgetown',
+          'Franklin', 'Clinton', 'Madison']
+
+DISH_ADJECTIVES = ['Spicy', 'Smoky', 'Classic', 'Grilled', 'Crispy', 'Garlic',
+                   'Herb', 'Lemon', 'Truffle', 'Honey', 'Rustic', 'House']
+DISH_PRICE_RANGE = (299, 2499)  # cents
+
+# Statements per multi-row INSERT
+INSERT_BATCH = 2000
+
+USER_COLUMNS = ('id', 'username', 'email', 'password', 'phone', 'address',
+                'created_at', 'updated_at', 'is_active')
+ORDER_COLUMNS = ('id', 'user_id', 'order_number', 'total_amount', 'status',
+                 'payment_method', 'payment_status', 'delivery_address',
+                 'special_instructions', 'created_at', 'updated_at', 'delivered_at')
+ORDER_ITEM_COLUMNS = ('order_id', 'menu_item_id', 'quantity', 'price', 'subtotal',
+                      'special_request', 'created_at')
+INVOICE_COLUMNS = ('order_id', 'invoice_number', 'user_id', 'subtotal', 'tax_amount',
+                   'discount_amount', 'total_amount', 'invoice_date', 'due_date')
+FEEDBACK_COLUMNS = ('user_id', 'order_id', 'menu_item_id', 'rating', 'comment',
+                    'is_approved', 'created_at', 'updated_at')
+
+
+# ============================================
+# HELPERS
+# ============================================
+
+def cents(amount):
+    """Format integer cents as a DECIMAL(10, 2) literal"""
+    return f"{amount // 100}.{amount % 100:02d}"
+
+
+def timestamp(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+
+def weighted_table(weights):
+    """(values, cumulative weights) for fast random.choices(cum_weights=...)"""
+    return list(weights), list(accumulate(weights.values()))
+
+
+def connect(allow_local_infile=False):
+    return mysql.connector.connect(database=DB_NAME, allow_local_infile=allow_local_infile,
+                                   **DB_CONFIG)
+
+
+def tsv_value(value):
+    if value is None:
+        return '\\N'
+    if value is True or value is False:
+        return '1' if value else '0'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def write_rows(connection, table, columns, rows, method, tmp_dir, tag):
+    """Load rows into table with multi-row INSERTs or LOAD DATA LOCAL INFILE"""
+    if not rows:
+        return
+    cursor = connection.cursor()
+    column_list = ', '.join(columns)
+
+    if method == 'load-data':
+        path = os.path.join(tmp_dir, f"{table}_{tag}.tsv")
+        with open(path, 'w', encoding='utf-8', newline='\n') as file:
+            for row in rows:
+                file.write('\t'.join(tsv_value(value) for value in row))
+                file.write('\n')
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({column_list})",
+            (path.replace('\\', '/'),)
+        )
+        os.remove(path)
+    else:
+        # executemany rewrites a plain INSERT ... VALUES into one multi-row statement
+        query = (f"INSERT INTO {table} ({column_list}) "
+                 f"VALUES ({', '.join(['%s'] * len(columns))})")
+        for start in range(0, len(rows), INSERT_BATCH):
+            cursor.executemany(query, rows[start:start + INSERT_BATCH])
+    cursor.close()
+
+
+# ============================================
+# WORKERS
+# ============================================
+
+_settings = None
+_connection = None
+
+
+def init_worker(settings):
+    """Pool initializer: one connection per worker with bulk-load session settings"""
+    global _settings, _connection
+    _settings = settings
+    _connection = connect(allow_local_infile=settings['method'] == 'load-data')
+    _connection.autocommit = False
+    cursor = _connection.cursor()
+    # Ids are pre-assigned and consistent, so skip per-row constraint checks
+    cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+    cursor.close()
+
+
+def generate_users(task):
+    """Generate and load one chunk of users"""
+    chunk, first_id, count = task
+    rng = random.Random(_settings['seed'] * 1000003 + chunk)
+    window_start = _settings['window_start']
+    password = _settings['password_hash']
+
+    rows = []
+    for user_id in range(first_id, first_id + count):
+        created = window_start - timedelta(seconds=rng.randrange(365 * 86400))
+        rows.append((
+            user_id,
+            f"loaduser{user_id}",
+            f"loaduser{user_id}@example.test",
+            password,
+            f"555{rng.randrange(10 ** 7):07d}",
+            random_address(rng),
+            timestamp(created),
+            timestamp(created),
+            rng.random() > 0.03
+        ))
+
+    write_rows(_connection, 'users', USER_COLUMNS, rows,
+               _settings['method'], _settings['tmp_dir'], f"u{chunk}")
+    _connection.commit()
+    return len(rows)
+
+
+def generate_orders(task):
+    """Generate and load one chunk of orders with their items, invoices and feedback"""
+    chunk, first_id, count = task
+    settings = _settings
+    rng = random.Random(settings['seed'] * 1000003 + 500009 + chunk)
+
+    item_ids = settings['item_ids']
+    item_prices = settings['item_prices']
+    item_cum = settings['item_cum_weights']
+    item_tiers = settings['item_tiers']
+    user_ids = settings['user_ids']
+    user_skew = settings['user_skew']
+    now = settings['now']
+    days = settings['days']
+    hours, hour_cum = weighted_table(dict(enumerate(HOUR_WEIGHTS)))
+    quantities, quantity_cum = weighted_table(QUANTITY_WEIGHTS)
+    methods, method_cum = weighted_table(PAYMENT_METHOD_WEIGHTS)
+    max_weekday = max(WEEKDAY_WEIGHTS)
+
+    orders, order_items, invoices, feedback = [], [], [], []
+
+    for order_id in range(first_id, first_id + count):
+        # Heavy users: low positions in the user list are picked far more often
+        user_id = user_ids[int(len(user_ids) * rng.random() ** user_skew)]
+
+        # Day (weekday-weighted by rejection) and hour (lunch/dinner peaks)
+        while True:
+            day = (now - timedelta(days=rng.randrange(days))).date()
+            if rng.random() * max_weekday <= WEEKDAY_WEIGHTS[day.weekday()]:
+                break
+        hour = rng.choices(hours, cum_weights=hour_cum)[0]
+        created = datetime(day.year, day.month, day.day, hour,
+                           rng.randrange(60), rng.randrange(60))
+        if created > now:
+            created = now - timedelta(seconds=rng.randrange(3600))
+
+        # Basket: geometric number of lines over Zipf-popular items
+        lines = 1
+        while lines < BASKET_MAX_LINES and rng.random() < BASKET_CONTINUE:
+            lines += 1
+        basket = {}
+        for index in rng.choices(range(len(item_ids)), cum_weights=item_cum, k=lines):
+            quantity = rng.choices(quantities, cum_weights=quantity_cum)[0]
+            basket[index] = basket.get(index, 0) + quantity
+
+        total = 0
+        for index, quantity in basket.items():
+            price = item_prices[index]
+            subtotal = price * quantity
+            total += subtotal
+            order_items.append((order_id, item_ids[index], quantity, cents(price),
+                                cents(subtotal), None, timestamp(created)))
+
+        # Status follows the order's age; old orders are delivered or cancelled
+        age_minutes = (now - created).total_seconds() / 60
+        method = rng.choices(methods, cum_weights=method_cum)[0]
+        delivered = None
+        if rng.random() < CANCEL_RATE:
+            status = 'cancelled'
+        elif age_minutes < 10:
+            status = 'pending'
+        elif age_minutes < 20:
+            status = 'confirmed'
+        elif age_minutes < 40:
+            status = 'preparing'
+        elif age_minutes < 60:
+            status = 'ready'
+        else:
+            status = 'delivered'
+            delivered = created + timedelta(minutes=rng.randint(20, 70))
+            if delivered > now:
+                delivered = now
+
+        if status == 'delivered':
+            payment_status = 'paid'
+        elif status == 'cancelled':
+            payment_status = 'pending' if method == 'cash' else 'failed'
+        else:
+            payment_status = 'paid' if method == 'online' else 'pending'
+
+        orders.append((
+            order_id, user_id, f"ORD{order_id:09d}", cents(total), status, method,
+            payment_status, random_address(rng),
+            rng.choice(INSTRUCTIONS) if rng.random() < 0.1 else None,
+            timestamp(created), timestamp(delivered or created), timestamp(delivered)
+        ))
+
+        if status != 'delivered':
+            continue
+
+        if rng.random() < settings['invoice_rate']:
+            tax = (total * int(TAX_RATE * 100) + 50) // 100
+            invoices.append((
+                order_id, f"INV{created:%Y%m%d}{order_id:09d}", user_id,
+                cents(total), cents(tax), '0.00', cents(total + tax),
+                timestamp(delivered), timestamp(delivered + timedelta(days=30))
+            ))
+
+        if rng.random() < settings['feedback_rate']:
+            index = rng.choice(list(basket)) if rng.random() < 0.8 else None
+            tier = item_tiers[index] if index is not None else 'good'
+            rating = rng.choices((1, 2, 3, 4, 5), weights=RATING_WEIGHTS[tier])[0]
+            reviewed = min(delivered + timedelta(minutes=rng.randint(30, 4320)), now)
+            feedback.append((
+                user_id, order_id, item_ids[index] if index is not None else None,
+                rating, rng.choice(COMMENTS[rating]) if rng.random() < 0.5 else None,
+                rng.random() < 0.8, timestamp(reviewed), timestamp(reviewed)
+            ))
+
+    method, tmp_dir, tag = settings['method'], settings['tmp_dir'], f"o{chunk}"
+    write_rows(_connection, 'orders', ORDER_COLUMNS, orders, method, tmp_dir, tag)
+    write_rows(_connection, 'order_items', ORDER_ITEM_COLUMNS, order_items, method, tmp_dir, tag)
+    write_rows(_connection, 'invoices', INVOICE_COLUMNS, invoices, method, tmp_dir, tag)
+    write_rows(_connection, 'feedback', FEEDBACK_COLUMNS, feedback, method, tmp_dir, tag)
+    _connection.commit()
+    return len(orders) + len(order_items) + len(invoices) + len(feedback)
+
+
+def random_address(rng):
+    return (f"{rng.randint(1, 9999)} {rng.choice(STREETS)} St, "
+            f"{rng.choice(CITIES)}")
+
+
+# ============================================
+# SETUP AND FINALIZATION (main process)
+# ============================================
+
+def next_id(cursor, table):
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def add_menu_items(connection, count, rng):
+    """Add extra menu items across the active categories"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT id, name FROM categories WHERE is_active = TRUE ORDER BY id")
+    categories = cursor.fetchall()
+    if not categories:
+        raise RuntimeError("No categories found - run setup_database.py first")
+
+    first_id = next_id(cursor, 'menu_items')
+    rows = []
+    for item_id in range(first_id, first_id + count):
+        category_id, category_name = categories[item_id % len(categories)]
+        rows.append((
+            item_id, category_id,
+            f"{rng.choice(DISH_ADJECTIVES)} {category_name.rstrip('s')} #{item_id}",
+            f"Generated {category_name.lower()} item",
+            cents(rng.randint(*DISH_PRICE_RANGE)),
+            rng.random() < 0.1
+        ))
+    cursor.executemany(
+        "INSERT INTO menu_items (id, category_id, name, description, price, is_featured) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        rows
+    )
+    cursor.execute(
+        "INSERT IGNORE INTO menu_item_ratings (menu_item_id, total_ratings, average_rating) "
+        "SELECT id, 0, 0.00 FROM menu_items"
+    )
+    connection.commit()
+    cursor.close()
+
+
+def load_menu(connection, rng, zipf_exponent):
+    """Available menu items with Zipf popularity weights and quality tiers"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT id, price FROM menu_items WHERE is_available = TRUE ORDER BY id")
+    items = cursor.fetchall()
+    cursor.close()
+    if not items:
+        raise RuntimeError("No available menu items to order")
+
+    # Popularity rank is independent of id so new and old items mix
+    ranks = list(range(len(items)))
+    rng.shuffle(ranks)
+    weights = [1.0 / (rank + 1) ** zipf_exponent for rank in ranks]
+    tiers, tier_cum = weighted_table(QUALITY_TIERS)
+    return {
+        'item_ids': [item_id for item_id, _ in items],
+        'item_prices': [int(round(float(price) * 100)) for _, price in items],
+        'item_cum_weights': list(accumulate(weights)),
+        'item_tiers': [rng.choices(tiers, cum_weights=tier_cum)[0] for _ in items],
+    }
+
+
+def suspend_trigger(connection, name):
+    """Drop a trigger for the duration of the load, returning its definition"""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(f"SHOW CREATE TRIGGER {name}")
+    definition = cursor.fetchone()['SQL Original Statement']
+    cursor.execute(f"DROP TRIGGER {name}")
+    cursor.close()
+    return definition
+
+
+def restore_trigger(connection, definition):
+    cursor = connection.cursor()
+    cursor.execute(definition)
+    cursor.close()
+
+
+def refresh_ratings(connection):
+    """Recompute menu_item_ratings the way the after_feedback_insert trigger would"""
+    cursor = connection.cursor()
+    cursor.execute(
+        """INSERT INTO menu_item_ratings
+               (menu_item_id, total_ratings, average_rating, rating_1_count,
+                rating_2_count, rating_3_count, rating_4_count, rating_5_count)
+           SELECT m.id, COUNT(f.id),
+                  COALESCE(AVG(CASE WHEN f.is_approved THEN f.rating END), 0),
+                  COALESCE(SUM(f.rating = 1), 0), COALESCE(SUM(f.rating = 2), 0),
+                  COALESCE(SUM(f.rating = 3), 0), COALESCE(SUM(f.rating = 4), 0),
+                  COALESCE(SUM(f.rating = 5), 0)
+           FROM menu_items m
+           LEFT JOIN feedback f ON f.menu_item_id = m.id
+           GROUP BY m.id
+           ON DUPLICATE KEY UPDATE
+               total_ratings = VALUES(total_ratings),
+               average_rating = VALUES(average_rating),
+               rating_1_count = VALUES(rating_1_count),
+               rating_2_count = VALUES(rating_2_count),
+               rating_3_count = VALUES(rating_3_count),
+               rating_4_count = VALUES(rating_4_count),
+               rating_5_count = VALUES(rating_5_count)"""
+    )
+    connection.commit()
+    cursor.execute("ANALYZE TABLE users, orders, order_items, invoices, feedback, menu_item_ratings")
+    cursor.fetchall()
+    cursor.close()
+
+
+def chunks(first_id, total, size):
+    """(chunk number, first id, count) tasks covering total ids"""
+    return [(number, first_id + start, min(size, total - start))
+            for number, start in enumerate(range(0, total, size))]
+
+
+def run_phase(pool, function, tasks, label):
+    started = time.time()
+    rows = 0
+    for done, loaded in enumerate(pool.imap_unordered(function, tasks), 1):
+        rows += loaded
+        elapsed = time.time() - started
+        print(f"   {label}: chunk {done}/{len(tasks)}, {rows:,} rows "
+              f"({rows / elapsed if elapsed else 0:,.0f} rows/s)", end='\r')
+    print(f"\n✓ {label}: {rows:,} rows in {time.time() - started:.1f}s")
+    return rows
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate load-scale data for the Food Ordering System')
+    parser.add_argument('--users', type=int, default=10000, help='users to create (default 10000)')
+    parser.add_argument('--orders', type=int, default=50000, help='orders to create (default 50000)')
+    parser.add_argument('--menu-items', type=int, default=0, help='extra menu items to add first')
+    parser.add_argument('--days', type=int, default=180, help='order history span in days (default 180)')
+    parser.add_argument('--feedback-rate', type=float, default=0.25,
+                        help='share of delivered orders that get feedback (default 0.25)')
+    parser.add_argument('--invoice-rate', type=float, default=0.6,
+                        help='share of delivered orders that have an invoice (default 0.6)')
+    parser.add_argument('--zipf', type=float, default=1.1, help='menu item popularity exponent (default 1.1)')
+    parser.add_argument('--user-skew', type=float, default=2.0,
+                        help='>1 concentrates orders on fewer users (default 2.0)')
+    parser.add_argument('--workers', type=int, default=cpu_count(), help='parallel worker processes')
+    parser.add_argument('--chunk-size', type=int, default=20000, help='users/orders per chunk (default 20000)')
+    parser.add_argument('--method', choices=['insert', 'load-data'], default='insert',
+                        help='multi-row INSERT or LOAD DATA LOCAL INFILE (default insert)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default 42)')
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    now = datetime.now().replace(microsecond=0)
+
+    try:
+        connection = connect()
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return 1
+
+    tmp_dir = tempfile.mkdtemp(prefix='food_order_data_') if args.method == 'load-data' else None
+    trigger = None
+    started = time.time()
+
+    try:
+        if args.menu_items:
+            print(f"→ Adding {args.menu_items} menu items...")
+            add_menu_items(connection, args.menu_items, rng)
+
+        cursor = connection.cursor()
+        first_user = next_id(cursor, 'users')
+        first_order = next_id(cursor, 'orders')
+        if args.users:
+            user_ids = list(range(first_user, first_user + args.users))
+        else:
+            cursor.execute("SELECT id FROM users ORDER BY id")
+            user_ids = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        if args.orders and not user_ids:
+            print("✗ No users to place orders - use --users")
+            return 1
+
+        settings = {
+            'seed': args.seed,
+            'method': args.method,
+            'tmp_dir': tmp_dir,
+            'now': now,
+            'days': max(args.days, 1),
+            'window_start': now - timedelta(days=max(args.days, 1)),
+            'password_hash': generate_password_hash(DEFAULT_PASSWORD),
+            'user_ids': user_ids,
+            'user_skew': args.user_skew,
+            'feedback_rate': args.feedback_rate,
+            'invoice_rate': args.invoice_rate,
+        }
+        settings.update(load_menu(connection, rng, args.zipf))
+
+        # The feedback trigger re-averages per row; recompute once at the end instead
+        trigger = suspend_trigger(connection, 'after_feedback_insert')
+
+        print(f"→ Generating {args.users:,} users and {args.orders:,} orders "
+              f"with {args.workers} workers ({args.method})...")
+        total = 0
+        with Pool(args.workers, initializer=init_worker, initargs=(settings,)) as pool:
+            if args.users:
+                total += run_phase(pool, generate_users,
+                                   chunks(first_user, args.users, args.chunk_size), 'users')
+            if args.orders:
+                total += run_phase(pool, generate_orders,
+                                   chunks(first_order, args.orders, args.chunk_size),
+                                   'orders, items, invoices, feedback')
+
+        print("→ Refreshing menu item ratings and table statistics...")
+        refresh_ratings(connection)
+
+        print(f"\n✓ Loaded {total:,} rows in {time.time() - started:.1f}s")
+        print(f"  Generated users log in with password '{DEFAULT_PASSWORD}'")
+        return 0
+
+    except Exception as e:
+        print(f"\n✗ Data generation failed: {e}")
+        return 1
+
+    finally:
+        if trigger:
+            restore_trigger(connection, trigger)
+        connection.close()
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Database Migration Runner for Food Ordering System
+Applies numbered schema changes from database/migrations/ exactly once
+
+Migrations are files named NNN_description.sql or NNN_description.py:
+  - .sql files hold one or more statements (CREATE TRIGGER blocks allowed)
+  - .py files define upgrade(cursor) for changes that need logic
+Applied versions are recorded in the schema_migrations table.
+
+Usage:
+    python database/migrate.py             # apply pending migrations
+    python database/migrate.py --status    # list applied / pending migrations
+    python database/migrate.py --check     # EXPLAIN hot queries, verify index use
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import sys
+
+import mysql.connector
+from mysql.connector import Error
+
+# Database configuration (same defaults as setup_database.py, overridable by env)
+DB_CONFIG = {
+    'host': os.environ.get('MYSQL_HOST') or 'localhost',
+    'user': os.environ.get('MYSQL_USER') or 'root',
+    'password': os.environ.get('MYSQL_PASSWORD') or '',
+    'port': int(os.environ.get('MYSQL_PORT') or 3306)
+}
+
+DB_NAME = os.environ.get('MYSQL_DB') or 'food_ordering_system'
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+MIGRATION_FILE = re.compile(r'^(\d+)_([\w-]+)\.(sql|py)$')
+
+# Errors that mean "this change is already in place" - makes re-runs safe
+ALREADY_APPLIED_ERRORS = {
+    1050,  # table already exists
+    1060,  # duplicate column name
+    1061,  # duplicate key name
+    1091,  # can't drop field or key; check that it exists
+    1359,  # trigger already exists
+}
+
+# Hot query shapes and the index each one must use without a filesort
+INDEX_CHECKS = [
+    {
+        'name': 'my orders (user_id, ORDER BY created_at)',
+        'query': "SELECT id, order_number, total_amount, status, created_at "
+                 "FROM orders WHERE user_id = 1 ORDER BY created_at DESC",
+        'index': 'idx_user_created'
+    },
+    {
+        'name': 'order board (status, ORDER BY created_at)',
+        'query': "SELECT id, order_number, total_amount, status, created_at "
+                 "FROM orders WHERE status = 'pending' ORDER BY created_at DESC",
+        'index': 'idx_status_created'
+    },
+    {
+        'name': 'item reviews (menu_item_id, is_approved, ORDER BY created_at)',
+        'query': "SELECT id, rating, comment, created_at FROM feedback "
+                 "WHERE menu_item_id = 1 AND is_approved = TRUE "
+                 "ORDER BY created_at DESC LIMIT 50",
+        'index': 'idx_item_approved_created'
+    },
+    {
+        'name': 'customer search (phone LIKE prefix)',
+        'query': "SELECT id, username, email, phone FROM users WHERE phone LIKE '555%'",
+        'index': 'idx_users_phone'
+    },
+]
+
+
+def connect(database=DB_NAME):
+    """Connect to the application database"""
+    return mysql.connector.connect(database=database, **DB_CONFIG)
+
+
+def discover_migrations():
+    """Return sorted list of (version, name, path) found in the migrations directory"""
+    migrations = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), filename, os.path.join(MIGRATIONS_DIR, filename)))
+    migrations.sort()
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration version numbers in database/migrations")
+    return migrations
+
+
+def split_sql(script):
+    """Split a SQL script into statements, keeping CREATE TRIGGER ... END blocks whole"""
+    lines = []
+    for line in script.split('\n'):
+        if '--' in line:
+            line = line[:line.index('--')]
+        if line.strip():
+            lines.append(line.rstrip())
+
+    statements = []
+    current = []
+    in_trigger = False
+    for chunk in '\n'.join(lines).split(';'):
+        if not chunk.strip():
+            continue
+        current.append(chunk)
+        if re.search(r'\bCREATE\s+TRIGGER\b', chunk, re.IGNORECASE):
+            in_trigger = True
+        if in_trigger and not re.search(r'\bEND\s*$', chunk.strip(), re.IGNORECASE):
+            continue
+        in_trigger = False
+        statements.append(';'.join(current).strip())
+        current = []
+    return statements
+
+
+def ensure_migrations_table(cursor):
+    cursor.execute(
+        """CREATE TABLE IF NOT EXISTS schema_migrations (
+               version INT PRIMARY KEY,
+               name VARCHAR(255) NOT NULL,
+               applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+           ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"""
+    )
+
+
+def applied_versions(cursor):
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def execute_tolerant(cursor, statement):
+    """Execute a statement, ignoring errors that mean it was already applied"""
+    try:
+        cursor.execute(statement)
+    except Error as e:
+        if e.errno in ALREADY_APPLIED_ERRORS:
+            print(f"   ~ already applied: {e.msg}")
+        else:
+            raise
+
+
+def run_migration(cursor, path):
+    if path.endswith('.sql'):
+        with open(path, 'r', encoding='utf-8') as file:
+            for statement in split_sql(file.read()):
+                execute_tolerant(cursor, statement)
+    else:
+        spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.upgrade(cursor)
+
+
+def apply_migrations(connection):
+    """
+    Apply all pending migrations in order
+
+    Returns:
+        Number of migrations applied
+    """
+    cursor = connection.cursor()
+    ensure_migrations_table(cursor)
+    done = applied_versions(cursor)
+
+    applied = 0
+    for version, name, path in discover_migrations():
+        if version in done:
+            continue
+        print(f"→ Applying migration {name}...")
+        try:
+            run_migration(cursor, path)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (version, name)
+            )
+            connection.commit()
+            applied += 1
+            print(f"✓ Applied {name}")
+        except Error as e:
+            connection.rollback()
+            print(f"✗ Migration {name} failed: {e}")
+            raise
+
+    cursor.close()
+    return applied
+
+
+def show_status(connection):
+    cursor = connection.cursor()
+    ensure_migrations_table(cursor)
+    done = applied_versions(cursor)
+    for version, name, _ in discover_migrations():
+        print(f"  [{'x' if version in done else ' '}] {name}")
+    cursor.close()
+
+
+def check_indexes(connection):
+    """
+    EXPLAIN the hot query shapes and confirm each uses its composite index
+    without a filesort
+
+    Returns:
+        True if every check passed
+    """
+    cursor = connection.cursor(dictionary=True)
+    ok = True
+    for check in INDEX_CHECKS:
+        cursor.execute("EXPLAIN " + check['query'])
+        plan = cursor.fetchall()
+        row = plan[0]
+        key = row.get('key')
+        extra = row.get('Extra') or ''
+        passed = key == check['index'] and 'filesort' not in extra.lower()
+        ok = ok and passed
+        print(f"{'✓' if passed else '✗'} {check['name']}: key={key}, extra={extra or '-'}")
+        if not passed:
+            print(f"   expected key={check['index']} without 'Using filesort' "
+                  f"(tiny tables may still be scanned; re-check with realistic data)")
+    cursor.close()
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply Food Ordering System schema migrations')
+    parser.add_argument('--status', action='store_true', help='list applied and pending migrations')
+    parser.add_argument('--check', action='store_true', help='EXPLAIN hot queries and verify index usage')
+    args = parser.parse_args(argv)
+
+    try:
+        connection = connect()
+    except Error as e:
+        print(f"✗ Error connecting to MySQL: {e}")
+        return 1
+
+    try:
+        if args.status:
+            show_status(connection)
+            return 0
+        if args.check:
+            return 0 if check_indexes(connection) else 1
+
+        applied = apply_migrations(connection)
+        print(f"✓ {applied} migration(s) applied" if applied else "✓ Database is up to date")
+        return 0
+    except Error:
+        return 1
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
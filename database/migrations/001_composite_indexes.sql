@@ -0,0 +1,15 @@
+-- Migration 001: Composite indexes for the hot listing queries
+-- Each index matches a WHERE + ORDER BY shape so MySQL reads rows in order
+-- instead of sorting the whole match set (no "Using filesort").
+
+-- GET /api/order/my-orders, /api/feedback/eligible-orders:
+--   orders WHERE user_id = ? ORDER BY created_at DESC
+CREATE INDEX idx_user_created ON orders (user_id, created_at);
+
+-- GET /api/order/all?status=...:
+--   orders WHERE status = ? ORDER BY created_at DESC
+CREATE INDEX idx_status_created ON orders (status, created_at);
+
+-- GET /api/feedback/menu-item/<id>, GET /api/order/menu/<id> reviews:
+--   feedback WHERE menu_item_id = ? AND is_approved = TRUE ORDER BY created_at DESC
+CREATE INDEX idx_item_approved_created ON feedback (menu_item_id, is_approved, created_at);
@@ -0,0 +1,44 @@
+"""
+Archive tables for order history (see database/archive_orders.py)
+
+orders, order_items, invoices and activity_logs each get a <table>_archive
+copy with the same columns and indexes (CREATE TABLE ... LIKE), plus an
+archived_at column. Archive tables have no foreign keys.
+
+RANGE partitioning on created_at is not an option here: InnoDB does not
+support foreign keys on partitioned tables, and orders is referenced by
+order_items, invoices and feedback.
+
+Feedback stays in the hot table when its order is archived, so the
+feedback -> orders foreign key (ON DELETE CASCADE) is dropped; otherwise
+archiving an order would delete its reviews.
+"""
+
+from mysql.connector import Error
+
+ARCHIVED_TABLES = ('orders', 'order_items', 'invoices', 'activity_logs')
+
+
+def upgrade(cursor):
+    for table in ARCHIVED_TABLES:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table}_archive LIKE {table}")
+        try:
+            cursor.execute(
+                f"ALTER TABLE {table}_archive "
+                f"ADD COLUMN archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+                f"ADD INDEX idx_archived_at (archived_at)"
+            )
+        except Error as e:
+            if e.errno != 1060:  # duplicate column: already added
+                raise
+
+    cursor.execute(
+        """SELECT CONSTRAINT_NAME
+           FROM information_schema.KEY_COLUMN_USAGE
+           WHERE TABLE_SCHEMA = DATABASE()
+             AND TABLE_NAME = 'feedback'
+             AND COLUMN_NAME = 'order_id'
+             AND REFERENCED_TABLE_NAME = 'orders'"""
+    )
+    for (constraint,) in cursor.fetchall():
+        cursor.execute(f"ALTER TABLE feedback DROP FOREIGN KEY {constraint}")
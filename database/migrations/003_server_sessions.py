@@ -0,0 +1,36 @@
+"""
+Server-side sessions (see backend/common/sessions.py)
+
+user_sessions gains a data column for the serialized session. Admin
+sessions are stored too (user_type = 'admin'), and their user_id is an
+admins.id, so the user_id -> users foreign key is dropped; deleting a
+customer revokes their sessions in the application instead.
+"""
+
+from mysql.connector import Error
+
+
+def upgrade(cursor):
+    try:
+        cursor.execute("ALTER TABLE user_sessions ADD COLUMN data TEXT NULL AFTER user_type")
+    except Error as e:
+        if e.errno != 1060:  # duplicate column: already added
+            raise
+
+    cursor.execute(
+        """SELECT CONSTRAINT_NAME
+           FROM information_schema.KEY_COLUMN_USAGE
+           WHERE TABLE_SCHEMA = DATABASE()
+             AND TABLE_NAME = 'user_sessions'
+             AND COLUMN_NAME = 'user_id'
+             AND REFERENCED_TABLE_NAME = 'users'"""
+    )
+    for (constraint,) in cursor.fetchall():
+        cursor.execute(f"ALTER TABLE user_sessions DROP FOREIGN KEY {constraint}")
+
+    try:
+        # Revoking all sessions of one account
+        cursor.execute("CREATE INDEX idx_user_type_user ON user_sessions (user_id, user_type)")
+    except Error as e:
+        if e.errno != 1061:  # duplicate key name: already created
+            raise
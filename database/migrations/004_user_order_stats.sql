@@ -0,0 +1,64 @@
+-- Migration 004: Per-customer order summary and phone search index
+-- GET /api/admin/users?expand=stats shows order count, lifetime spend and
+-- last order date per customer. user_order_stats keeps those totals up to
+-- date with triggers (like menu_item_ratings for feedback), so the users
+-- page never runs a GROUP BY over orders.
+--
+-- Totals are lifetime: archive_orders.py moves rows to orders_archive
+-- without touching them. Cancelled orders count as orders but add nothing
+-- to total_spent.
+
+CREATE TABLE IF NOT EXISTS user_order_stats (
+    user_id INT PRIMARY KEY,
+    order_count INT NOT NULL DEFAULT 0,
+    total_spent DECIMAL(12, 2) NOT NULL DEFAULT 0.00,
+    last_order_at TIMESTAMP NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- New order: count it and add its total
+CREATE TRIGGER after_order_insert_stats
+AFTER INSERT ON orders
+FOR EACH ROW
+BEGIN
+    INSERT INTO user_order_stats (user_id, order_count, total_spent, last_order_at)
+    VALUES (NEW.user_id, 1, IF(NEW.status = 'cancelled', 0, NEW.total_amount), NEW.created_at)
+    ON DUPLICATE KEY UPDATE
+        order_count = order_count + 1,
+        total_spent = total_spent + VALUES(total_spent),
+        last_order_at = GREATEST(COALESCE(last_order_at, VALUES(last_order_at)), VALUES(last_order_at));
+END;
+
+-- Cancellation or a corrected total: move the difference
+CREATE TRIGGER after_order_update_stats
+AFTER UPDATE ON orders
+FOR EACH ROW
+BEGIN
+    IF NEW.status <> OLD.status OR NEW.total_amount <> OLD.total_amount THEN
+        UPDATE user_order_stats
+        SET total_spent = total_spent
+            - IF(OLD.status = 'cancelled', 0, OLD.total_amount)
+            + IF(NEW.status = 'cancelled', 0, NEW.total_amount)
+        WHERE user_id = NEW.user_id;
+    END IF;
+END;
+
+-- Backfill from hot and archived orders (after the triggers, so no new order
+-- is missed; rows already counted by a trigger are recomputed)
+INSERT INTO user_order_stats (user_id, order_count, total_spent, last_order_at)
+SELECT user_id, COUNT(*), SUM(IF(status = 'cancelled', 0, total_amount)), MAX(created_at)
+FROM (
+    SELECT user_id, status, total_amount, created_at FROM orders
+    UNION ALL
+    SELECT user_id, status, total_amount, created_at FROM orders_archive
+) all_orders
+WHERE user_id IN (SELECT id FROM users)
+GROUP BY user_id
+ON DUPLICATE KEY UPDATE
+    order_count = VALUES(order_count),
+    total_spent = VALUES(total_spent),
+    last_order_at = VALUES(last_order_at);
+
+-- GET /api/admin/users?search=: prefix match on username, email or phone
+--   (username and email already have unique indexes)
+CREATE INDEX idx_users_phone ON users (phone);
@@ -0,0 +1,21 @@
+"""
+Delivery fee on invoices (see backend/modules/order/pricing.py)
+
+Orders are charged subtotal + tax + delivery fee, and invoices are priced
+by the same code. invoices and invoices_archive get a delivery_fee column
+so the printed invoice can show every part of the total.
+"""
+
+from mysql.connector import Error
+
+
+def upgrade(cursor):
+    for table in ('invoices', 'invoices_archive'):
+        try:
+            cursor.execute(
+                f"ALTER TABLE {table} "
+                f"ADD COLUMN delivery_fee DECIMAL(10, 2) DEFAULT 0.00 AFTER tax_amount"
+            )
+        except Error as e:
+            if e.errno != 1060:  # duplicate column: already added
+                raise
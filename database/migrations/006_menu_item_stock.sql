@@ -0,0 +1,9 @@
+-- Migration 006: Stock counter per menu item
+-- NULL means the item is not stock-tracked (the old behaviour: only the
+-- manual is_available flag applies). When set, placing an order decrements
+-- it with a conditional UPDATE (stock_quantity >= ordered quantity) inside
+-- the order transaction, the item switches to unavailable at 0, and
+-- cancelling an order puts the quantities back.
+-- See backend/modules/order/inventory.py.
+
+ALTER TABLE menu_items ADD COLUMN stock_quantity INT NULL DEFAULT NULL AFTER is_available;
@@ -0,0 +1,11 @@
+-- Migration 007: Stock actually taken per order line
+-- reserve_stock records how many units each line took from
+-- menu_items.stock_quantity (0 for items that were not stock-tracked when
+-- the order was placed). Cancelling an order restocks exactly that, so an
+-- item that became tracked after the order does not gain phantom stock.
+-- order_items_archive gets the column too, so archiving keeps it
+-- (database/archive_orders.py copies only columns both tables have).
+-- See backend/modules/order/inventory.py.
+
+ALTER TABLE order_items ADD COLUMN reserved_quantity INT NOT NULL DEFAULT 0 AFTER quantity;
+ALTER TABLE order_items_archive ADD COLUMN reserved_quantity INT NOT NULL DEFAULT 0 AFTER quantity;
@@ -0,0 +1,499 @@
+-- Food Ordering System Database Schema
+-- SQLite port of schema.sql (plus applied migrations) for the embedded
+-- backend used by tests and benchmarks (DB_BACKEND=sqlite).
+-- Keep in sync with schema.sql and database/migrations/.
+--
+-- Differences from MySQL:
+--   ENUM columns are TEXT with CHECK constraints
+--   ON UPDATE CURRENT_TIMESTAMP is emulated with AFTER UPDATE triggers
+--   BEFORE INSERT triggers cannot modify NEW, so generated numbers are
+--   filled in by AFTER INSERT triggers instead
+--   Timestamps are stored as local time text, like MySQL's NOW()
+
+-- ============================================
+-- USER MODULE TABLES
+-- ============================================
+
+-- Users Table
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    phone VARCHAR(20),
+    address TEXT,
+    profile_image VARCHAR(255),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    is_active BOOLEAN DEFAULT TRUE
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+
+-- ============================================
+-- ADMIN MODULE TABLES
+-- ============================================
+
+-- Admins Table
+CREATE TABLE IF NOT EXISTS admins (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) NOT NULL,
+    phone VARCHAR(20),
+    role TEXT DEFAULT 'admin' CHECK (role IN ('super_admin', 'admin', 'manager')),
+    profile_image VARCHAR(255),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    is_active BOOLEAN DEFAULT TRUE,
+    last_login TIMESTAMP NULL
+);
+CREATE INDEX IF NOT EXISTS idx_admins_email ON admins (email);
+CREATE INDEX IF NOT EXISTS idx_admins_username ON admins (username);
+
+-- ============================================
+-- MENU MODULE TABLES
+-- ============================================
+
+-- Categories Table
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    description TEXT,
+    image_url VARCHAR(255),
+    is_active BOOLEAN DEFAULT TRUE,
+    display_order INT DEFAULT 0,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_categories_active ON categories (is_active);
+
+-- Menu Items Table
+CREATE TABLE IF NOT EXISTS menu_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category_id INT NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    name VARCHAR(100) NOT NULL,
+    description TEXT,
+    price DECIMAL(10, 2) NOT NULL,
+    image_url VARCHAR(255),
+    is_available BOOLEAN DEFAULT TRUE,
+    stock_quantity INT NULL DEFAULT NULL,  -- migration 006; NULL = not tracked
+    is_featured BOOLEAN DEFAULT FALSE,
+    preparation_time INT DEFAULT 15,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_menu_items_category ON menu_items (category_id);
+CREATE INDEX IF NOT EXISTS idx_menu_items_available ON menu_items (is_available);
+CREATE INDEX IF NOT EXISTS idx_menu_items_featured ON menu_items (is_featured);
+
+-- ============================================
+-- ORDER MODULE TABLES
+-- ============================================
+
+-- Orders Table
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    order_number VARCHAR(50) UNIQUE NOT NULL,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    status TEXT DEFAULT 'pending'
+        CHECK (status IN ('pending', 'confirmed', 'preparing', 'ready', 'delivered', 'cancelled')),
+    payment_method TEXT DEFAULT 'cash' CHECK (payment_method IN ('cash', 'card', 'online')),
+    payment_status TEXT DEFAULT 'pending' CHECK (payment_status IN ('pending', 'paid', 'failed')),
+    delivery_address TEXT,
+    special_instructions TEXT,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    delivered_at TIMESTAMP NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orders_user ON orders (user_id);
+CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (status);
+CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at);
+
+-- Order Items Table
+CREATE TABLE IF NOT EXISTS order_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    menu_item_id INT NOT NULL REFERENCES menu_items(id) ON DELETE CASCADE,
+    quantity INT NOT NULL DEFAULT 1,
+    reserved_quantity INT NOT NULL DEFAULT 0,  -- migration 007
+    price DECIMAL(10, 2) NOT NULL,
+    subtotal DECIMAL(10, 2) NOT NULL,
+    special_request TEXT,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items (order_id);
+CREATE INDEX IF NOT EXISTS idx_order_items_menu_item ON order_items (menu_item_id);
+
+-- ============================================
+-- INVOICE MODULE TABLES
+-- ============================================
+
+-- Invoices Table
+CREATE TABLE IF NOT EXISTS invoices (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INT UNIQUE NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    invoice_number VARCHAR(50) UNIQUE NOT NULL,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    subtotal DECIMAL(10, 2) NOT NULL,
+    tax_amount DECIMAL(10, 2) DEFAULT 0.00,
+    delivery_fee DECIMAL(10, 2) DEFAULT 0.00,  -- migration 005
+    discount_amount DECIMAL(10, 2) DEFAULT 0.00,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    invoice_date TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    due_date TIMESTAMP NULL,
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_invoices_user ON invoices (user_id);
+CREATE INDEX IF NOT EXISTS idx_invoices_date ON invoices (invoice_date);
+
+-- ============================================
+-- FEEDBACK MODULE TABLES
+-- ============================================
+
+-- Feedback/Reviews Table
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    order_id INT NOT NULL,  -- no FK: the order may move to orders_archive (migration 002)
+    menu_item_id INT NULL REFERENCES menu_items(id) ON DELETE CASCADE,
+    rating INT NOT NULL CHECK (rating >= 1 AND rating <= 5),
+    comment TEXT,
+    is_approved BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    UNIQUE (user_id, order_id)
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_order ON feedback (order_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_menu_item ON feedback (menu_item_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_rating ON feedback (rating);
+CREATE INDEX IF NOT EXISTS idx_feedback_approved ON feedback (is_approved);
+
+-- Menu Item Ratings (Aggregated)
+CREATE TABLE IF NOT EXISTS menu_item_ratings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    menu_item_id INT UNIQUE NOT NULL REFERENCES menu_items(id) ON DELETE CASCADE,
+    total_ratings INT DEFAULT 0,
+    average_rating DECIMAL(3, 2) DEFAULT 0.00,
+    rating_1_count INT DEFAULT 0,
+    rating_2_count INT DEFAULT 0,
+    rating_3_count INT DEFAULT 0,
+    rating_4_count INT DEFAULT 0,
+    rating_5_count INT DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_menu_item_ratings_average ON menu_item_ratings (average_rating);
+
+-- ============================================
+-- SESSION MANAGEMENT (Optional)
+-- ============================================
+
+-- User Sessions Table
+CREATE TABLE IF NOT EXISTS user_sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL,  -- users.id or admins.id (migration 003 drops the FK)
+    session_token VARCHAR(255) UNIQUE NOT NULL,
+    user_type TEXT NOT NULL CHECK (user_type IN ('user', 'admin')),
+    data TEXT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    expires_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_user_sessions_expires ON user_sessions (expires_at);
+CREATE INDEX IF NOT EXISTS idx_user_sessions_user_type_user ON user_sessions (user_id, user_type);
+
+-- ============================================
+-- AUDIT LOG (Optional but recommended)
+-- ============================================
+
+-- Activity Log Table
+CREATE TABLE IF NOT EXISTS activity_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NULL,
+    user_type TEXT DEFAULT 'guest' CHECK (user_type IN ('user', 'admin', 'guest')),
+    action VARCHAR(100) NOT NULL,
+    description TEXT,
+    ip_address VARCHAR(45),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_activity_logs_user ON activity_logs (user_id);
+CREATE INDEX IF NOT EXISTS idx_activity_logs_action ON activity_logs (action);
+CREATE INDEX IF NOT EXISTS idx_activity_logs_created_at ON activity_logs (created_at);
+
+-- ============================================
+-- MIGRATION 001: COMPOSITE INDEXES
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_user_created ON orders (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_status_created ON orders (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_item_approved_created ON feedback (menu_item_id, is_approved, created_at);
+
+-- ============================================
+-- MIGRATION 002: ORDER HISTORY ARCHIVE
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS orders_archive (
+    id INTEGER PRIMARY KEY,
+    user_id INT NOT NULL,
+    order_number VARCHAR(50) NOT NULL,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    status TEXT,
+    payment_method TEXT,
+    payment_status TEXT,
+    delivery_address TEXT,
+    special_instructions TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    delivered_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_orders_archive_user_created ON orders_archive (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_orders_archive_status_created ON orders_archive (status, created_at);
+
+CREATE TABLE IF NOT EXISTS order_items_archive (
+    id INTEGER PRIMARY KEY,
+    order_id INT NOT NULL,
+    menu_item_id INT NOT NULL,
+    quantity INT NOT NULL DEFAULT 1,
+    reserved_quantity INT NOT NULL DEFAULT 0,  -- migration 007
+    price DECIMAL(10, 2) NOT NULL,
+    subtotal DECIMAL(10, 2) NOT NULL,
+    special_request TEXT,
+    created_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_order_items_archive_order ON order_items_archive (order_id);
+
+CREATE TABLE IF NOT EXISTS invoices_archive (
+    id INTEGER PRIMARY KEY,
+    order_id INT NOT NULL,
+    invoice_number VARCHAR(50) NOT NULL,
+    user_id INT NOT NULL,
+    subtotal DECIMAL(10, 2) NOT NULL,
+    tax_amount DECIMAL(10, 2) DEFAULT 0.00,
+    delivery_fee DECIMAL(10, 2) DEFAULT 0.00,  -- migration 005
+    discount_amount DECIMAL(10, 2) DEFAULT 0.00,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    invoice_date TIMESTAMP,
+    due_date TIMESTAMP NULL,
+    notes TEXT,
+    archived_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_invoices_archive_user ON invoices_archive (user_id);
+
+CREATE TABLE IF NOT EXISTS activity_logs_archive (
+    id INTEGER PRIMARY KEY,
+    user_id INT NULL,
+    user_type TEXT,
+    action VARCHAR(100) NOT NULL,
+    description TEXT,
+    ip_address VARCHAR(45),
+    created_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_activity_logs_archive_created_at ON activity_logs_archive (created_at);
+
+-- ============================================
+-- MIGRATION 004: CUSTOMER ORDER SUMMARY
+-- ============================================
+
+-- Lifetime order count/spend per customer, kept by the triggers below
+CREATE TABLE IF NOT EXISTS user_order_stats (
+    user_id INT PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    order_count INT NOT NULL DEFAULT 0,
+    total_spent DECIMAL(12, 2) NOT NULL DEFAULT 0.00,
+    last_order_at TIMESTAMP NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_phone ON users (phone);
+
+-- ============================================
+-- INSERT DEFAULT DATA
+-- ============================================
+
+-- Insert default admin (password: admin123)
+INSERT INTO admins (username, email, password, full_name, role) VALUES
+('admin', 'admin@foodorder.com', 'pbkdf2:sha256:600000$gFmZnwWnyPpJGdtn$eac6bc1bd22da0dcb8b9b38e5cfddcd0e146428b6d21e6490a6d1002f3b0a70a', 'System Admin', 'super_admin');
+
+-- Insert default categories
+INSERT INTO categories (name, description, display_order) VALUES
+('Pizza', 'Delicious pizzas with various toppings', 1),
+('Burgers', 'Juicy burgers with fresh ingredients', 2),
+('Pasta', 'Italian pasta dishes', 3),
+('Salads', 'Fresh and healthy salads', 4),
+('Drinks', 'Refreshing beverages', 5),
+('Desserts', 'Sweet treats and desserts', 6);
+
+-- Insert sample menu items
+INSERT INTO menu_items (category_id, name, description, price, is_featured) VALUES
+(1, 'Margherita Pizza', 'Classic pizza with tomato sauce, mozzarella, and basil', 12.99, TRUE),
+(1, 'Pepperoni Pizza', 'Pizza topped with pepperoni and cheese', 14.99, TRUE),
+(2, 'Classic Burger', 'Beef patty with lettuce, tomato, and cheese', 9.99, TRUE),
+(2, 'Chicken Burger', 'Grilled chicken with special sauce', 10.99, FALSE),
+(3, 'Spaghetti Carbonara', 'Creamy pasta with bacon and parmesan', 13.99, TRUE),
+(3, 'Penne Arrabiata', 'Spicy tomato sauce with penne pasta', 11.99, FALSE),
+(4, 'Caesar Salad', 'Romaine lettuce with caesar dressing', 8.99, FALSE),
+(4, 'Greek Salad', 'Fresh vegetables with feta cheese', 9.99, FALSE),
+(5, 'Coca Cola', 'Refreshing cola drink', 2.99, FALSE),
+(5, 'Fresh Orange Juice', 'Freshly squeezed orange juice', 4.99, FALSE),
+(6, 'Chocolate Cake', 'Rich chocolate cake slice', 6.99, TRUE),
+(6, 'Ice Cream', 'Vanilla ice cream with toppings', 5.99, FALSE);
+
+-- Initialize menu item ratings
+INSERT INTO menu_item_ratings (menu_item_id, total_ratings, average_rating)
+SELECT id, 0, 0.00 FROM menu_items;
+
+-- ============================================
+-- VIEWS FOR EASIER QUERIES
+-- ============================================
+
+-- View: Order Details with User Info
+CREATE VIEW IF NOT EXISTS order_details_view AS
+SELECT
+    o.id,
+    o.order_number,
+    o.total_amount,
+    o.status,
+    o.payment_method,
+    o.payment_status,
+    o.created_at,
+    u.id as user_id,
+    u.username as customer_name,
+    u.email as customer_email,
+    u.phone as customer_phone
+FROM orders o
+JOIN users u ON o.user_id = u.id;
+
+-- View: Menu Items with Ratings
+CREATE VIEW IF NOT EXISTS menu_with_ratings_view AS
+SELECT
+    m.id,
+    m.name,
+    m.description,
+    m.price,
+    m.image_url,
+    m.is_available,
+    m.is_featured,
+    c.name as category_name,
+    c.id as category_id,
+    COALESCE(r.average_rating, 0) as average_rating,
+    COALESCE(r.total_ratings, 0) as total_ratings
+FROM menu_items m
+JOIN categories c ON m.category_id = c.id
+LEFT JOIN menu_item_ratings r ON m.id = r.menu_item_id;
+
+-- ============================================
+-- TRIGGERS
+-- ============================================
+
+-- Trigger: Update menu item ratings when feedback is added
+CREATE TRIGGER IF NOT EXISTS after_feedback_insert
+AFTER INSERT ON feedback
+FOR EACH ROW WHEN NEW.menu_item_id IS NOT NULL
+BEGIN
+    UPDATE menu_item_ratings
+    SET
+        total_ratings = total_ratings + 1,
+        average_rating = (
+            SELECT AVG(rating)
+            FROM feedback
+            WHERE menu_item_id = NEW.menu_item_id AND is_approved = TRUE
+        ),
+        rating_1_count = rating_1_count + (NEW.rating = 1),
+        rating_2_count = rating_2_count + (NEW.rating = 2),
+        rating_3_count = rating_3_count + (NEW.rating = 3),
+        rating_4_count = rating_4_count + (NEW.rating = 4),
+        rating_5_count = rating_5_count + (NEW.rating = 5)
+    WHERE menu_item_id = NEW.menu_item_id;
+END;
+
+-- Triggers: Maintain user_order_stats (migration 004)
+CREATE TRIGGER IF NOT EXISTS after_order_insert_stats
+AFTER INSERT ON orders
+FOR EACH ROW
+BEGIN
+    INSERT INTO user_order_stats (user_id, order_count, total_spent, last_order_at)
+    VALUES (NEW.user_id, 1, CASE WHEN NEW.status = 'cancelled' THEN 0 ELSE NEW.total_amount END,
+            NEW.created_at)
+    ON CONFLICT (user_id) DO UPDATE SET
+        order_count = order_count + 1,
+        total_spent = total_spent + excluded.total_spent,
+        last_order_at = max(COALESCE(last_order_at, excluded.last_order_at), excluded.last_order_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS after_order_update_stats
+AFTER UPDATE OF status, total_amount ON orders
+FOR EACH ROW WHEN NEW.status IS NOT OLD.status OR NEW.total_amount IS NOT OLD.total_amount
+BEGIN
+    UPDATE user_order_stats
+    SET total_spent = total_spent
+        - CASE WHEN OLD.status = 'cancelled' THEN 0 ELSE OLD.total_amount END
+        + CASE WHEN NEW.status = 'cancelled' THEN 0 ELSE NEW.total_amount END
+    WHERE user_id = NEW.user_id;
+END;
+
+-- Trigger: Auto-generate order number
+CREATE TRIGGER IF NOT EXISTS after_order_insert_number
+AFTER INSERT ON orders
+FOR EACH ROW WHEN NEW.order_number IS NULL OR NEW.order_number = ''
+BEGIN
+    UPDATE orders
+    SET order_number = 'ORD' || substr('000000' || (abs(random()) % 999999), -6)
+    WHERE id = NEW.id;
+END;
+
+-- Trigger: Auto-generate invoice number
+CREATE TRIGGER IF NOT EXISTS after_invoice_insert_number
+AFTER INSERT ON invoices
+FOR EACH ROW WHEN NEW.invoice_number IS NULL OR NEW.invoice_number = ''
+BEGIN
+    UPDATE invoices
+    SET invoice_number = 'INV' || strftime('%Y%m%d', 'now', 'localtime')
+                         || substr('0000' || (abs(random()) % 9999), -4)
+    WHERE id = NEW.id;
+END;
+
+-- Triggers: ON UPDATE CURRENT_TIMESTAMP
+CREATE TRIGGER IF NOT EXISTS users_updated_at AFTER UPDATE ON users
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE users SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS admins_updated_at AFTER UPDATE ON admins
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE admins SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS categories_updated_at AFTER UPDATE ON categories
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE categories SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS menu_items_updated_at AFTER UPDATE ON menu_items
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE menu_items SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS orders_updated_at AFTER UPDATE ON orders
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE orders SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS feedback_updated_at AFTER UPDATE ON feedback
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE feedback SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS menu_item_ratings_updated_at AFTER UPDATE ON menu_item_ratings
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE menu_item_ratings SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
@@ -133,6 +133,11 @@ def setup_database():
         # Execute schema file
         print("\n→ Creating tables and inserting data...")
         if execute_sql_file(connection, 'schema.sql'):
+            # Apply numbered schema migrations (indexes and later changes)
+            print("\n→ Applying migrations...")
+            from migrate import apply_migrations
+            apply_migrations(connection)
+
             print("\n" + "="*50)
             print("✓ Database setup completed successfully!")
             print("="*50)
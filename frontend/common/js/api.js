@@ -164,6 +164,25 @@ async function apiDelete(url, options = {}) {
     }
 }
 
+/**
+ * Run several GET requests in one round trip (POST /api/batch)
+ * @param {Object} requests - Map of name -> URL (absolute API URL or /api/... path)
+ * @param {boolean} parallel - Let the server run the requests concurrently
+ * @returns {Promise<Object>} Map of name -> {status, body}
+ */
+async function apiBatch(requests, parallel = true) {
+    const entries = Object.entries(requests).map(([id, url]) => ({
+        id,
+        path: url.startsWith('/') ? url : new URL(url).pathname + new URL(url).search
+    }));
+    const data = await apiPost(API_ENDPOINTS.BATCH, { requests: entries, parallel });
+    const results = {};
+    (data.responses || []).forEach(response => {
+        results[response.id] = { status: response.status, body: response.body };
+    });
+    return results;
+}
+
 /**
  * Handle API errors with user-friendly messages
  * @param {Error} error - Error object
@@ -186,6 +205,7 @@ if (typeof module !== 'undefined' && module.exports) {
         apiPost,
         apiPut,
         apiDelete,
+        apiBatch,
         handleApiError
     };
 }
@@ -12,6 +12,7 @@ const API_ENDPOINTS = {
     USER_LOGIN: `${API_BASE_URL}/user/login`,
     USER_LOGOUT: `${API_BASE_URL}/user/logout`,
     USER_PROFILE: `${API_BASE_URL}/user/profile`,
+    USER_DASHBOARD: `${API_BASE_URL}/user/dashboard`,
     
     // Admin endpoints
     ADMIN_REGISTER: `${API_BASE_URL}/admin/register`,
@@ -29,6 +30,7 @@ const API_ENDPOINTS = {
     ORDER_CATEGORIES: `${API_BASE_URL}/order/categories`,
     ORDER_MENU: `${API_BASE_URL}/order/menu`,
     ORDER_PLACE: `${API_BASE_URL}/order/place`,
+    ORDER_QUOTE: `${API_BASE_URL}/order/quote`,
     ORDER_LIST: `${API_BASE_URL}/order/list`,
     ORDER_MY_ORDERS: `${API_BASE_URL}/order/my-orders`,
     ORDER_DETAILS: `${API_BASE_URL}/order/order`,
@@ -49,6 +51,9 @@ const API_ENDPOINTS = {
     FEEDBACK_LIST: `${API_BASE_URL}/admin/feedback/list`,
     FEEDBACK_ELIGIBLE: `${API_BASE_URL}/feedback/eligible-orders`,
     
+    // Several GETs in one round trip
+    BATCH: `${API_BASE_URL}/batch`,
+    
     // Health check
     HEALTH_CHECK: `${API_BASE_URL}/health`,
     SESSION_CHECK: `${API_BASE_URL}/session`
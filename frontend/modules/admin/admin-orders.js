@@ -13,6 +13,9 @@ const ORDER_STATUS_FLOW = {
     cancelled: { next: null, label: 'Cancelled', color: '#6B7280' }
 };
 
+// Orders ticked for a bulk status change (kept across auto-refreshes)
+const selectedOrderIds = new Set();
+
 const ORDER_STATUS_COLORS = {
     pending: '#EF4444',
     confirmed: '#F97316',
@@ -48,7 +51,8 @@ async function loadAdminOrders(status, query) {
         const filterQuery = query !== undefined ? query : (document.getElementById('filter-search')?.value || '');
         
         let url = API_ENDPOINTS.ADMIN_ORDER_LIST;
-        const params = [];
+        // Order headers only; items are loaded per order when one is opened
+        const params = ['expand='];
         if (filterStatus) params.push(`status=${encodeURIComponent(filterStatus)}`);
         if (params.length) url += '?' + params.join('&');
 
@@ -123,11 +127,18 @@ function renderOrdersTable(orders) {
     const container = document.getElementById('orders-list');
     if (!container) return;
 
+    // Forget selections for orders no longer listed
+    const listedIds = new Set(orders.map(order => order.id));
+    selectedOrderIds.forEach(id => { if (!listedIds.has(id)) selectedOrderIds.delete(id); });
+
     const rows = orders.map(order => {
         const statusColor = ORDER_STATUS_COLORS[order.status] || '#6B7280';
         const totalAmount = parseFloat(order.total_amount) || 0; // Ensure total_amount is a number
         return `
             <tr style="border-bottom: 1px solid #E5E7EB;">
+                <td style="padding: 10px; text-align: center;">
+                    <input type="checkbox" class="order-select" data-id="${order.id}" ${selectedOrderIds.has(order.id) ? 'checked' : ''}>
+                </td>
                 <td style="padding: 10px; text-align: center;">${order.order_number}</td>
                 <td style="padding: 10px; text-align: center;">${order.customer_name}</td>
                 <td style="padding: 10px; text-align: center;">${totalAmount.toFixed(2)}</td>
@@ -140,10 +151,24 @@ function renderOrdersTable(orders) {
         `;
     }).join('');
 
+    const bulkOptions = ['confirmed', 'preparing', 'ready', 'delivered', 'cancelled']
+        .map(status => `<option value="${status}">${capitalize(status)}</option>`)
+        .join('');
+
     container.innerHTML = `
+        <div style="display: flex; justify-content: flex-end; align-items: center; gap: 10px; margin-bottom: 10px;">
+            <span id="bulk-selected-count" style="font-size: 13px; color: #6B7280;">${selectedOrderIds.size} selected</span>
+            <select id="bulk-status-select" style="padding: 5px 10px; border: 1px solid #D1D5DB; border-radius: 4px;">
+                ${bulkOptions}
+            </select>
+            <button id="bulk-status-btn" style="background-color: #3B82F6; color: white; border: none; border-radius: 4px; padding: 5px 10px; cursor: pointer;">Apply to selected</button>
+        </div>
         <table style="width: 100%; border-collapse: collapse;">
             <thead>
                 <tr style="background-color: #F3F4F6;">
+                    <th style="padding: 10px; text-align: center;">
+                        <input type="checkbox" id="order-select-all" ${orders.length && selectedOrderIds.size === orders.length ? 'checked' : ''}>
+                    </th>
                     <th style="padding: 10px; text-align: center;">Order #</th>
                     <th style="padding: 10px; text-align: center;">Customer</th>
                     <th style="padding: 10px; text-align: center;">Total</th>
@@ -171,6 +196,95 @@ function renderOrdersTable(orders) {
             viewOrderDetails(orderId);
         });
     });
+
+    const updateSelectedCount = () => {
+        document.getElementById('bulk-selected-count').textContent = `${selectedOrderIds.size} selected`;
+    };
+
+    document.querySelectorAll('.order-select').forEach(box => {
+        box.addEventListener('change', (e) => {
+            const orderId = parseInt(e.target.getAttribute('data-id'));
+            if (e.target.checked) {
+                selectedOrderIds.add(orderId);
+            } else {
+                selectedOrderIds.delete(orderId);
+            }
+            updateSelectedCount();
+        });
+    });
+
+    document.getElementById('order-select-all').addEventListener('change', (e) => {
+        document.querySelectorAll('.order-select').forEach(box => {
+            box.checked = e.target.checked;
+            const orderId = parseInt(box.getAttribute('data-id'));
+            if (e.target.checked) {
+                selectedOrderIds.add(orderId);
+            } else {
+                selectedOrderIds.delete(orderId);
+            }
+        });
+        updateSelectedCount();
+    });
+
+    document.getElementById('bulk-status-btn').addEventListener('click', () => {
+        bulkUpdateOrderStatus(document.getElementById('bulk-status-select').value);
+    });
+}
+
+/**
+ * Move every selected order to one status with a single request
+ */
+async function bulkUpdateOrderStatus(newStatus) {
+    const orderIds = Array.from(selectedOrderIds);
+    if (!orderIds.length) {
+        Swal.fire({
+            icon: 'info',
+            title: 'No Orders Selected',
+            text: 'Tick the orders you want to update first.',
+            confirmButtonColor: '#3B82F6'
+        });
+        return;
+    }
+
+    const confirm = await Swal.fire({
+        title: 'Update Order Status',
+        text: `Change ${orderIds.length} order(s) to ${capitalize(newStatus)}?`,
+        icon: 'warning',
+        showCancelButton: true,
+        confirmButtonColor: '#0284C7',
+        cancelButtonColor: '#6B7280'
+    });
+
+    if (!confirm.isConfirmed) return;
+
+    try {
+        showLoading('Updating orders...');
+        const res = await apiPut(API_ENDPOINTS.ORDER_UPDATE_STATUS, { order_ids: orderIds, status: newStatus });
+        hideLoading();
+
+        const failed = (res.results || []).filter(r => !r.updated);
+        // Keep the orders that did not move ticked, so they can be retried
+        selectedOrderIds.clear();
+        failed.forEach(r => selectedOrderIds.add(r.id));
+
+        Swal.fire({
+            icon: failed.length ? 'warning' : 'success',
+            title: failed.length ? 'Some Orders Not Updated' : 'Success',
+            html: `${res.updated} order(s) updated to ${capitalize(newStatus)}` +
+                failed.map(r => `<br>#${r.id}: ${escapeHtml(r.error)}`).join(''),
+            confirmButtonColor: failed.length ? '#F59E0B' : '#10B981'
+        });
+    } catch (err) {
+        hideLoading();
+        console.error('Error updating orders:', err);
+        Swal.fire({
+            icon: 'error',
+            title: 'Error',
+            text: 'Failed to update orders: ' + err.message,
+            confirmButtonColor: '#EF4444'
+        });
+    }
+    loadAdminOrders(document.getElementById('filter-status')?.value || '');
 }
 
 /**
@@ -183,7 +297,7 @@ function createStatusOptions(orderId, currentStatus) {
         .map(status => `
             <button style="display: block; width: 100%; padding: 10px; text-align: left; border: none; background: transparent; cursor: pointer; font-size: 13px; color: #374151; transition: background-color 0.2s;" 
                     onmouseover="this.style.backgroundColor='#F3F4F6'" onmouseout="this.style.backgroundColor=''"
-                    onclick="updateOrderStatus(${orderId}, '${status}')">
+                    onclick="updateOrderStatus(${orderId}, '${status}', '${currentStatus}')">
                 <i class="fas fa-arrow-right"></i> ${capitalize(status)}
             </button>
         `)
@@ -348,8 +462,10 @@ async function viewOrderDetails(orderId) {
 
 /**
  * Update order status
+ * currentStatus is the status this screen shows; if another screen changed the
+ * order meanwhile the server answers 409 and the list is reloaded
  */
-async function updateOrderStatus(orderId, newStatus) {
+async function updateOrderStatus(orderId, newStatus, currentStatus) {
     const confirm = await Swal.fire({
         title: 'Update Order Status',
         text: `Change order status to ${capitalize(newStatus)}?`,
@@ -363,7 +479,11 @@ async function updateOrderStatus(orderId, newStatus) {
 
     try {
         showLoading('Updating order status...');
-        await apiPut(`${API_ENDPOINTS.ORDER_UPDATE_STATUS}/${orderId}`, { status: newStatus });
+        const body = { status: newStatus };
+        if (currentStatus) {
+            body.expected_status = currentStatus;
+        }
+        await apiPut(`${API_ENDPOINTS.ORDER_UPDATE_STATUS}/${orderId}`, body);
         hideLoading();
         
         Swal.fire({
@@ -384,6 +504,7 @@ async function updateOrderStatus(orderId, newStatus) {
             text: 'Failed to update order status: ' + err.message,
             confirmButtonColor: '#EF4444'
         });
+        loadAdminOrders(document.getElementById('filter-status')?.value || '');
     }
 }
 
@@ -403,6 +524,7 @@ function handleSearch(query) {
 window.loadAdminOrders = loadAdminOrders;
 window.viewOrderDetails = viewOrderDetails;
 window.updateOrderStatus = updateOrderStatus;
+window.bulkUpdateOrderStatus = bulkUpdateOrderStatus;
 window.handleSearch = handleSearch;
 window.toggleStatusMenu = toggleStatusMenu;
 window.resetOrdersFilter = resetOrdersFilter;
@@ -482,7 +604,7 @@ function showUpdateStatusModal(orderId, currentStatus) {
 
     document.getElementById('update-btn').addEventListener('click', async () => {
         const newStatus = document.getElementById('status-select').value;
-        await updateOrderStatus(orderId, newStatus);
+        await updateOrderStatus(orderId, newStatus, currentStatus);
         document.getElementById('update-status-modal').remove();
     });
 }
@@ -288,6 +288,39 @@ function showCheckout() {
 
     checkoutTotal.textContent = `$${totalPrice.toFixed(2)}`;
     modal.classList.add('show');
+
+    // Replace the local estimate with the server's quote (tax, delivery fee, minimum order)
+    loadCheckoutQuote();
+}
+
+async function loadCheckoutQuote() {
+    const checkoutItems = document.getElementById('checkout-items');
+    const checkoutTotal = document.getElementById('checkout-total');
+    try {
+        const quote = await apiPost(API_ENDPOINTS.ORDER_QUOTE, {
+            items: cart.map(item => ({ menu_item_id: item.id, quantity: item.quantity }))
+        });
+        const row = (label, amount) => `
+            <div style="display: flex; justify-content: space-between; margin-bottom: 10px; color: #666;">
+                <span>${label}</span>
+                <span>$${amount.toFixed(2)}</span>
+            </div>
+        `;
+        checkoutItems.innerHTML = quote.items.map(line => `
+            <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                <span>${line.name} x ${line.quantity}</span>
+                <span>$${line.subtotal.toFixed(2)}</span>
+            </div>
+        `).join('') + '<hr style="margin: 10px 0;">'
+            + row('Subtotal', quote.subtotal)
+            + row(`Tax (${Math.round(quote.tax_rate * 100)}%)`, quote.tax)
+            + row('Delivery Fee', quote.delivery_fee)
+            + (quote.meets_minimum ? '' : `<p style="color: #dc2626; margin-top: 10px;">Minimum order is $${quote.min_order_amount.toFixed(2)} before tax and delivery.</p>`);
+        checkoutTotal.textContent = `$${quote.total.toFixed(2)}`;
+    } catch (error) {
+        // Keep the local estimate; placing the order reports the real problem
+        console.error('Failed to load quote:', error);
+    }
 }
 
 function closeCheckout() {
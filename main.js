@@ -1,6 +1,10 @@
 const { app, BrowserWindow, session } = require('electron');
 const path = require('path');
 const { spawn } = require('child_process');
+const http = require('http');
+
+const BACKEND_URL = 'http://127.0.0.1:5000/api/health/live';
+const BACKEND_START_TIMEOUT_MS = 15000;
 
 let mainWindow;
 let pythonProcess;
@@ -49,7 +53,8 @@ function createWindow() {
 
 function startPythonBackend() {
   // Start Python Flask server
-  pythonProcess = spawn('python', ['backend/app.py']);
+  // --no-reload: the dev reloader would import and start the app twice
+  pythonProcess = spawn('python', ['backend/app.py', '--no-reload']);
 
   pythonProcess.stdout.on('data', (data) => {
     console.log(`Python: ${data}`);
@@ -64,10 +69,30 @@ function startPythonBackend() {
   });
 }
 
+function waitForBackend(callback) {
+  // Poll until the server answers instead of sleeping a fixed time
+  const started = Date.now();
+  const poll = () => {
+    const req = http.get(BACKEND_URL, (res) => {
+      res.resume();
+      console.log(`Backend ready in ${Date.now() - started} ms`);
+      callback();
+    });
+    req.on('error', () => {
+      if (Date.now() - started > BACKEND_START_TIMEOUT_MS) {
+        console.error('Backend did not start in time, opening window anyway');
+        callback();
+      } else {
+        setTimeout(poll, 100);
+      }
+    });
+  };
+  poll();
+}
+
 app.on('ready', () => {
   startPythonBackend();
-  // Wait a bit for Python server to start
-  setTimeout(createWindow, 2000);
+  waitForBackend(createWindow);
 });
 
 app.on('window-all-closed', function () {
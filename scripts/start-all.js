@@ -32,14 +32,28 @@ function findPython() {
 
 const python = findPython();
 const backendScript = path.join(ROOT, 'backend', 'app.py');
+const backendDir = path.join(ROOT, 'backend');
+
+// BACKEND_MODE=production serves through gunicorn (multi-process, POSIX only)
+const productionBackend = process.env.BACKEND_MODE === 'production' && process.platform !== 'win32';
 
 // Spawn backend
-console.log('Starting backend using python:', python, backendScript);
-const backend = spawn(python, [backendScript], {
-    cwd: ROOT,
-    stdio: ['ignore', 'pipe', 'pipe'],
-    windowsHide: false
-});
+let backend;
+if (productionBackend) {
+    console.log('Starting backend using gunicorn:', python, '-m gunicorn -c gunicorn.conf.py wsgi:app');
+    backend = spawn(python, ['-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'], {
+        cwd: backendDir,
+        stdio: ['ignore', 'pipe', 'pipe'],
+        windowsHide: false
+    });
+} else {
+    console.log('Starting backend using python:', python, backendScript);
+    backend = spawn(python, [backendScript, '--no-reload'], {
+        cwd: ROOT,
+        stdio: ['ignore', 'pipe', 'pipe'],
+        windowsHide: false
+    });
+}
 
 backend.stdout.on('data', (data) => {
     process.stdout.write(`[backend] ${data}`);